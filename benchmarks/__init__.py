@@ -0,0 +1,6 @@
+"""
+Benchmarks of bs_api.
+
+Run all of them with `python -m benchmarks` or one of modules, e.g. `python -m benchmarks.models`.
+They need no API token: `benchmarks.mock_api` serves recorded-like payloads on localhost.
+"""
@@ -0,0 +1,22 @@
+"""
+Run all benchmarks: parse time and memory of models, then load of `ClientBS` methods against local mock API.
+
+Run: `python -m benchmarks` (arguments are passed to `benchmarks.client`, e.g. `--requests 5000 --json base.json`)
+"""
+
+import sys
+
+from . import client, memory, models
+
+
+def main() -> None:
+    print("== parse time of models ==")
+    models.main()
+    print("\n== memory of models ==")
+    memory.main()
+    print("\n== ClientBS against mock API ==")
+    client.main(sys.argv[1:])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Load of `ClientBS` methods against local mock API: requests per second, p50/p99 latency of calls,
+retries of throttled requests and bytes per request. Latency of a call includes decoding and models.
+
+Run: `python -m benchmarks.client --requests 2000 --concurrency 50 --latency 0.02`
+Throttling: `python -m benchmarks.client --rate 200 --client-rate 190 --tokens 2`
+"""
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import argparse
+import asyncio
+import json
+import time
+
+from bs_api import ClientBS, COUNTRY_CODES
+from bs_api.metrics import MetricsCollector
+
+from . import mock_api, payloads
+
+Call = Callable[[ClientBS, int, str], Awaitable[Any]]
+
+CASES: Dict[str, Call] = {
+    "get_player": lambda client, index, tag: client.get_player(tag),
+    "get_player raw": lambda client, index, tag: client.get_player(tag, raw="bytes"),
+    "get_player_battlelog": lambda client, index, tag: client.get_player_battlelog(tag),
+    "get_player_battlelog lazy": lambda client, index, tag: client.get_player_battlelog(tag, lazy=True),
+    "get_club": lambda client, index, tag: client.get_club(tag),
+    "get_club_members": lambda client, index, tag: client.get_club_members(tag),
+    "get_ranking_players": lambda client, index, tag: client.get_ranking_players(
+        COUNTRY_CODES[index % len(COUNTRY_CODES)]),
+    "get_ranking_clubs": lambda client, index, tag: client.get_ranking_clubs(
+        COUNTRY_CODES[index % len(COUNTRY_CODES)]),
+}
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def load(
+    port: int, call: Call, requests: int, concurrency: int, tokens: int = 1,
+    requests_per_second: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Send `requests` calls with `concurrency` workers and collect results.
+
+    Return:
+        `dict`: rps, p50 and p99 latency in ms, retries, errors and bytes per request.
+    """
+    metrics = MetricsCollector()
+    tags = payloads.player_tags(requests)
+    latencies: List[float] = []
+    errors = 0
+
+    async with ClientBS(
+        [f"benchmark-{index}" for index in range(tokens)] if tokens > 1 else "benchmark",
+        limit=concurrency, base_url=mock_api.base_url(port), coalesce=False, max_retries=10, hooks=[metrics],
+        requests_per_second=requests_per_second,
+    ) as client:
+        position = iter(range(requests))
+
+        async def worker() -> None:
+            nonlocal errors
+            for index in position:
+                started = time.perf_counter()
+                try:
+                    await call(client, index, tags[index])
+                except Exception:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "retries": sum(metrics.retries.values()),
+        "errors": errors,
+        "kib_per_request": sum(metrics.bytes_received.values()) / 1024 / max(1, requests),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=0, help="port of mock server (0 - free port)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds of mock server before response")
+    parser.add_argument("--rate", type=float, default=None, help="requests per second of one token on mock server")
+    parser.add_argument("--tokens", type=int, default=1)
+    parser.add_argument("--client-rate", type=float, default=None, help="requests_per_second of one token in client")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="run only these methods")
+    parser.add_argument("--json", metavar="PATH", help="save results, e.g. to compare runs")
+    arguments = parser.parse_args(argv)
+
+    server = mock_api.start_in_process(arguments.port, arguments.latency, arguments.rate)
+    results = {}
+    try:
+        print(f"{arguments.requests} requests, concurrency {arguments.concurrency}, "
+              f"latency {arguments.latency * 1000:.0f} ms, rate {arguments.rate or 'unlimited'}, {arguments.tokens} token(s)")
+        print(f"{'method':<28}{'req/s':>9}{'p50, ms':>10}{'p99, ms':>10}{'retries':>9}{'errors':>8}{'KiB/req':>9}")
+        for name in arguments.case or CASES:
+            result = results[name] = asyncio.run(
+                load(server.port, CASES[name], arguments.requests, arguments.concurrency, arguments.tokens,
+                     arguments.client_rate)
+            )
+            print(f"{name:<28}{result['rps']:>9.0f}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}"
+                  f"{result['retries']:>9}{result['errors']:>8}{result['kib_per_request']:>9.1f}")
+    finally:
+        server.terminate()
+
+    if arguments.json:
+        with open(arguments.json, "w") as file:
+            json.dump(results, file, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
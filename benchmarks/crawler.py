@@ -0,0 +1,48 @@
+"""
+Throughput of `Crawler` against local mock API: parse in the event loop against process pools of growing size.
+
+Run: `python -m benchmarks.crawler --tags 5000 --kind battlelog`
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from bs_api import ClientBS
+from bs_api.crawler import Crawler
+
+from . import mock_api, payloads
+
+
+async def crawl(port: int, kind: str, parse: str, tags: int, processes: int) -> float:
+    async with ClientBS("benchmark", limit=200, base_url=mock_api.base_url(port), coalesce=False) as client:
+        async with Crawler(client, kind, parse, processes=processes, concurrency=200) as crawler:
+            started = time.perf_counter()
+            count = 0
+            async for _ in crawler.crawl(payloads.player_tags(tags)):
+                count += 1
+            return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=0, help="port of mock server (0 - free port)")
+    parser.add_argument("--tags", type=int, default=5000)
+    parser.add_argument("--kind", default="battlelog", choices=Crawler.kinds)
+    parser.add_argument("--parse", default="models", choices=("json", "models", "columns"))
+    arguments = parser.parse_args()
+
+    server = mock_api.start_in_process(arguments.port)
+    try:
+        print(f"{arguments.kind}, {arguments.parse}, {arguments.tags} tags")
+        print(f"{'processes':<12}{'tags/s':>10}")
+        for processes in sorted({0, 1, 2, 4, os.cpu_count() or 1}):
+            rate = asyncio.run(crawl(server.port, arguments.kind, arguments.parse, arguments.tags, processes))
+            print(f"{processes or 'event loop':<12}{rate:>10.0f}")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
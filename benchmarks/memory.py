@@ -0,0 +1,67 @@
+"""
+Memory of models: `__slots__` models with one shared client reference
+against `__dict__` objects which keep a reference to one shared token string, as the old models did.
+
+Run: `python -m benchmarks.memory`
+"""
+
+import tracemalloc
+import gc
+
+from bs_api.classes import Battle, Brawler, Member, RankedPlayer
+from bs_api.http import HTTPClient
+
+from . import payloads
+from .models import LegacyObject, legacy_battlelog, legacy_load
+
+COUNT = 10000
+
+
+def legacy_model(data: dict, token: str) -> LegacyObject:
+    obj = LegacyObject()
+    obj._token = token
+    legacy_load(obj, data)
+    return obj
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def main() -> None:
+    token = "x" * 180
+    http = HTTPClient(token)
+
+    rankings = [dict(item) for _ in range(COUNT // 200) for item in payloads.ranking_players()["items"]]
+    members = [payloads.member(index % 30) for index in range(COUNT)]
+    battlelogs = [payloads.battlelog(seed=index) for index in range(COUNT // 25)]
+    brawlers = [item for _ in range(COUNT // 80 + 1) for item in payloads.player()["brawlers"]][:COUNT]
+
+    cases = [
+        ("RankedPlayer", lambda: [legacy_model(d, token) for d in rankings],
+         lambda: [RankedPlayer(d, http) for d in rankings]),
+        ("Member", lambda: [legacy_model(d, token) for d in members],
+         lambda: [Member(d, http) for d in members]),
+        ("Battle", lambda: [legacy_battlelog(data) for data in battlelogs],
+         lambda: [Battle(item, http) for data in battlelogs for item in data["items"]]),
+        ("Battle, lazy", lambda: [legacy_battlelog(data) for data in battlelogs],
+         lambda: [Battle(item, http, lazy=True) for data in battlelogs for item in data["items"]]),
+        ("Brawler", lambda: [legacy_model(d, token) for d in brawlers],
+         lambda: [Brawler(d) for d in brawlers]),
+    ]
+    print(f"{'model':<14}{'legacy, KiB':>13}{'slots, KiB':>12}{'saved':>8}   per {COUNT} objects")
+    for name, legacy, current in cases:
+        legacy_size = measure(legacy)
+        current_size = measure(current)
+        print(f"{name:<14}{legacy_size / 1024:>13.0f}{current_size / 1024:>12.0f}{1 - current_size / legacy_size:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+Local mock of Brawl Stars API for benchmarks, it serves realistic payloads with configurable latency and throttling.
+
+Run: `python -m benchmarks.mock_api --port 8765 --latency 0.05 --rate 500`
+"""
+
+from contextlib import asynccontextmanager
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+import math
+import time
+import zlib
+
+from aiohttp import web
+
+from . import payloads
+
+VARIANTS = 32
+
+
+def _bodies(factory, count: int = VARIANTS) -> List[bytes]:
+    return [json.dumps(factory(index)).encode() for index in range(count)]
+
+
+class MockAPI:
+    """
+    Mock of API endpoints, bodies are encoded once, so the server spends little CPU per request.
+
+    Args:
+        latency (:obj:`float`): Seconds to wait before every response.
+        rate (:obj:`float`): Requests per second allowed for one token, others get 429 with `Retry-After`
+            (`None` - no throttling).
+        burst (:obj:`int`): Requests which one token can send at once (`None` - one second of `rate`).
+    """
+
+    def __init__(self, latency: float = 0.0, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+        self.latency = latency
+        self.rate = rate
+        self.burst = burst or (max(1, int(rate)) if rate else 0)
+        self.url: Optional[str] = None
+        self.requests = 0
+        self.throttled = 0
+        # Token bucket of every API token: (available requests, time of last update).
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self.bodies: Dict[str, List[bytes]] = {
+            "player": _bodies(lambda index: payloads.player(f"#P{index}", index)),
+            "battlelog": _bodies(lambda index: payloads.battlelog(f"#P{index}", index)),
+            "club": _bodies(lambda index: payloads.club(f"#C{index}")),
+            "members": _bodies(lambda index: {"items": payloads.club(f"#C{index}")["members"], "paging": {"cursors": {}}}),
+            "ranking_players": _bodies(lambda index: payloads.ranking_players(), 1),
+            "ranking_clubs": _bodies(lambda index: payloads.ranking_clubs(), 1),
+            "brawlers": _bodies(lambda index: payloads.brawlers(), 1),
+        }
+
+    def _route(self, path: str) -> Optional[str]:
+        parts = path.strip("/").split("/")
+        if parts[0] == "players":
+            return "battlelog" if len(parts) == 3 else "player"
+        if parts[0] == "clubs":
+            return "members" if len(parts) == 3 else "club"
+        if parts[0] == "rankings":
+            return "ranking_clubs" if parts[2] == "clubs" else "ranking_players"
+        if parts[0] == "brawlers":
+            return "brawlers"
+        return None
+
+    def _retry_after(self, token: str) -> float:
+        # Take one request from the bucket of token, return seconds to wait when it is empty.
+        now = time.monotonic()
+        available, updated = self._buckets.get(token, (self.burst, now))
+        available = min(self.burst, available + (now - updated) * self.rate)
+        if available >= 1:
+            self._buckets[token] = (available - 1, now)
+            return 0.0
+        self._buckets[token] = (available, now)
+        return (1 - available) / self.rate
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.rate:
+            delay = self._retry_after(request.headers.get("Authorization", ""))
+            if delay:
+                self.throttled += 1
+                return web.json_response(
+                    {"reason": "requestThrottled", "message": "Request was throttled, because amount of requests "
+                     "was above the threshold defined for the used API token."},
+                    status=429, headers={"Retry-After": str(math.ceil(delay * 1000) / 1000)},
+                )
+        path = request.match_info["path"]
+        route = self._route(path)
+        if route is None:
+            return web.json_response({"reason": "notFound"}, status=404)
+        bodies = self.bodies[route]
+        body = bodies[zlib.crc32(path.encode()) % len(bodies)]
+        return web.Response(body=body, content_type="application/json")
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/v1/{path:.*}", self.handle)
+        return app
+
+
+async def serve(
+    port: int = 8765, latency: float = 0.0, rate: Optional[float] = None, started: Optional[Connection] = None
+) -> None:
+    runner = web.AppRunner(MockAPI(latency, rate).application(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    if started is not None:
+        # Port 0 takes a free port, the real one is sent to the parent process.
+        started.send(runner.addresses[0][1])
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+@asynccontextmanager
+async def running(
+    latency: float = 0.0, rate: Optional[float] = None, port: int = 0, api: Optional[MockAPI] = None
+) -> AsyncIterator[MockAPI]:
+    """
+    Run mock server in the current event loop, e.g. in tests. Port 0 takes a free port,
+    url of the server is in `api.url`. Pass `api` to serve a subclass with changed `handle`.
+    """
+    api = api if api is not None else MockAPI(latency, rate)
+    runner = web.AppRunner(api.application(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    api.url = base_url(runner.addresses[0][1])
+    try:
+        yield api
+    finally:
+        await runner.cleanup()
+
+
+def _run(port: int, latency: float, rate: Optional[float], started: Connection) -> None:
+    asyncio.run(serve(port, latency, rate, started))
+
+
+def start_in_process(
+    port: int = 0, latency: float = 0.0, rate: Optional[float] = None, timeout: float = 30.0
+) -> Process:
+    """
+    Start mock server in another process, so it does not share CPU of the measured event loop.
+    Port 0 takes a free port, the port of the server is in `process.port`.
+    Raises `RuntimeError` when the server did not start in `timeout` seconds, e.g. the port is taken.
+    """
+    receiver, sender = Pipe(duplex=False)
+    process = Process(target=_run, args=(port, latency, rate, sender), daemon=True)
+    process.start()
+    deadline = time.monotonic() + timeout
+    while not receiver.poll(0.05):
+        if not process.is_alive() or time.monotonic() > deadline:
+            process.terminate()
+            raise RuntimeError(f"Mock API did not start on port {port}.")
+    process.port = receiver.recv()
+    return process
+
+
+def base_url(port: int = 8765) -> str:
+    return f"http://127.0.0.1:{port}/v1/"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate", type=float, default=None, help="requests per second of one token")
+    arguments = parser.parse_args()
+    asyncio.run(serve(arguments.port, arguments.latency, arguments.rate))
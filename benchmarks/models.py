@@ -0,0 +1,114 @@
+"""
+Parse time of models: precomputed field table against per-key `re.sub` + `setattr`.
+
+Run: `python -m benchmarks.models`
+"""
+
+from datetime import datetime
+from timeit import repeat
+import json
+import re
+
+from bs_api.classes import Battle, Club, Player, RankedPlayer, parse_battle_time
+from bs_api.http import default_json_loads
+
+from . import payloads
+
+
+def legacy_load(obj, data: dict) -> None:
+    # Mapping which was used by every model before precomputed `_keys` tables.
+    for value in data:
+        setattr(obj, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), data[value])
+
+
+class LegacyObject:
+    pass
+
+
+def legacy_player(data: dict) -> LegacyObject:
+    player = LegacyObject()
+    legacy_load(player, data)
+    brawlers = []
+    for brawler_data in data["brawlers"]:
+        brawler = LegacyObject()
+        legacy_load(brawler, brawler_data)
+        brawlers.append(brawler)
+    player.brawlers = brawlers
+    return player
+
+
+def legacy_club(data: dict) -> LegacyObject:
+    club = LegacyObject()
+    legacy_load(club, data)
+    club.members = legacy_list(data["members"])
+    return club
+
+
+def legacy_list(items: list) -> list:
+    output = []
+    for item in items:
+        obj = LegacyObject()
+        legacy_load(obj, item)
+        output.append(obj)
+    return output
+
+
+def legacy_battlelog(data: dict) -> list:
+    output = []
+    for battle_data in data["items"]:
+        battle = LegacyObject()
+        legacy_load(battle, battle_data["event"])
+        legacy_load(battle, battle_data["battle"])
+        time = battle_data["battleTime"]
+        real_time = time[0:4] + "-" + time[4:6] + "-" + time[6:11] + ":" + time[11:13] + ":" + time[13:15]
+        battle.battle_time = datetime.strptime(real_time, "%Y-%m-%dT%H:%M:%S")
+        output.append(battle)
+    return output
+
+
+def best(func, number: int) -> float:
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    player = payloads.player()
+    battlelog = payloads.battlelog()
+    club = payloads.club()
+    ranking = payloads.ranking_players()["items"]
+    battlelog_body = json.dumps(battlelog).encode()
+    battle_time = battlelog["items"][0]["battleTime"]
+
+    def legacy_time():
+        time = battle_time
+        real_time = time[0:4] + "-" + time[4:6] + "-" + time[6:11] + ":" + time[11:13] + ":" + time[13:15]
+        return datetime.strptime(real_time, "%Y-%m-%dT%H:%M:%S")
+
+    cases = [
+        ("Player (%d brawlers)" % len(player["brawlers"]), lambda: legacy_player(player), lambda: Player(player, None)),
+        ("battlelog (25 battles)", lambda: legacy_battlelog(battlelog),
+         lambda: [Battle(item, None) for item in battlelog["items"]]),
+        ("battlelog, lazy", lambda: legacy_battlelog(battlelog),
+         lambda: [Battle(item, None, lazy=True) for item in battlelog["items"]]),
+        ("Club (%d members)" % len(club["members"]), lambda: legacy_club(club), lambda: Club(club, None)),
+        ("ranking (%d players)" % len(ranking), lambda: legacy_list(ranking),
+         lambda: [RankedPlayer(item, None) for item in ranking]),
+        ("battle_time", legacy_time, lambda: parse_battle_time(battle_time)),
+    ]
+    print(f"{'payload':<26}{'legacy, us':>12}{'current, us':>13}{'speed-up':>10}")
+    for name, legacy, current in cases:
+        legacy_seconds = best(legacy, 200)
+        current_seconds = best(current, 200)
+        print(f"{name:<26}{legacy_seconds * 1e6:>12.1f}{current_seconds * 1e6:>13.1f}{legacy_seconds / current_seconds:>9.1f}x")
+
+    json_loads = default_json_loads()
+    if json_loads is not json.loads:
+        print(f"{'battlelog decode':<26}{best(lambda: json.loads(battlelog_body), 200) * 1e6:>12.1f}"
+              f"{best(lambda: json_loads(battlelog_body), 200) * 1e6:>13.1f}   ({json_loads.__module__})")
+
+    decode = best(lambda: json.loads(battlelog_body), 200)
+    lazy = best(lambda: [Battle(item, None, lazy=True) for item in json.loads(battlelog_body)["items"]], 200)
+    print(f"\nbattlelog json.loads {decode * 1e6:.1f} us, json.loads + lazy battles {lazy * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Realistic payloads of Brawl Stars API endpoints for benchmarks.
+"""
+
+from typing import List
+import random
+
+BRAWLER_NAMES = [
+    "SHELLY", "COLT", "BULL", "BROCK", "RICO", "SPIKE", "BARLEY", "JESSIE", "NITA", "DYNAMIKE",
+    "EL PRIMO", "MORTIS", "CROW", "POCO", "BO", "PIPER", "PAM", "TARA", "DARRYL", "PENNY",
+    "FRANK", "GENE", "TICK", "LEON", "ROSA", "CARL", "BIBI", "8-BIT", "SANDY", "BEA",
+    "EMZ", "MR. P", "MAX", "JACKY", "GALE", "NANI", "SPROUT", "SURGE", "COLETTE", "AMBER",
+    "LOU", "BYRON", "EDGAR", "RUFFS", "STU", "BELLE", "SQUEAK", "GROM", "BUZZ", "GRIFF",
+    "ASH", "MEG", "LOLA", "FANG", "EVE", "JANET", "BONNIE", "OTIS", "SAM", "GUS",
+    "BUSTER", "CHESTER", "GRAY", "MANDY", "R-T", "WILLOW", "MAISIE", "HANK", "CORDELIUS", "DOUG",
+    "PEARL", "CHUCK", "CHARLIE", "MICO", "KIT", "LARRY & LAWRIE", "MELODIE", "ANGELO", "DRACO", "LILY",
+]
+MODES = ["gemGrab", "brawlBall", "heist", "bounty", "knockout", "hotZone", "soloShowdown", "duoShowdown"]
+MAPS = ["Hard Rock Mine", "Pinball Dreams", "Safe Zone", "Shooting Star", "Belle's Rock", "Dueling Beetles"]
+
+
+def brawler_id(index: int) -> int:
+    return 16000000 + index
+
+
+def brawlers() -> dict:
+    """Response of `brawlers` endpoint."""
+    return {
+        "items": [
+            {
+                "id": brawler_id(index),
+                "name": name,
+                "starPowers": [{"id": 23000000 + index * 2 + k, "name": f"{name} STAR {k}"} for k in range(2)],
+                "gadgets": [{"id": 23100000 + index * 2 + k, "name": f"{name} GADGET {k}"} for k in range(2)],
+            }
+            for index, name in enumerate(BRAWLER_NAMES)
+        ],
+        "paging": {"cursors": {}},
+    }
+
+
+def player(tag: str = "#8VJVG4PVC", seed: int = 0) -> dict:
+    """Response of `players/{tag}` endpoint with all brawlers unlocked."""
+    rnd = random.Random(seed)
+    return {
+        "tag": tag,
+        "name": f"Player {seed}",
+        "nameColor": "0xffffffff",
+        "icon": {"id": 28000000 + seed % 100},
+        "trophies": rnd.randint(10000, 90000),
+        "highestTrophies": 95000,
+        "expLevel": 250,
+        "expPoints": 180000,
+        "isQualifiedFromChampionshipChallenge": False,
+        "3vs3Victories": rnd.randint(1000, 50000),
+        "soloVictories": rnd.randint(100, 5000),
+        "duoVictories": rnd.randint(100, 5000),
+        "bestRoboRumbleTime": 10,
+        "bestTimeAsBigBrawler": 0,
+        "club": {"tag": "#2YPY9LVV9", "name": "Club"},
+        "brawlers": [
+            {
+                "id": brawler_id(index),
+                "name": name,
+                "power": rnd.randint(1, 11),
+                "rank": rnd.randint(1, 35),
+                "trophies": rnd.randint(0, 1250),
+                "highestTrophies": 1250,
+                "gears": [{"id": 62000000 + k, "name": "GEAR", "level": 3} for k in range(2)],
+                "starPowers": [{"id": 23000000 + index * 2, "name": f"{name} STAR 0"}],
+                "gadgets": [{"id": 23100000 + index * 2, "name": f"{name} GADGET 0"}],
+            }
+            for index, name in enumerate(BRAWLER_NAMES)
+        ],
+    }
+
+
+def battler(tag: str, rnd: random.Random) -> dict:
+    index = rnd.randrange(len(BRAWLER_NAMES))
+    return {
+        "tag": tag,
+        "name": f"Battler {tag}",
+        "brawler": {"id": brawler_id(index), "name": BRAWLER_NAMES[index], "power": 11, "trophies": rnd.randint(0, 1250)},
+    }
+
+
+def battle(index: int, tag: str = "#8VJVG4PVC", rnd: random.Random = None) -> dict:
+    """One item of `players/{tag}/battlelog` endpoint (3vs3 battle)."""
+    rnd = rnd or random.Random(index)
+    minute = 59 - index * 2 % 60
+    teams = [[battler(tag, rnd)] + [battler(f"#T{index}{k}", rnd) for k in range(2)],
+             [battler(f"#O{index}{k}", rnd) for k in range(3)]]
+    mode = rnd.choice(MODES[:6])
+    return {
+        "battleTime": f"20241105T{23 - index // 30:02d}{minute:02d}{index % 60:02d}.000Z",
+        "event": {"id": 15000000 + rnd.randrange(100), "mode": mode, "map": rnd.choice(MAPS)},
+        "battle": {
+            "mode": mode,
+            "type": "ranked",
+            "result": rnd.choice(["victory", "defeat", "draw"]),
+            "duration": rnd.randint(60, 180),
+            "trophyChange": rnd.randint(-8, 8),
+            "starPlayer": teams[0][0],
+            "teams": teams,
+        },
+    }
+
+
+def battlelog(tag: str = "#8VJVG4PVC", seed: int = 0, size: int = 25) -> dict:
+    """Response of `players/{tag}/battlelog` endpoint."""
+    rnd = random.Random(seed)
+    return {"items": [battle(index, tag, rnd) for index in range(size)], "paging": {"cursors": {}}}
+
+
+def member(index: int) -> dict:
+    return {
+        "tag": f"#M{index:08d}",
+        "name": f"Member {index}",
+        "nameColor": "0xffffffff",
+        "role": "member" if index else "president",
+        "trophies": 80000 - index * 100,
+        "icon": {"id": 28000000 + index},
+    }
+
+
+def club(tag: str = "#2YPY9LVV9", size: int = 30) -> dict:
+    """Response of `clubs/{tag}` endpoint with full roster."""
+    return {
+        "tag": tag,
+        "name": "Club",
+        "description": "Benchmark club",
+        "type": "inviteOnly",
+        "badgeId": 8000000,
+        "requiredTrophies": 60000,
+        "trophies": 2000000,
+        "members": [member(index) for index in range(size)],
+    }
+
+
+def ranking_players(countrycode: str = "global", size: int = 200) -> dict:
+    """Response of `rankings/{countrycode}/players` endpoint."""
+    return {
+        "items": [
+            {
+                "tag": f"#R{index:08d}",
+                "name": f"Ranked {index}",
+                "nameColor": "0xffffffff",
+                "icon": {"id": 28000000 + index % 100},
+                "trophies": 150000 - index * 50,
+                "rank": index + 1,
+                "club": {"name": f"Club {index % 20}"},
+            }
+            for index in range(size)
+        ],
+        "paging": {"cursors": {}},
+    }
+
+
+def ranking_clubs(countrycode: str = "global", size: int = 200) -> dict:
+    """Response of `rankings/{countrycode}/clubs` endpoint."""
+    return {
+        "items": [
+            {
+                "tag": f"#C{index:08d}",
+                "name": f"Club {index}",
+                "badgeId": 8000000 + index % 50,
+                "trophies": 3000000 - index * 1000,
+                "rank": index + 1,
+                "memberCount": 30,
+            }
+            for index in range(size)
+        ],
+        "paging": {"cursors": {}},
+    }
+
+
+def player_tags(count: int) -> List[str]:
+    return [f"#P{index:08d}" for index in range(count)]
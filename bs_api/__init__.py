@@ -6,6 +6,7 @@ Build amazing experiences with access to accurate and secure game data.
 """
 
 from .public import *
+from .blocking import BlockingClientBS
 
 __title__ = 'bs_api'
 __author__ = 'exeyarikus'
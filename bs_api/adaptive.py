@@ -0,0 +1,61 @@
+class AdaptiveInterval:
+    """
+    Poll interval which adapts to observed rate of events (new battles, changes of object),
+    so active objects are polled more often and inactive ones less. Used by `BattlelogSync` and `PollingScheduler`.
+
+    Args:
+        min_interval (:obj:`float`): Minimum seconds between polls.
+        max_interval (:obj:`float`): Maximum seconds between polls.
+        target (:obj:`float`): Number of events one poll should find.
+        smoothing (:obj:`float`): Weight of the newest estimate from 0 to 1, the rest is kept from current interval.
+    """
+
+    __slots__ = ("min_interval", "max_interval", "target", "smoothing")
+
+    def __init__(
+        self, min_interval: float, max_interval: float, target: float = 1.0, smoothing: float = 0.5
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval.")
+        if target <= 0 or not 0 < smoothing <= 1:
+            raise ValueError("target must be greater than 0 and smoothing must be from 0 to 1.")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target = target
+        self.smoothing = smoothing
+
+    def clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def next(self, interval: float, events: int, elapsed: float) -> float:
+        """
+        Get interval after a poll.
+
+        Args:
+            interval (:obj:`float`): Current interval.
+            events (:obj:`int`): Number of events found by the poll.
+            elapsed (:obj:`float`): Seconds since the previous poll.
+
+        Return:
+            `float`: Next interval.
+        """
+        if events <= 0:
+            estimate = interval * 2
+        else:
+            # Events per second since the previous poll, next poll should find about `target` of them.
+            estimate = self.target * max(elapsed, 0.0) / events
+        return self.clamp((1 - self.smoothing) * interval + self.smoothing * estimate)
+
+    def backoff(self, interval: float, failures: int) -> float:
+        """
+        Get seconds until the next poll after failed polls in a row, it doubles with every failure.
+
+        Args:
+            interval (:obj:`float`): Current interval.
+            failures (:obj:`int`): Number of failed polls in a row.
+
+        Return:
+            `float`: Seconds until the next poll.
+        """
+        return self.clamp(interval * 2 ** min(max(failures - 1, 0), 16))
@@ -0,0 +1,241 @@
+from typing import Any, Dict, Sequence, Union
+
+from .columns import Columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Arrays = Dict[str, Any]
+
+# Place in showdown which counts as win.
+SHOWDOWN_WIN_RANK: Dict[str, int] = {"soloShowdown": 4, "duoShowdown": 2, "trioShowdown": 2}
+
+
+def _arrays(table: Union[Columns, Arrays]) -> Arrays:
+    if numpy is None:
+        raise ImportError("numpy is required for analytics, install it with `pip install numpy`.")
+    if isinstance(table, Columns):
+        return table.to_numpy()
+    return table
+
+
+def _sortable(values):
+    # Object columns (strings with missing values) can not be sorted by numpy, missing values become "".
+    if values.dtype == object:
+        return numpy.array(["" if value is None else str(value) for value in values])
+    return values
+
+
+def _group(arrays: Arrays, by: Union[str, Sequence[str]]):
+    # Returns keys of groups, group index of every row and number of groups.
+    by = (by,) if isinstance(by, str) else tuple(by)
+    uniques, codes = [], []
+    for name in by:
+        unique, inverse = numpy.unique(_sortable(arrays[name]), return_inverse=True)
+        uniques.append(unique)
+        codes.append(inverse.reshape(-1))
+    if len(by) == 1:
+        return {by[0]: uniques[0]}, codes[0], len(uniques[0])
+
+    keys, inverse = numpy.unique(numpy.stack(codes, axis=1), axis=0, return_inverse=True)
+    groups = {name: uniques[index][keys[:, index]] for index, name in enumerate(by)}
+    return groups, inverse.reshape(-1), len(keys)
+
+
+def wins(table: Union[Columns, Arrays]):
+    """
+    Get mask of won battles: `result` is "victory" or place in showdown is high enough.
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table with `result`, `mode` and `rank`.
+
+    Return:
+        `numpy.ndarray`: Boolean mask of won battles.
+    """
+    arrays = _arrays(table)
+    won = numpy.asarray(arrays["result"] == "victory", dtype=bool)
+    if "rank" in arrays and "mode" in arrays:
+        rank = numpy.asarray(arrays["rank"], dtype="float64")
+        for mode, place in SHOWDOWN_WIN_RANK.items():
+            won |= (arrays["mode"] == mode) & (rank <= place)
+    return won
+
+
+def win_rate(table: Union[Columns, Arrays], by: Union[str, Sequence[str]] = "mode") -> Arrays:
+    """
+    Get win rate of battles grouped by columns, e.g. "mode", "map" or ("mode", "brawler_id").
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table, e.g. from `battlelog_to_columns`.
+        by (:obj:`Union[str, Sequence[str]]`): Column or columns to group by.
+
+    Return:
+        `Dict[str, numpy.ndarray]`: Key columns, `battles`, `wins` and `win_rate` of every group.
+    """
+    arrays = _arrays(table)
+    groups, inverse, count = _group(arrays, by)
+    battles = numpy.bincount(inverse, minlength=count)
+    won = numpy.bincount(inverse, weights=wins(arrays), minlength=count).astype("int64")
+    return {**groups, "battles": battles, "wins": won, "win_rate": won / numpy.maximum(battles, 1)}
+
+
+def trophy_change_stats(table: Union[Columns, Arrays], by: Union[str, Sequence[str]] = "mode") -> Arrays:
+    """
+    Get distribution of trophy changes grouped by columns, battles without trophy change are skipped.
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table with `trophy_change`.
+        by (:obj:`Union[str, Sequence[str]]`): Column or columns to group by.
+
+    Return:
+        `Dict[str, numpy.ndarray]`: Key columns, `battles`, `total`, `mean`, `std`, `min` and `max` of every group.
+    """
+    arrays = _arrays(table)
+    change = numpy.asarray(arrays["trophy_change"], dtype="float64")
+    present = ~numpy.isnan(change)
+    arrays = {name: values[present] for name, values in arrays.items()}
+    change = change[present]
+
+    groups, inverse, count = _group(arrays, by)
+    battles = numpy.bincount(inverse, minlength=count)
+    total = numpy.bincount(inverse, weights=change, minlength=count)
+    squares = numpy.bincount(inverse, weights=change * change, minlength=count)
+    mean = total / numpy.maximum(battles, 1)
+    lowest = numpy.full(count, numpy.inf)
+    highest = numpy.full(count, -numpy.inf)
+    numpy.minimum.at(lowest, inverse, change)
+    numpy.maximum.at(highest, inverse, change)
+    return {
+        **groups,
+        "battles": battles,
+        "total": total,
+        "mean": mean,
+        "std": numpy.sqrt(numpy.maximum(squares / numpy.maximum(battles, 1) - mean * mean, 0.0)),
+        "min": lowest,
+        "max": highest,
+    }
+
+
+def trophy_change_histogram(table: Union[Columns, Arrays]) -> Arrays:
+    """
+    Get number of battles for every value of trophy change.
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table with `trophy_change`.
+
+    Return:
+        `Dict[str, numpy.ndarray]`: `trophy_change` values and number of `battles`.
+    """
+    change = numpy.asarray(_arrays(table)["trophy_change"], dtype="float64")
+    values, battles = numpy.unique(change[~numpy.isnan(change)], return_counts=True)
+    return {"trophy_change": values.astype("int64"), "battles": battles}
+
+
+def _battle_codes(arrays: Arrays):
+    _, codes, count = _group(arrays, ("tag", "battle_time"))
+    return codes, count
+
+
+def brawler_matrix(participants: Union[Columns, Arrays], side: str = "opponent") -> Arrays:
+    """
+    Get number of battles and wins for every pair of own brawler and brawler of teammate or opponent.
+
+    Args:
+        participants (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Table from `battle_players_to_columns`.
+        side (:obj:`Literal["teammate", "opponent"]`): Compare with brawlers of teammates or opponents.
+
+    Return:
+        `Dict[str, numpy.ndarray]`: `brawler_ids` (rows), `other_ids` (columns),
+        2D `battles`, `wins` and `win_rate` matrices.
+    """
+    arrays = _arrays(participants)
+    codes, count = _battle_codes(arrays)
+    # Missing brawler is NaN in float column, such rows are skipped instead of cast to garbage ids.
+    brawler = numpy.asarray(arrays["brawler_id"], dtype="float64")
+    known = ~numpy.isnan(brawler)
+    brawler = numpy.where(known, brawler, -1).astype("int64")
+    is_self = (arrays["side"] == "self") & known
+
+    own_brawler = numpy.full(count, -1, dtype="int64")
+    own_brawler[codes[is_self]] = brawler[is_self]
+    battle_won = numpy.zeros(count, dtype=bool)
+    battle_won[codes[is_self]] = wins(arrays)[is_self]
+
+    others = (arrays["side"] == side) & known & (own_brawler[codes] >= 0)
+    rows_of = own_brawler[codes[others]]
+    other_ids = brawler[others]
+    brawler_ids, row = numpy.unique(rows_of, return_inverse=True)
+    columns_ids, column = numpy.unique(other_ids, return_inverse=True)
+
+    battles = numpy.zeros((len(brawler_ids), len(columns_ids)), dtype="int64")
+    won = numpy.zeros_like(battles)
+    numpy.add.at(battles, (row, column), 1)
+    numpy.add.at(won, (row, column), battle_won[codes[others]])
+    return {
+        "brawler_ids": brawler_ids,
+        "other_ids": columns_ids,
+        "battles": battles,
+        "wins": won,
+        "win_rate": won / numpy.maximum(battles, 1),
+    }
+
+
+def session_ids(table: Union[Columns, Arrays], gap: float = 1800.0):
+    """
+    Split battles of every player into sessions: next battle within `gap` seconds continues the session.
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table with `tag` and `battle_time`.
+        gap (:obj:`float`): Maximum seconds between battles of one session.
+
+    Return:
+        `numpy.ndarray`: Session number of every row (unique across players), in order of rows.
+    """
+    arrays = _arrays(table)
+    times = arrays["battle_time"].astype("datetime64[s]").astype("int64")
+    _, players = numpy.unique(_sortable(arrays["tag"]), return_inverse=True)
+    players = players.reshape(-1)
+    order = numpy.lexsort((times, players))
+
+    starts = numpy.ones(len(order), dtype=bool)
+    starts[1:] = (players[order][1:] != players[order][:-1]) | (numpy.diff(times[order]) > gap)
+    sessions = numpy.empty(len(order), dtype="int64")
+    sessions[order] = numpy.cumsum(starts) - 1
+    return sessions
+
+
+def sessions(table: Union[Columns, Arrays], gap: float = 1800.0) -> Arrays:
+    """
+    Get summary of play sessions of every player.
+
+    Args:
+        table (:obj:`Union[Columns, Dict[str, numpy.ndarray]]`): Battle table, e.g. from `battlelog_to_columns`.
+        gap (:obj:`float`): Maximum seconds between battles of one session.
+
+    Return:
+        `Dict[str, numpy.ndarray]`: `session`, `tag`, `start`, `end`, `battles`, `wins` and `trophy_change`
+        of every session.
+    """
+    arrays = _arrays(table)
+    ids = session_ids(arrays, gap)
+    count = int(ids.max()) + 1 if len(ids) else 0
+    times = arrays["battle_time"].astype("datetime64[s]").astype("int64")
+
+    start = numpy.full(count, numpy.iinfo("int64").max)
+    end = numpy.full(count, numpy.iinfo("int64").min)
+    numpy.minimum.at(start, ids, times)
+    numpy.maximum.at(end, ids, times)
+    tags = numpy.empty(count, dtype=arrays["tag"].dtype)
+    tags[ids] = arrays["tag"]
+    change = numpy.nan_to_num(numpy.asarray(arrays["trophy_change"], dtype="float64"))
+    return {
+        "session": numpy.arange(count),
+        "tag": tags,
+        "start": start.astype("datetime64[s]"),
+        "end": end.astype("datetime64[s]"),
+        "battles": numpy.bincount(ids, minlength=count),
+        "wins": numpy.bincount(ids, weights=wins(arrays), minlength=count).astype("int64"),
+        "trophy_change": numpy.bincount(ids, weights=change, minlength=count).astype("int64"),
+    }
@@ -0,0 +1,195 @@
+from typing import Dict, Iterable, Optional, Union
+from functools import partial
+import hashlib
+import asyncio
+import os
+
+from .http import HTTPClient
+from .errors import ClientError
+from .bulk import gather_bounded
+
+PROFILE_ICON_URL = "https://cdn.brawlify.com/profile-icons/regular/{id}.png"
+
+
+async def stream_to_file(
+    http: HTTPClient, url: str, path: str, chunk_size: int = 65536
+) -> str:
+    """
+    Stream asset from url to file, chunks are written in executor so the event loop is not blocked.
+    File appears at `path` only when download is complete.
+
+    Args:
+        http (:obj:`HTTPClient`): Shared http client.
+        url (:obj:`str`): Full url of the asset.
+        path (:obj:`str`): Target path of the file.
+        chunk_size (:obj:`int`): Maximum size of one chunk in bytes.
+
+    Return:
+        `str`: Sha256 hex digest of the content.
+    """
+    loop = asyncio.get_running_loop()
+    digest = hashlib.sha256()
+    temporary = f"{path}.{os.getpid()}.{id(digest):x}.part"
+    file = await loop.run_in_executor(None, open, temporary, "wb")
+    try:
+        async for chunk in http.stream(url, chunk_size):
+            digest.update(chunk)
+            await loop.run_in_executor(None, file.write, chunk)
+        await loop.run_in_executor(None, file.close)
+        await loop.run_in_executor(None, os.replace, temporary, path)
+    except BaseException:
+        file.close()
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return digest.hexdigest()
+
+
+class AssetCache:
+    """
+    On-disk content-addressed cache of CDN assets (profile icons).
+    Content is stored once by its sha256 digest, every asset id only references the digest,
+    so icons with equal content share one file. Assets are downloaded without API token.
+
+    Args:
+        http (:obj:`HTTPClient`): Shared http client.
+        directory (:obj:`str`): Root directory of the cache.
+        url_template (:obj:`str`): Url of the asset with `{id}` placeholder.
+        chunk_size (:obj:`int`): Maximum size of one downloaded chunk in bytes.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        directory: str = "bs_api_assets",
+        url_template: str = PROFILE_ICON_URL,
+        chunk_size: int = 65536,
+    ) -> None:
+        self.http = http
+        self.directory = directory
+        self.url_template = url_template
+        self.chunk_size = chunk_size
+        self.suffix = os.path.splitext(url_template)[1]
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _ref_path(self, asset_id: Union[int, str]) -> str:
+        return os.path.join(self.directory, "refs", f"{asset_id}.ref")
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "objects", digest[:2], digest + self.suffix)
+
+    def _lookup(self, asset_id: Union[int, str]) -> Optional[str]:
+        try:
+            with open(self._ref_path(asset_id)) as file:
+                path = self._object_path(file.read().strip())
+        except FileNotFoundError:
+            return None
+        return path if os.path.exists(path) else None
+
+    def _store(self, asset_id: Union[int, str], temporary: str, digest: str) -> str:
+        path = self._object_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.remove(temporary)
+        else:
+            os.replace(temporary, path)
+
+        ref = self._ref_path(asset_id)
+        with open(ref + ".part", "w") as file:
+            file.write(digest)
+        os.replace(ref + ".part", ref)
+        return path
+
+    async def _download(self, asset_id: Union[int, str]) -> str:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, partial(os.makedirs, os.path.join(self.directory, "refs"), exist_ok=True)
+        )
+        temporary = os.path.join(self.directory, "refs", f"{asset_id}.download")
+        digest = await stream_to_file(
+            self.http, self.url_template.format(id=asset_id), temporary, self.chunk_size
+        )
+        return await loop.run_in_executor(None, self._store, asset_id, temporary, digest)
+
+    async def get_path(self, asset_id: Union[int, str]) -> str:
+        """
+        Get path of cached asset, download it when it is not cached yet.
+        Concurrent calls for the same asset share one download.
+
+        Args:
+            asset_id (:obj:`Union[int, str]`): Id of the asset, e.g. icon id.
+
+        Return:
+            `str`: Path of the file.
+        """
+        path = await asyncio.get_running_loop().run_in_executor(None, self._lookup, asset_id)
+        if path is not None:
+            return path
+
+        key = str(asset_id)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._download(asset_id))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def read(self, asset_id: Union[int, str]) -> bytes:
+        """
+        Get content of asset, download it when it is not cached yet.
+
+        Args:
+            asset_id (:obj:`Union[int, str]`): Id of the asset, e.g. icon id.
+
+        Return:
+            `bytes`: Content of the asset.
+        """
+        path = await self.get_path(asset_id)
+
+        def read_file() -> bytes:
+            with open(path, "rb") as file:
+                return file.read()
+
+        return await asyncio.get_running_loop().run_in_executor(None, read_file)
+
+    async def download_many(
+        self, asset_ids: Iterable[Union[int, str]], concurrency: int = 10
+    ) -> Dict[Union[int, str], Union[str, ClientError]]:
+        """
+        Get paths of many assets at once, equal ids are downloaded once.
+
+        Args:
+            asset_ids (:obj:`Iterable[Union[int, str]]`): Ids of the assets.
+            concurrency (:obj:`int`): Maximum number of simultaneous downloads.
+
+        Return:
+            `Dict[Union[int, str], Union[str, ClientError]]`: Path or error by id of asset.
+        """
+        asset_ids = list(dict.fromkeys(asset_ids))
+        paths = await gather_bounded(self.get_path, asset_ids, concurrency)
+        return dict(zip(asset_ids, paths))
+
+    async def download_icons(
+        self, players: Iterable, concurrency: int = 10
+    ) -> Dict[int, Union[str, ClientError]]:
+        """
+        Get paths of profile icons of players, e.g. whole ranking or club members.
+
+        Args:
+            players (:obj:`Iterable`): Objects with `icon_id` (`RankedPlayer`, `Member`) or `Player`.
+            concurrency (:obj:`int`): Maximum number of simultaneous downloads.
+
+        Return:
+            `Dict[int, Union[str, ClientError]]`: Path or error by icon id.
+        """
+        icon_ids = []
+        for player in players:
+            icon_id = getattr(player, "icon_id", None)
+            if icon_id is None and hasattr(player, "_icon"):
+                icon_id = player._icon.get("id")
+            if icon_id:
+                icon_ids.append(icon_id)
+        return await self.download_many(icon_ids, concurrency)
+
+    def __repr__(self) -> str:
+        return f"<AssetCache directory='{self.directory}'>"
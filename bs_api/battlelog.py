@@ -0,0 +1,326 @@
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+from functools import partial
+import threading
+import asyncio
+import sqlite3
+import time
+
+from .classes import Battle, RequestsModel
+from .errors import ClientError
+from .bulk import iter_bounded
+from .adaptive import AdaptiveInterval
+
+
+class SyncState:
+    """
+    Sync state of battlelog of one player.
+
+    Args:
+        tag (:obj:`str`): Tag player.
+        last_battle_time (:obj:`str`): Raw `battleTime` of the newest seen battle (`None` - never synced).
+        interval (:obj:`float`): Seconds between polls of this player.
+        next_poll (:obj:`float`): Unix time when player should be polled again.
+        last_poll (:obj:`float`): Unix time of the last poll.
+    """
+
+    __slots__ = ("tag", "last_battle_time", "interval", "next_poll", "last_poll")
+
+    def __init__(
+        self,
+        tag: str,
+        last_battle_time: Optional[str] = None,
+        interval: float = 0.0,
+        next_poll: float = 0.0,
+        last_poll: float = 0.0,
+    ) -> None:
+        self.tag = tag
+        self.last_battle_time = last_battle_time
+        self.interval = interval
+        self.next_poll = next_poll
+        self.last_poll = last_poll
+
+    @property
+    def due(self) -> bool:
+        return time.time() >= self.next_poll
+
+    def __repr__(self) -> str:
+        return f"<SyncState tag='{self.tag}' interval='{self.interval:.0f}'>"
+
+
+class BaseSyncStore(ABC):
+    """
+    Basic store of sync states. Subclass it and implement `get`, `set` and `delete` for a new backend.
+    """
+
+    @abstractmethod
+    async def get(self, tag: str) -> Optional[SyncState]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, state: SyncState) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, tag: str) -> None:
+        raise NotImplementedError
+
+    async def get_many(self, tags: Iterable[str]) -> Dict[str, SyncState]:
+        """
+        Get sync states of many players, override it if backend can read them in one batch.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+
+        Return:
+            `Dict[str, SyncState]`: Known states by tag, never synced players are missing.
+        """
+        states = {}
+        for tag in tags:
+            state = await self.get(tag)
+            if state is not None:
+                states[tag] = state
+        return states
+
+    async def due_tags(self, tags: Iterable[str], now: float) -> List[str]:
+        """
+        Get players which should be polled at `now`, never synced players are always due.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            now (:obj:`float`): Unix time.
+
+        Return:
+            `List[str]`: Due tags in the given order.
+        """
+        tags = list(tags)
+        states = await self.get_many(tags)
+        return [tag for tag in tags if tag not in states or states[tag].next_poll <= now]
+
+    async def close(self) -> None:
+        pass
+
+
+class MemorySyncStore(BaseSyncStore):
+    """
+    In-memory store of sync states, it is lost on restart.
+    """
+
+    def __init__(self) -> None:
+        self._states: Dict[str, SyncState] = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    async def get(self, tag: str) -> Optional[SyncState]:
+        return self._states.get(tag)
+
+    async def get_many(self, tags: Iterable[str]) -> Dict[str, SyncState]:
+        return {tag: self._states[tag] for tag in tags if tag in self._states}
+
+    async def set(self, state: SyncState) -> None:
+        self._states[state.tag] = state
+
+    async def delete(self, tag: str) -> None:
+        self._states.pop(tag, None)
+
+
+class SQLiteSyncStore(BaseSyncStore):
+    """
+    On-disk store of sync states in sqlite database, survives restart of the worker.
+
+    Args:
+        path (:obj:`str`): Path to database file.
+    """
+
+    CHUNK = 500
+
+    def __init__(self, path: str = "bs_api_battlelog.sqlite") -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state (tag TEXT PRIMARY KEY, last_battle_time TEXT, "
+            "interval REAL NOT NULL, next_poll REAL NOT NULL, last_poll REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def _execute(self, query: str, params: tuple = (), fetch: bool = False, fetch_all: bool = False):
+        with self._lock:
+            cursor = self._db.execute(query, params)
+            if fetch:
+                return cursor.fetchone()
+            if fetch_all:
+                return cursor.fetchall()
+            self._db.commit()
+
+    async def _select_in(self, query: str, tags: List[str], params: tuple = ()) -> list:
+        # One query per chunk of tags, older sqlite builds allow at most 999 parameters.
+        rows = []
+        for i in range(0, len(tags), self.CHUNK):
+            chunk = tags[i:i + self.CHUNK]
+            marks = ", ".join("?" * len(chunk))
+            rows.extend(await self._run(query.format(marks), params + tuple(chunk), fetch_all=True))
+        return rows
+
+    async def _run(self, *args, **kwargs):
+        # sqlite calls are blocking, so they are moved out of the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self._execute, *args, **kwargs))
+
+    async def get(self, tag: str) -> Optional[SyncState]:
+        row = await self._run(
+            "SELECT tag, last_battle_time, interval, next_poll, last_poll FROM sync_state WHERE tag = ?",
+            (tag,),
+            fetch=True,
+        )
+        if row is None:
+            return None
+        return SyncState(*row)
+
+    async def set(self, state: SyncState) -> None:
+        await self._run(
+            "INSERT OR REPLACE INTO sync_state (tag, last_battle_time, interval, next_poll, last_poll) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (state.tag, state.last_battle_time, state.interval, state.next_poll, state.last_poll),
+        )
+
+    async def delete(self, tag: str) -> None:
+        await self._run("DELETE FROM sync_state WHERE tag = ?", (tag,))
+
+    async def get_many(self, tags: Iterable[str]) -> Dict[str, SyncState]:
+        rows = await self._select_in(
+            "SELECT tag, last_battle_time, interval, next_poll, last_poll FROM sync_state WHERE tag IN ({})",
+            list(tags),
+        )
+        return {row[0]: SyncState(*row) for row in rows}
+
+    async def due_tags(self, tags: Iterable[str], now: float) -> List[str]:
+        # Only players which are not due are read, everything else (including new players) is due.
+        tags = list(tags)
+        waiting = await self._select_in("SELECT tag FROM sync_state WHERE next_poll > ? AND tag IN ({})", tags, (now,))
+        waiting = {row[0] for row in waiting}
+        return [tag for tag in tags if tag not in waiting]
+
+    async def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class BattlelogSync:
+    """
+    Incremental sync of battlelogs which yields only battles newer than the last seen one.
+    Polling interval of every player adapts to rate of his new battles, so inactive players are polled less.
+
+    Args:
+        client (:obj:`RequestsModel`): Client to Brawl Stars API, e.g. `ClientBS`.
+        store (:obj:`BaseSyncStore`): Store of sync states (`None` - `MemorySyncStore`).
+        min_interval (:obj:`float`): Minimum seconds between polls of one player.
+        max_interval (:obj:`float`): Maximum seconds between polls of one player.
+        initial_interval (:obj:`float`): Seconds between polls of a new player.
+        target_new (:obj:`int`): Wanted number of new battles per poll, API keeps only last 25.
+        lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+    """
+
+    def __init__(
+        self,
+        client: RequestsModel,
+        store: Optional[BaseSyncStore] = None,
+        min_interval: float = 60.0,
+        max_interval: float = 6 * 3600.0,
+        initial_interval: float = 600.0,
+        target_new: int = 10,
+        lazy: bool = False,
+    ) -> None:
+        if not 0 < min_interval <= initial_interval <= max_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= initial_interval <= max_interval.")
+
+        self.client = client
+        self.store = store if store is not None else MemorySyncStore()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.target_new = target_new
+        self.intervals = AdaptiveInterval(min_interval, max_interval, target_new)
+        self.lazy = lazy
+
+    def _next_interval(self, state: SyncState, new: int, now: float) -> float:
+        if state.last_poll <= 0:
+            return self.initial_interval
+        return self.intervals.next(state.interval, new, now - state.last_poll)
+
+    async def get_state(self, tag: str) -> SyncState:
+        """
+        Get sync state of player, new state if player was never synced.
+
+        Args:
+            tag (:obj:`str`): Tag player.
+
+        Return:
+            `SyncState`: Sync state.
+        """
+        state = await self.store.get(tag)
+        return state if state is not None else SyncState(tag, interval=self.initial_interval)
+
+    async def sync(self, tag: str) -> List[Battle]:
+        """
+        Get battles of player which were not seen before and move his high-water mark.
+
+        Args:
+            tag (:obj:`str`): Tag player.
+
+        Return:
+            `List[Battle]`: New battles, newest first.
+        """
+        state = await self.get_state(tag)
+        data = await self.client.get_player_battlelog(tag, raw=True)
+        now = time.time()
+
+        # `battleTime` has fixed format "20241105T101500.000Z", so strings compare in time order.
+        items = [
+            item for item in data["items"]
+            if state.last_battle_time is None or item["battleTime"] > state.last_battle_time
+        ]
+        if items:
+            state.last_battle_time = max(item["battleTime"] for item in items)
+
+        state.interval = self._next_interval(state, len(items), now)
+        state.last_poll = now
+        state.next_poll = now + state.interval
+        await self.store.set(state)
+
+        return [Battle(item, self.client._http, self.lazy) for item in items]
+
+    async def iter_sync(
+        self, tags: Iterable[str], concurrency: int = 10, only_due: bool = True
+    ) -> AsyncIterator[Tuple[str, Union[List[Battle], ClientError]]]:
+        """
+        Sync many players at once and yield their new battles as they arrive.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            only_due (:obj:`bool`): Skip players whose next poll time has not come yet.
+
+        Return:
+            `AsyncIterator[Tuple[str, Union[List[Battle], ClientError]]]`: Tag and new battles or error.
+        """
+        if only_due:
+            tags = await self.store.due_tags(tags, time.time())
+        async for _, tag, result in iter_bounded(self.sync, tags, concurrency):
+            yield tag, result
+
+    async def next_poll(self, tags: Iterable[str]) -> float:
+        """
+        Get seconds until the earliest next poll of players.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+
+        Return:
+            `float`: Seconds to wait (0 if some player is due now).
+        """
+        tags = list(tags)
+        states = await self.store.get_many(tags)
+        # Never synced players are due now.
+        earliest = min([states[tag].next_poll if tag in states else 0.0 for tag in tags], default=0.0)
+        return max(0.0, earliest - time.time())
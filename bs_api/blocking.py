@@ -0,0 +1,161 @@
+from typing import Any, AsyncIterator, Awaitable, Iterator, Optional
+from functools import wraps
+import threading
+import asyncio
+import inspect
+
+from .public import ClientBS
+from .http import HTTPClient
+
+
+class LoopHTTP:
+    """
+    Http client of `BlockingClientBS` and models it returns.
+    Session of the shared client belongs to the background loop, so requests awaited
+    on any other loop (e.g. `asyncio.run(player.get_club())` in a worker thread) are sent to it.
+
+    Args:
+        http (:obj:`HTTPClient`): Shared http client.
+        loop (:obj:`asyncio.AbstractEventLoop`): Background loop which owns the session.
+    """
+
+    def __init__(self, http: HTTPClient, loop: asyncio.AbstractEventLoop) -> None:
+        self.http = http
+        self.loop = loop
+
+    def __getattr__(self, name: str):
+        return getattr(self.http, name)
+
+    async def _call(self, coroutine: Awaitable[Any]) -> Any:
+        if asyncio.get_running_loop() is self.loop:
+            return await coroutine
+        if self.loop.is_closed():
+            coroutine.close()
+            raise RuntimeError("BlockingClientBS is closed.")
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, self.loop))
+
+    async def request(self, url: str, return_content: bool = False):
+        return await self._call(self.http.request(url, return_content))
+
+    async def fetch(self, url: str) -> bytes:
+        return await self._call(self.http.fetch(url))
+
+    async def stream(self, url: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        generator = self.http.stream(url, chunk_size)
+        try:
+            while True:
+                try:
+                    chunk = await self._call(generator.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            await self._call(generator.aclose())
+
+
+class BlockingClientBS:
+    """
+    Synchronous facade over `ClientBS` for threaded code.
+    One background thread runs the event loop with a persistent pooled session,
+    so calls reuse keep-alive connections instead of starting a new loop each time.
+    Methods mirror `ClientBS` and can be called from many threads at once,
+    `iter_*` methods return ordinary iterators.
+    Coroutines of returned models (e.g. `player.get_club()`) can be run with `BlockingClientBS.run`
+    or awaited on any other event loop, their requests always go through the background loop.
+
+    Args:
+        *args: Arguments of `ClientBS`, e.g. API token.
+        timeout (:obj:`float`): Seconds to wait for one call (`None` - no limit).
+        **kwargs: Keyword arguments of `ClientBS`.
+    """
+
+    def __init__(self, *args, timeout: Optional[float] = None, **kwargs) -> None:
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="bs_api-loop", daemon=True)
+        self._thread.start()
+
+        async def create() -> ClientBS:
+            return ClientBS(*args, **kwargs)
+
+        # Client is created inside the loop, so its locks and session belong to this loop.
+        self.client: ClientBS = self.run(create())
+        # Models share http client of `ClientBS`, so they get one which always sends requests to this loop.
+        self.client._http = LoopHTTP(self.client._http, self._loop)
+
+    @property
+    def closed(self) -> bool:
+        return not self._thread.is_alive()
+
+    def run(self, coroutine: Awaitable[Any]) -> Any:
+        """
+        Run coroutine on the background loop and wait for its result.
+
+        Args:
+            coroutine (:obj:`Awaitable`): Coroutine, e.g. `player.get_club()`.
+
+        Return:
+            `Any`: Result of the coroutine.
+        """
+        if self.closed or threading.current_thread() is self._thread:
+            if inspect.iscoroutine(coroutine):
+                # Coroutine which will never run is closed, so it is not reported as never awaited.
+                coroutine.close()
+            if self.closed:
+                raise RuntimeError("BlockingClientBS is closed.")
+            raise RuntimeError("BlockingClientBS can not be called from its own event loop.")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def _iterate(self, generator) -> Iterator[Any]:
+        try:
+            while True:
+                try:
+                    yield self.run(generator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self.closed:
+                self.run(generator.aclose())
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        attribute = getattr(self.client, name)
+        if inspect.iscoroutinefunction(attribute):
+            @wraps(attribute)
+            def call(*args, **kwargs):
+                return self.run(attribute(*args, **kwargs))
+            return call
+        if inspect.isasyncgenfunction(attribute):
+            @wraps(attribute)
+            def iterate(*args, **kwargs):
+                return self._iterate(attribute(*args, **kwargs))
+            return iterate
+        return attribute
+
+    def close(self) -> None:
+        """
+        Close the session and stop the background loop.
+        """
+        if self.closed:
+            return
+        try:
+            self.run(self.client.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self) -> "BlockingClientBS":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<BlockingClientBS closed='{self.closed}'>"
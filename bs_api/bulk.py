@@ -0,0 +1,88 @@
+from typing import AsyncIterator, Awaitable, Callable, Iterable, List, Tuple, TypeVar
+import asyncio
+
+from .errors import ClientError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iter_bounded(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int = 10
+) -> AsyncIterator[Tuple[int, T, R]]:
+    """
+    Run `func` for every item with at most `concurrency` calls at once
+    and yield results as they complete. `ClientError` (including `NetworkError` after retries)
+    is yielded as result instead of being raised, other errors stop the iteration.
+    At most `concurrency` results are buffered, so slow consumer pauses new calls.
+
+    Args:
+        func (:obj:`Callable`): Coroutine function which takes one item.
+        items (:obj:`Iterable`): Items to process, consumed lazily.
+        concurrency (:obj:`int`): Maximum number of simultaneous calls.
+
+    Return:
+        `AsyncIterator[Tuple[int, T, R]]`: Index of item, item and result or error.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+    source = iter(enumerate(items))
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        for index, item in source:
+            try:
+                result = await func(item)
+            except ClientError as error:
+                result = error
+            except asyncio.CancelledError:
+                # Consumer stopped early, worker must not wait for free place in the full queue.
+                raise
+            except BaseException as error:
+                await results.put((None, None, error))
+                return
+            await results.put((index, item, result))
+        await results.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            entry = await results.get()
+            if entry is None:
+                running -= 1
+                continue
+            index, item, result = entry
+            if index is None:
+                raise result
+            yield index, item, result
+    finally:
+        for task in workers:
+            task.cancel()
+        # Drop buffered results, so no cancelled worker stays blocked on `put`.
+        while not results.empty():
+            results.get_nowait()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], concurrency: int = 10
+) -> List[R]:
+    """
+    Run `func` for every item with at most `concurrency` calls at once.
+    `ClientError` of item (including `NetworkError` after retries) is put into results instead of being raised.
+
+    Args:
+        func (:obj:`Callable`): Coroutine function which takes one item.
+        items (:obj:`Iterable`): Items to process.
+        concurrency (:obj:`int`): Maximum number of simultaneous calls.
+
+    Return:
+        `List[R]`: Results or errors in order of items.
+    """
+    items = list(items)
+    output: List[R] = [None] * len(items)
+    async for index, _, result in iter_bounded(func, items, concurrency):
+        output[index] = result
+    return output
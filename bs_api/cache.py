@@ -0,0 +1,226 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional
+from functools import partial
+import threading
+import asyncio
+import sqlite3
+import time
+import re
+
+DEFAULT_TTLS: Dict[str, float] = {
+    r"/brawlers(/|$)": 86400.0,
+    r"/battlelog$": 30.0,
+    r"/rankings/": 300.0,
+    r"/clubs/": 120.0,
+    r"/players/": 60.0,
+}
+
+
+class CacheEntry:
+    """
+    Cached response of one endpoint.
+
+    Args:
+        body (:obj:`bytes`): Raw body of the response.
+        etag (:obj:`str`): `ETag` validator of the response.
+        expires (:obj:`float`): Unix time when entry becomes stale.
+    """
+
+    __slots__ = ("body", "etag", "expires")
+
+    def __init__(self, body: bytes, etag: Optional[str] = None, expires: float = 0.0) -> None:
+        self.body = body
+        self.etag = etag
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires
+
+    def __repr__(self) -> str:
+        return f"<CacheEntry size='{len(self.body)}' fresh='{self.fresh}'>"
+
+
+class BaseCache(ABC):
+    """
+    Basic response cache. Subclass it and implement `get`, `set`, `delete` and `clear` for a new backend.
+
+    Args:
+        ttls (:obj:`Dict[str, float]`): Seconds to keep response by regex pattern of url, first match wins.
+        default_ttl (:obj:`float`): Seconds to keep response of other urls (0 - do not keep).
+        respect_cache_control (:obj:`bool`): Use `Cache-Control` header of the server instead of own ttls.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 0.0,
+        respect_cache_control: bool = True,
+    ) -> None:
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls if ttls is not None else DEFAULT_TTLS).items()]
+        self.default_ttl = default_ttl
+        self.respect_cache_control = respect_cache_control
+
+    def ttl_for(self, url: str, headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """
+        Get seconds to keep response of url.
+
+        Args:
+            url (:obj:`str`): Url of the request.
+            headers (:obj:`Mapping[str, str]`): Headers of the response.
+
+        Return:
+            `float`: Seconds to keep response or `None` if it must not be stored.
+        """
+        if self.respect_cache_control and headers is not None:
+            directives = [
+                directive.strip().lower() for directive in headers.get("Cache-Control", "").split(",")
+            ]
+            if "no-store" in directives:
+                return None
+            if "no-cache" in directives:
+                return 0.0
+            for directive in directives:
+                if directive.startswith("max-age="):
+                    try:
+                        return max(0.0, float(directive[8:]))
+                    except ValueError:
+                        break
+
+        path = url.split("?", 1)[0]
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release resources of the cache, it is called by `ClientBS.close`. Cache can be used again after it.
+        """
+
+
+class MemoryCache(BaseCache):
+    """
+    In-memory LRU response cache.
+
+    Args:
+        maxsize (:obj:`int`): Maximum number of stored responses.
+        ttls (:obj:`Dict[str, float]`): Seconds to keep response by regex pattern of url.
+        default_ttl (:obj:`float`): Seconds to keep response of other urls.
+        respect_cache_control (:obj:`bool`): Use `Cache-Control` header of the server instead of own ttls.
+    """
+
+    def __init__(self, maxsize: int = 1024, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCache(BaseCache):
+    """
+    On-disk response cache in sqlite database, survives restart of the worker.
+
+    Args:
+        path (:obj:`str`): Path to database file.
+        ttls (:obj:`Dict[str, float]`): Seconds to keep response by regex pattern of url.
+        default_ttl (:obj:`float`): Seconds to keep response of other urls.
+        respect_cache_control (:obj:`bool`): Use `Cache-Control` header of the server instead of own ttls.
+    """
+
+    def __init__(self, path: str = "bs_api_cache.sqlite", **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connection is opened again after `close`, so a closed client can still be used.
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, expires REAL NOT NULL)"
+            )
+            self._db.commit()
+        return self._db
+
+    def _execute(self, query: str, params: tuple = (), fetch: bool = False):
+        with self._lock:
+            cursor = self._connect().execute(query, params)
+            if fetch:
+                return cursor.fetchone()
+            self._db.commit()
+
+    async def _run(self, *args, **kwargs):
+        # sqlite calls are blocking, so they are moved out of the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self._execute, *args, **kwargs))
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        row = await self._run("SELECT body, etag, expires FROM responses WHERE key = ?", (key,), fetch=True)
+        if row is None:
+            return None
+        return CacheEntry(bytes(row[0]), row[1], row[2])
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        await self._run(
+            "INSERT OR REPLACE INTO responses (key, body, etag, expires) VALUES (?, ?, ?, ?)",
+            (key, entry.body, entry.etag, entry.expires),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._run("DELETE FROM responses WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        await self._run("DELETE FROM responses")
+
+    async def purge_expired(self) -> None:
+        """
+        Delete stale responses without validators from database.
+        """
+        await self._run("DELETE FROM responses WHERE expires < ? AND etag IS NULL", (time.time(),))
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
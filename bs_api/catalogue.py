@@ -0,0 +1,203 @@
+from typing import Dict, List, Optional
+from bisect import bisect_left
+import difflib
+import time
+import re
+
+
+def normalise_name(name: str) -> str:
+    """
+    Normalise brawler, star power or gadget name for lookups.
+    EXAMPLE: "MR. P" -> "mrp", "8-Bit" -> "8bit", "El Primo" -> "elprimo"
+
+    Args:
+        name (:obj:`str`): Original name.
+
+    Return:
+        `str`: Lowercase name without spaces and punctuation.
+    """
+    return re.sub(r"[\W_]+", "", name.lower())
+
+
+class BrawlerInfo:
+    """
+    Brawler from the catalogue of all brawlers in the game.
+
+    Args:
+        id (:obj:`int`): Unique ID of brawler.
+        name (:obj:`str`): Name brawler.
+        star_powers (:obj:`List[dict]`): All star powers of brawler.
+        gadgets (:obj:`List[dict]`): All gadgets of brawler.
+    """
+
+    __slots__ = ("id", "name", "star_powers", "gadgets")
+
+    def __init__(self, data: dict) -> None:
+        self.id: int = int(data["id"])
+        self.name: str = data["name"]
+        self.star_powers: List[dict] = data.get("starPowers", [])
+        self.gadgets: List[dict] = data.get("gadgets", [])
+
+    def __repr__(self) -> str:
+        return f"<BrawlerInfo object name='{self.name}' id='{self.id}'>"
+
+
+class BrawlerCatalogue:
+    """
+    Indexed catalogue of all brawlers, their star powers and gadgets.
+
+    Args:
+        data (:obj:`dict`): Response of `brawlers` endpoint.
+    """
+
+    def __init__(self, data: dict) -> None:
+        self.loaded_at = time.monotonic()
+        self.brawlers: List[BrawlerInfo] = [BrawlerInfo(item) for item in data["items"]]
+
+        self._by_id: Dict[int, BrawlerInfo] = {}
+        self._by_name: Dict[str, BrawlerInfo] = {}
+        self.star_powers: Dict[int, dict] = {}
+        self.gadgets: Dict[int, dict] = {}
+        self._star_power_owner: Dict[int, BrawlerInfo] = {}
+        self._gadget_owner: Dict[int, BrawlerInfo] = {}
+
+        for brawler in self.brawlers:
+            self._by_id[brawler.id] = brawler
+            self._by_name[normalise_name(brawler.name)] = brawler
+            for star_power in brawler.star_powers:
+                self.star_powers[star_power["id"]] = star_power
+                self._star_power_owner[star_power["id"]] = brawler
+            for gadget in brawler.gadgets:
+                self.gadgets[gadget["id"]] = gadget
+                self._gadget_owner[gadget["id"]] = brawler
+
+        self._names = sorted(self._by_name)
+
+    def __len__(self) -> int:
+        return len(self.brawlers)
+
+    def __iter__(self):
+        return iter(self.brawlers)
+
+    def __contains__(self, brawlerid: int) -> bool:
+        return brawlerid in self._by_id
+
+    def age(self) -> float:
+        """
+        Get seconds since the catalogue was loaded.
+
+        Return:
+            `float`: Age of the catalogue.
+        """
+        return time.monotonic() - self.loaded_at
+
+    def get(self, brawlerid: int) -> Optional[BrawlerInfo]:
+        """
+        Get brawler by his brawlerid.
+
+        Args:
+            brawlerid (:obj:`int`): Unique id of brawler.
+
+        Return:
+            `BrawlerInfo`: Brawler or `None` if it was not found.
+        """
+        return self._by_id.get(int(brawlerid))
+
+    def get_by_name(self, name: str) -> Optional[BrawlerInfo]:
+        """
+        Get brawler by exact name (case, spaces and punctuation are ignored).
+
+        Args:
+            name (:obj:`str`): Name brawler.
+
+        Return:
+            `BrawlerInfo`: Brawler or `None` if it was not found.
+        """
+        return self._by_name.get(normalise_name(name))
+
+    def search_prefix(self, prefix: str) -> List[BrawlerInfo]:
+        """
+        Get all brawlers which names start with prefix.
+
+        Args:
+            prefix (:obj:`str`): Start of name.
+
+        Return:
+            `List[BrawlerInfo]`: Brawlers sorted by name.
+        """
+        prefix = normalise_name(prefix)
+        output = []
+        for index in range(bisect_left(self._names, prefix), len(self._names)):
+            if not self._names[index].startswith(prefix):
+                break
+            output.append(self._by_name[self._names[index]])
+        return output
+
+    def find(self, name: str, cutoff: float = 0.75) -> Optional[BrawlerInfo]:
+        """
+        Find brawler by name: exact match, then prefix, then substring, then closest fuzzy match.
+        EXAMPLE: "LEON", "moe", "ShElLy", "mr p", "spruot".
+
+        Args:
+            name (:obj:`str`): Name brawler.
+            cutoff (:obj:`float`): Minimal similarity of fuzzy match from 0 to 1.
+
+        Return:
+            `BrawlerInfo`: Brawler or `None` if it was not found.
+        """
+        key = normalise_name(name)
+        brawler = self._by_name.get(key)
+        if brawler is not None:
+            return brawler
+
+        by_prefix = self.search_prefix(key)
+        if by_prefix:
+            return by_prefix[0]
+
+        for other in self._names:
+            if key in other:
+                return self._by_name[other]
+
+        matches = difflib.get_close_matches(key, self._names, n=1, cutoff=cutoff)
+        if matches:
+            return self._by_name[matches[0]]
+        return None
+
+    def get_star_power(self, star_power_id: int) -> Optional[dict]:
+        """
+        Get star power by its id.
+
+        Args:
+            star_power_id (:obj:`int`): Unique id of star power.
+
+        Return:
+            `dict`: Star power with `id` and `name` or `None`.
+        """
+        return self.star_powers.get(star_power_id)
+
+    def get_gadget(self, gadget_id: int) -> Optional[dict]:
+        """
+        Get gadget by its id.
+
+        Args:
+            gadget_id (:obj:`int`): Unique id of gadget.
+
+        Return:
+            `dict`: Gadget with `id` and `name` or `None`.
+        """
+        return self.gadgets.get(gadget_id)
+
+    def get_owner(self, item_id: int) -> Optional[BrawlerInfo]:
+        """
+        Get brawler which owns star power or gadget.
+
+        Args:
+            item_id (:obj:`int`): Unique id of star power or gadget.
+
+        Return:
+            `BrawlerInfo`: Owner brawler or `None`.
+        """
+        return self._star_power_owner.get(item_id) or self._gadget_owner.get(item_id)
+
+    def __repr__(self) -> str:
+        return f"<BrawlerCatalogue object brawlers='{len(self.brawlers)}'>"
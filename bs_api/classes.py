@@ -1,27 +1,124 @@
-from aiohttp import ClientSession
-from aiohttp import TCPConnector
-from typing import List, Literal, Union
+from typing import AsyncIterator, Dict, List, Literal, Optional, Tuple, Union
+from functools import lru_cache
 from io import BytesIO
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+import asyncio
 import re
 
 from .errors import *
+from .http import HTTPClient
+from .bulk import gather_bounded
+from .assets import stream_to_file
+from .diff import ClubDiff, PlayerDiff, diff_clubs, diff_players, payload_digest
 
-class RequestsModel:
+_camel_boundary = re.compile(r'(?<!^)(?=[A-Z])')
+
+
+@lru_cache(maxsize=None)
+def _snake_case(key: str) -> str:
+    return _camel_boundary.sub('_', key).lower()
+
+
+def _camel_case(field: str) -> str:
+    head, *tail = field.split("_")
+    return head + "".join(part.capitalize() for part in tail)
+
+
+def parse_battle_time(value: str) -> datetime:
+    """
+    Parse battle time of Brawl Stars API.
+    EXAMPLE: "20241105T101500.000Z" -> datetime(2024, 11, 5, 10, 15, tzinfo=timezone.utc)
+
+    Args:
+        value (:obj:`str`): Time in fixed `YYYYMMDDTHHMMSS.000Z` format.
+
+    Return:
+        `datetime.datetime`: Timezone-aware time in UTC.
+    """
+    return datetime(
+        int(value[0:4]), int(value[4:6]), int(value[6:8]),
+        int(value[9:11]), int(value[11:13]), int(value[13:15]),
+        tzinfo=timezone.utc,
+    )
+
+
+class Model:
+    """
+    Basic data model which maps json keys (camelCase) to attributes (snake_case).
+    Mapping of declared `_fields` and `_aliases` is resolved once per class into `_keys` table,
+    `_nested` maps json key to attribute which takes one value of nested object.
+    Models use `__slots__`, json keys which are not declared are kept in one `extras` mapping.
+    """
+
+    __slots__ = ("_extras",)
+
+    _fields: Tuple[str, ...] = ()
+    _aliases: Dict[str, str] = {}
+    _nested: Dict[str, Tuple[str, str]] = {}
+    _keys: Dict[str, str] = {}
+    _names: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._keys = {_camel_case(field): field for field in cls._fields}
+        cls._keys.update(cls._aliases)
+        cls._names = {name: key for key, name in cls._keys.items()}
+
+    def __init__(self) -> None:
+        self._extras: Optional[dict] = None
+
+    @property
+    def extras(self) -> dict:
+        """
+        Values of json keys which are not declared in the model (keys are in snake_case).
+        """
+        if self._extras is None:
+            return {}
+        return self._extras
+
+    def __getattr__(self, name: str):
+        # Called only when slot is not set, so undeclared keys stay readable as attributes.
+        if not name.startswith("_"):
+            extras = self._extras
+            if extras is not None and name in extras:
+                return extras[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _set_extra(self, name: str, value) -> None:
+        if self._extras is None:
+            self._extras = {}
+        self._extras[name] = value
+
+    def _load(self, data: dict) -> None:
+        keys = self._keys
+        for key, value in data.items():
+            name = keys.get(key)
+            if name is not None:
+                setattr(self, name, value)
+            elif key in self._nested:
+                name, field = self._nested[key]
+                setattr(self, name, value.get(field))
+            else:
+                self._set_extra(_snake_case(key), value)
+
+
+class RequestsModel(Model):
     """
     Basic request model for accessing requests to Brawl Stars API.
 
     Args:
-        APIToken (:obj:`str`): Special token for requests.
+        http (:obj:`HTTPClient`): Shared http client for requests.
     """
 
-    __basic_url = "https://api.brawlstars.com/v1/"
+    __slots__ = ("_http",)
 
-    def __init__(self, APIToken) -> None:
-        self._token = APIToken
+    def __init__(self, http: HTTPClient) -> None:
+        super().__init__()
+        self._http = http
 
     def _generate_url(self, add):
-        return self.__basic_url + str(add)
+        return self._http.base_url + str(add)
 
     def _hashtag(self, old_str: str):
         if old_str.startswith("#"):
@@ -30,48 +127,85 @@ class RequestsModel:
             return "%23" + old_str
 
     async def _create_request(self, url, return_content=False):
-        async with ClientSession(connector=TCPConnector(ssl=False)) as session:
-            response = await session.get(
-                self._generate_url(url) if not return_content else url,
-                headers={"Authorization": f"Bearer {self._token}"},
-            )
-            if response.status == 200:
-                if return_content:
-                    return await response.content.read()
-                else:
-                    return await response.json()
-            elif response.status == 400:
-                raise IncorrectError()
-            elif response.status == 403:
-                raise AccessError()
-            elif response.status == 404:
-                raise ResourceError()
-            elif response.status == 429:
-                raise RequestsLimitError()
-            elif response.status == 503:
-                raise ServiceError()
-            else:
-                raise UnknownError(
-                    f"Unknown error happened when handling the request with {response.status} status."
-                )
+        return await self._http.request(
+            self._generate_url(url) if not return_content else url,
+            return_content=return_content,
+        )
+
+    def _page_url(self, url: str, limit: Optional[int] = None, after: Optional[str] = None) -> str:
+        params = {key: value for key, value in (("limit", limit), ("after", after)) if value is not None}
+        return f"{url}?{urlencode(params)}" if params else url
+
+    async def _iter_pages(
+        self, url: str, limit: Optional[int] = None, prefetch: bool = True
+    ) -> AsyncIterator[List[dict]]:
+        # Follow `after` cursors of paginated endpoint and yield items of every page.
+        # With prefetch the next page is requested while the caller processes the current one.
+        next_url = self._page_url(url, limit)
+        pending: Optional[asyncio.Future] = None
+        try:
+            while next_url is not None:
+                data = await (pending if pending is not None else self._create_request(next_url))
+                pending = None
+
+                after = data.get("paging", {}).get("cursors", {}).get("after")
+                next_url = self._page_url(url, limit, after) if after else None
+                if next_url is not None and prefetch:
+                    pending = asyncio.ensure_future(self._create_request(next_url))
+
+                yield data["items"]
+        finally:
+            if pending is not None:
+                pending.cancel()
+                if pending.done() and not pending.cancelled():
+                    pending.exception()
+
+    async def _create_digest_request(self, url) -> Tuple[dict, str]:
+        # Decoded json together with digest of raw body, used to skip diff of unchanged snapshots.
+        body = await self._http.fetch(self._generate_url(url))
+        return self._http.json_loads(body), payload_digest(body)
+
+    async def _create_raw_request(self, url, raw: Union[bool, Literal["bytes"]] = True):
+        # Skip model construction: `True` - decoded json, "bytes" - undecoded body of response.
+        if raw == "bytes":
+            return await self._http.fetch(self._generate_url(url))
+        return await self._create_request(url)
 
 
 class BasicPlayer(RequestsModel):
     """
     Basic player class for finding player.
     """
-    def __init__(self, APIToken) -> None:
-        super().__init__(APIToken)
+    __slots__ = ()
 
-    async def get_player(self):
+    def __init__(self, http: HTTPClient) -> None:
+        super().__init__(http)
+
+    async def get_player(self, include_battlelog: bool = False, lazy: bool = False):
         """
         Get real `Player` class of player.
 
+        Args:
+            include_battlelog (:obj:`bool`): Also get battlelog into `Player.battlelog`, both requests run concurrently.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+
         Return:
             `Player`: Real `Player` class with all his parameters.
         """
-        player_data = await self._create_request(f"players/{self._hashtag(self.tag)}")
-        player = Player(player_data, self._token)
+        url = f"players/{self._hashtag(self.tag)}"
+        if not include_battlelog:
+            player_data, digest = await self._create_digest_request(url)
+            return Player(player_data, self._http, digest)
+
+        player_result, battlelog_data = await asyncio.gather(
+            self._create_digest_request(url), self._create_request(f"{url}/battlelog"), return_exceptions=True
+        )
+        for result in (player_result, battlelog_data):
+            if isinstance(result, BaseException):
+                raise result
+        player_data, digest = player_result
+        player = Player(player_data, self._http, digest)
+        player.battlelog = [Battle(battle_data, self._http, lazy) for battle_data in battlelog_data["items"]]
         return player
 
 
@@ -88,9 +222,14 @@ class Club(RequestsModel):
         required_trophies (:obj:`int`): Required trophies for joining in club.
         trophies (:obj:`int`): Total trophies in club.
         members (:obj:`List[Member]`): List of all members in club.
+        digest (:obj:`str`): Digest of raw payload when it is known, else `None`.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("tag", "name", "description", "type", "badge_id", "required_trophies", "trophies", "members")
+    __slots__ = _fields + ("digest",)
+
+    def __init__(self, my_data, http: HTTPClient, digest: Optional[str] = None) -> None:
+        super().__init__(http)
+        self.digest = digest
         self.tag: str = ""
         self.name: str = ""
         self.description: str = ""
@@ -100,14 +239,8 @@ class Club(RequestsModel):
         self.trophies: int = 0
         self.members: List[Member] = []
 
-        for value in my_data:
-            setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), my_data[value])
-
-        new_members = []
-        for member in self.members:
-            newMember = Member(member, self._token)
-            new_members.append(newMember)
-        self.members = new_members
+        self._load(my_data)
+        self.members = [Member(member, http) for member in self.members]
 
     async def get_player_by_search(self, search: str):
         """
@@ -130,11 +263,42 @@ class Club(RequestsModel):
 
         raise ResourceError("Member was not found.")
 
+    def diff(self, newer: "Club") -> ClubDiff:
+        """
+        Get changes from this snapshot of club to a newer one.
+
+        Args:
+            newer (:obj:`Club`): Newer snapshot of the same club.
+
+        Return:
+            `ClubDiff`: Changes, it is falsy when nothing changed.
+        """
+        return diff_clubs(self, newer)
+
+    async def fetch_member_players(
+        self, concurrency: int = 10, include_battlelog: bool = False, lazy: bool = False
+    ) -> Dict[str, Union["Player", ClientError]]:
+        """
+        Get real `Player` classes of all members at once.
+
+        Args:
+            concurrency (:obj:`int`): Maximum number of simultaneous members.
+            include_battlelog (:obj:`bool`): Also get battlelog of every member into `Player.battlelog`.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+
+        Return:
+            `Dict[str, Union[Player, ClientError]]`: Player or error by tag of member, in order of members.
+        """
+        players = await gather_bounded(
+            lambda member: member.get_player(include_battlelog, lazy), self.members, concurrency
+        )
+        return {member.tag: player for member, player in zip(self.members, players)}
+
     def __repr__(self) -> str:
         return f"<Club object name='{self.name}' tag='{self.tag}'>"
 
 
-class Brawler:
+class Brawler(Model):
     """
     Brawler class of specific player with all brawler statistic.
 
@@ -149,7 +313,11 @@ class Brawler:
         star_powers (:obj:`list`): All star powers of brawler.
         gadgets (:obj:`list`): All gadgets of brawler.
     """
+    _fields = ("id", "name", "power", "rank", "trophies", "highest_trophies", "gears", "star_powers", "gadgets")
+    __slots__ = _fields
+
     def __init__(self, data) -> None:
+        super().__init__()
         self.id: int = 0
         self.name: str = ""
         self.power: int = ""
@@ -160,8 +328,7 @@ class Brawler:
         self.star_powers: list = []
         self.gadgets: list = []
 
-        for value in data:
-            setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), data[value])
+        self._load(data)
 
     def __repr__(self) -> str:
         return f"<Brawler object name='{self.name}' trophies='{self.trophies}'>"
@@ -178,10 +345,23 @@ class Battler(BasicPlayer):
         brawler_id (:obj:`int`): Unique id of brawler (brawlerid).
         brawler_power (:obj:`int`): Bralwer power.
         brawler_trophies (:obj:`int`): Current brawler trophies.
+        lazy (:obj:`bool`): Decode attributes only when they are accessed first time.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("tag", "name")
+    _brawler_keys = {"id": "brawler_id", "name": "brawler_name", "power": "brawler_power", "trophies": "brawler_trophies"}
+    _brawler_names = {name: key for key, name in _brawler_keys.items()}
+    __slots__ = _fields + tuple(_brawler_keys.values()) + ("_data",)
+
+    def __init__(self, my_data, http: HTTPClient, lazy: bool = False) -> None:
+        super().__init__(http)
 
+        self._data: Optional[dict] = None
+        if lazy:
+            self._data = my_data
+        else:
+            self._decode(my_data)
+
+    def _decode(self, my_data: dict) -> None:
         self.tag: str = ""
         self.name: str = ""
         self.brawler_name: str = ""
@@ -189,14 +369,53 @@ class Battler(BasicPlayer):
         self.brawler_power: int = 0
         self.brawler_trophies: int = 0
 
-        for value in my_data:
-            if str(value) == "brawler":
-                for brawler_value in my_data[value]:
-                    setattr(
-                        self, "brawler_" + brawler_value, my_data[value][brawler_value]
-                    )
+        keys = self._keys
+        brawler_keys = self._brawler_keys
+        for key, value in my_data.items():
+            if key == "brawler":
+                for field, data in value.items():
+                    name = brawler_keys.get(field)
+                    if name is None:
+                        self._set_extra("brawler_" + _snake_case(field), data)
+                    else:
+                        setattr(self, name, data)
             else:
-                setattr(self, value, my_data[value])
+                name = keys.get(key)
+                if name is None:
+                    self._set_extra(_snake_case(key), value)
+                else:
+                    setattr(self, name, value)
+
+    def hydrate(self) -> "Battler":
+        """
+        Decode all attributes of lazy battler right now.
+
+        Return:
+            `Battler`: This battler.
+        """
+        if self._data is not None:
+            data, self._data = self._data, None
+            self._decode(data)
+        return self
+
+    @property
+    def extras(self) -> dict:
+        self.hydrate()
+        return super().extras
+
+    def __getattr__(self, name: str):
+        data = None if name.startswith("_") else self._data
+        if data is None:
+            return super().__getattr__(name)
+
+        if name in self._names and self._names[name] in data:
+            value = data[self._names[name]]
+        elif name in self._brawler_names and self._brawler_names[name] in data.get("brawler", ()):
+            value = data["brawler"][self._brawler_names[name]]
+        else:
+            return getattr(self.hydrate(), name)
+        setattr(self, name, value)
+        return value
 
     async def get_brawler(self) -> Brawler:
         """
@@ -229,11 +448,22 @@ class Battle(RequestsModel):
         duration (:obj:`int`): Duration in sec.
         trophy_change (:obj:`int`): How much player get trophies for this battle.
         rank (:obj:`int`): Rank of battler which player was playing on.
+        lazy (:obj:`bool`): Decode attributes only when they are accessed first time.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("id", "mode", "map", "type", "result", "duration", "trophy_change", "rank", "star_player", "players", "teams")
+    __slots__ = _fields + ("battle_time", "_data")
 
-        self.battle_time: datetime
+    def __init__(self, my_data, http: HTTPClient, lazy: bool = False) -> None:
+        super().__init__(http)
+
+        self._data: Optional[dict] = None
+        if lazy:
+            self._data = my_data
+        else:
+            self._decode(my_data)
+
+    def _decode(self, my_data: dict) -> None:
+        self.battle_time: datetime = None
         self.id: int = 0
         self.mode: str = ""
         self.map: str = ""
@@ -242,25 +472,48 @@ class Battle(RequestsModel):
         self.duration: int = 0
         self.trophy_change: int = 0
         self.rank: int = 0
+        self.star_player: Optional[dict] = None
+        self.players: Optional[List[dict]] = None
+        self.teams: Optional[List[List[dict]]] = None
 
         for value in my_data:
             if value in ["event", "battle"]:
-                for attr in my_data[value]:
-                    setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', attr).lower(), my_data[value][attr])
+                self._load(my_data[value])
             elif value == "battleTime":
-                time = my_data[value]
-                real_time = (
-                    time[0:4]
-                    + "-"
-                    + time[4:6]
-                    + "-"
-                    + time[6:11]
-                    + ":"
-                    + time[11:13]
-                    + ":"
-                    + time[13:15]
-                )
-                self.battle_time = datetime.strptime(real_time, "%Y-%m-%dT%H:%M:%S")
+                self.battle_time = parse_battle_time(my_data[value])
+
+    def hydrate(self) -> "Battle":
+        """
+        Decode all attributes of lazy battle right now.
+
+        Return:
+            `Battle`: This battle.
+        """
+        if self._data is not None:
+            data, self._data = self._data, None
+            self._decode(data)
+        return self
+
+    @property
+    def extras(self) -> dict:
+        self.hydrate()
+        return super().extras
+
+    def __getattr__(self, name: str):
+        data = None if name.startswith("_") else self._data
+        if data is None:
+            return super().__getattr__(name)
+
+        if name == "battle_time" and "battleTime" in data:
+            value = parse_battle_time(data["battleTime"])
+        elif name in self._names and self._names[name] in data.get("battle", ()):
+            value = data["battle"][self._names[name]]
+        elif name in self._names and self._names[name] in data.get("event", ()):
+            value = data["event"][self._names[name]]
+        else:
+            return getattr(self.hydrate(), name)
+        setattr(self, name, value)
+        return value
 
     async def get_star_player(self):
         """
@@ -269,31 +522,34 @@ class Battle(RequestsModel):
         Return:
             'Player': star player.
         """
-        if self.__dict__.get("starPlayer"):
+        if self.star_player:
             player_data = await self._create_request(
-                f"players/{self._hashtag(self.__dict__['starPlayer']['tag'])}"
+                f"players/{self._hashtag(self.star_player['tag'])}"
             )
-            star_player = Player(player_data, self._token)
+            star_player = Player(player_data, self._http)
             return star_player
         else:
             return None
 
-    def get_battlers(self) -> List[Battler]:
+    def get_battlers(self, lazy: bool = False) -> List[Battler]:
         """
         Get list of `Battler`'s from current battle.
 
+        Args:
+            lazy (:obj:`bool`): Decode attributes of battlers only when they are accessed.
+
         Return:
             `List[Battler]`: List of all `Battler`'s in this battle.
         """
         output = []
-        if self.__dict__.get("players"):
-            for player in self.__dict__.get("players"):
-                output.append(Battler(player, self._token))
-        elif self.__dict__.get("teams"):
-            for team in self.__dict__.get("teams"):
+        if self.players:
+            for player in self.players:
+                output.append(Battler(player, self._http, lazy))
+        elif self.teams:
+            for team in self.teams:
                 output_team = []
                 for player in team:
-                    output_team.append(Battler(player, self._token))
+                    output_team.append(Battler(player, self._http, lazy))
                 output.append(output_team)
 
         return output
@@ -321,12 +577,23 @@ class Player(RequestsModel):
         best_time_as_big_brawler (:obj:`int`): Best time as big brawler event.
         name_color (:obj:`str`): Specific color of name.
         brawlers (:obj:`List[Brawler]`): List of all brawlers on account player.
+        battlelog (:obj:`List[Battle]`): Battlelog when it was requested with player, else `None`.
+        digest (:obj:`str`): Digest of raw payload when it is known, else `None`.
     """
     
     __basic_icon_url = "https://cdn.brawlify.com/profile-icons/regular/"
 
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = (
+        "tag", "name", "is_qualified_from_championship_challenge", "trophies", "exp_level", "exp_points",
+        "highest_trophies", "solo_victories", "duo_victories", "best_robo_rumble_time",
+        "best_time_as_big_brawler", "name_color", "brawlers",
+    )
+    _aliases = {"3vs3Victories": "victories3vs3", "club": "_club", "icon": "_icon"}
+    __slots__ = _fields + tuple(_aliases.values()) + ("battlelog", "digest")
+
+    def __init__(self, my_data, http: HTTPClient, digest: Optional[str] = None) -> None:
+        super().__init__(http)
+        self.digest = digest
 
         self.tag: str = ""
         self.name: str = ""
@@ -335,6 +602,7 @@ class Player(RequestsModel):
         self.exp_level: int = 0
         self.exp_points: int = 0
         self.highest_trophies: int = 0
+        self.victories3vs3: int = 0
         self.solo_victories: int = 0
         self.duo_victories: int = 0
         self.best_robo_rumble_time: int = 0
@@ -344,22 +612,22 @@ class Player(RequestsModel):
 
         self._club: Club = None
         self._icon: dict = {"id": 0}
+        self.battlelog: Optional[List[Battle]] = None
 
-        for value in my_data:
-            if value in ["club", "icon"]:
-                setattr(self, f"_{value}", my_data[value])
-            else:
-                setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), my_data[value])
+        self._load(my_data)
+        self.brawlers = [Brawler(brawler) for brawler in self.brawlers]
 
-        new_brawlers = []
-        for brawler in self.brawlers:
-            newBrawler = Brawler(brawler)
-            new_brawlers.append(newBrawler)
-        self.brawlers = new_brawlers
+    def diff(self, newer: "Player") -> PlayerDiff:
+        """
+        Get changes from this snapshot of player to a newer one.
 
-    @property
-    def victories3vs3(self):
-        return self.__dict__["3vs3Victories"]
+        Args:
+            newer (:obj:`Player`): Newer snapshot of the same player.
+
+        Return:
+            `PlayerDiff`: Changes, it is falsy when nothing changed.
+        """
+        return diff_players(self, newer)
 
     def _generate_icon_url(self, add):
         return self.__basic_icon_url + str(add) + ".png"
@@ -371,23 +639,18 @@ class Player(RequestsModel):
         Return:
             `BytesIO`: buffer of icon image.
         """
-        content = await self._create_request(
-            self._generate_icon_url(self._icon["id"]), return_content=True
-        )
-        return content
+        # Icon is on CDN, so it is streamed without API token.
+        chunks = [chunk async for chunk in self._http.stream(self._generate_icon_url(self._icon["id"]))]
+        return b"".join(chunks)
 
     async def download_icon_image(self, path: str = "output") -> None:
         """
-        Download player icon image to specific path.
+        Download player icon image to specific path, it is streamed to disk without blocking the event loop.
 
         Args:
             path (:obj:`str`): Path to download the image.
         """
-        icon_bytes = await self.get_bytes_icon_image()
-
-        with open(path + ".png", "wb") as file:
-            file.write(icon_bytes)
-            file.close()
+        await stream_to_file(self._http, self._generate_icon_url(self._icon["id"]), path + ".png")
 
     async def get_club(self) -> Union[Club]:
         """
@@ -396,19 +659,22 @@ class Player(RequestsModel):
         Return:
             `Club`: player club.
         """
-        if len(self._club) > 0:
-            club_data = await self._create_request(
+        if self._club:
+            club_data, digest = await self._create_digest_request(
                 f"clubs/{self._hashtag(self._club['tag'])}"
             )
-            club = Club(club_data, self._token)
+            club = Club(club_data, self._http, digest)
             return club
         else:
             return None
 
-    async def get_battlelog(self) -> List[Battle]:
+    async def get_battlelog(self, lazy: bool = False) -> List[Battle]:
         """
         Get battlelog of the player's last 25 battles.
 
+        Args:
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+
         Return:
             `List[Battle]`: battlelog.
         """
@@ -417,7 +683,7 @@ class Player(RequestsModel):
         )
         battlelog = []
         for battle_data in battlelog_data["items"]:
-            battlelog.append(Battle(battle_data, self._token))
+            battlelog.append(Battle(battle_data, self._http, lazy))
         return battlelog
 
     def __repr__(self):
@@ -434,18 +700,31 @@ class Member(BasicPlayer):
         name_color (:obj:`str`): Specific color of name.
         role (:obj:`Literal["member", "senior", "vicePresident", "president"]`): Role in club.
         trophies (:obj:`int`): Trophies of member.
+        icon_id (:obj:`int`): ID of member icon.
+        icon (:obj:`dict`): Icon of member with `id`, read-only.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("tag", "name", "name_color", "role", "trophies")
+    _nested = {"icon": ("icon_id", "id")}
+    __slots__ = _fields + ("icon_id",)
+
+    def __init__(self, my_data, http: HTTPClient) -> None:
+        super().__init__(http)
 
         self.tag: str = ""
         self.name: str = ""
         self.name_color: str = ""
         self.role: Literal["member", "senior", "vicePresident", "president"] = "member"
         self.trophies: int = 0
+        self.icon_id: int = 0
 
-        for value in my_data:
-            setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), my_data[value])
+        self._load(my_data)
+
+    @property
+    def icon(self) -> dict:
+        """
+        Icon of member as in json of API, e.g. `{"id": 28000000}`.
+        """
+        return {"id": self.icon_id}
 
     def __repr__(self):
         return f"<Member object name='{self.name}' role='{self.role}'>"
@@ -464,8 +743,12 @@ class RankedClub(RequestsModel):
         member_count (:obj:`int`): Number of members in this club.
         ranked_country_code (:obj:`str`): Country code of this ranked club in ranking function.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("tag", "name", "badge_id", "trophies", "rank", "member_count")
+    _aliases = {"ranked_country_code": "ranked_country_code"}
+    __slots__ = _fields + ("ranked_country_code",)
+
+    def __init__(self, my_data, http: HTTPClient) -> None:
+        super().__init__(http)
         self.tag: str = ""
         self.name: str = ""
         self.badge_id: int = 0
@@ -474,8 +757,7 @@ class RankedClub(RequestsModel):
         self.member_count: int = 0
         self.ranked_country_code: str = ""
 
-        for value in my_data:
-            setattr(self, re.sub(r'(?<!^)(?=[A-Z])', '_', value).lower(), my_data[value])
+        self._load(my_data)
 
     def __repr__(self) -> str:
         return f"<RankedClub object name='{self.name}' rank='{self.tag}'>"
@@ -487,8 +769,8 @@ class RankedClub(RequestsModel):
         Return:
             `Club`: `Club` class
         """
-        club_data = await self._create_request(f"clubs/{self._hashtag(self.tag)}")
-        club = Club(club_data, self._token)
+        club_data, digest = await self._create_digest_request(f"clubs/{self._hashtag(self.tag)}")
+        club = Club(club_data, self._http, digest)
         return club
 
 
@@ -502,23 +784,27 @@ class RankedPlayer(BasicPlayer):
         trophies (:obj:`int`): Total trophies in club.
         rank (:obj:`int`): Rank of player in ranking function.
         club_name (:obj:`str`): Name of club when player is joined.
+        icon_id (:obj:`int`): ID of player icon.
         ranked_country_code (:obj:`str`): Country code of this ranked club in ranking function.
     """
-    def __init__(self, my_data, APIToken) -> None:
-        super().__init__(APIToken)
+    _fields = ("tag", "name", "name_color", "trophies", "rank")
+    _aliases = {"ranked_country_code": "ranked_country_code"}
+    _nested = {"club": ("club_name", "name"), "icon": ("icon_id", "id")}
+    __slots__ = _fields + ("club_name", "icon_id", "ranked_country_code")
+
+    def __init__(self, my_data, http: HTTPClient) -> None:
+        super().__init__(http)
 
         self.tag: str = ""
         self.name: str = ""
+        self.name_color: str = ""
         self.trophies: int = 0
         self.rank: int = 0
         self.club_name: str = ""
+        self.icon_id: int = 0
         self.ranked_country_code: str = ""
 
-        for value in my_data:
-            if value == "club":
-                setattr(self, "club_name", my_data[value]["name"])
-            elif value != "icon":
-                setattr(self, value, my_data[value]["id"])
+        self._load(my_data)
 
     def __repr__(self) -> str:
         return f"<RankedPlayer object name='{self.name}' rank='{self.rank}'>"
@@ -0,0 +1,343 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Column name -> path of keys in json item of the endpoint.
+RANKING_PLAYER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "tag": ("tag",),
+    "name": ("name",),
+    "name_color": ("nameColor",),
+    "icon_id": ("icon", "id"),
+    "trophies": ("trophies",),
+    "rank": ("rank",),
+    "club_name": ("club", "name"),
+}
+
+RANKING_CLUB_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "tag": ("tag",),
+    "name": ("name",),
+    "badge_id": ("badgeId",),
+    "trophies": ("trophies",),
+    "rank": ("rank",),
+    "member_count": ("memberCount",),
+}
+
+MEMBER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "tag": ("tag",),
+    "name": ("name",),
+    "name_color": ("nameColor",),
+    "role": ("role",),
+    "trophies": ("trophies",),
+    "icon_id": ("icon", "id"),
+}
+
+BRAWLER_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "name": ("name",),
+    "power": ("power",),
+    "rank": ("rank",),
+    "trophies": ("trophies",),
+    "highest_trophies": ("highestTrophies",),
+}
+
+BATTLELOG_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "battle_time": ("battleTime",),
+    "event_id": ("event", "id"),
+    "mode": ("battle", "mode"),
+    "map": ("event", "map"),
+    "type": ("battle", "type"),
+    "result": ("battle", "result"),
+    "rank": ("battle", "rank"),
+    "duration": ("battle", "duration"),
+    "trophy_change": ("battle", "trophyChange"),
+    "star_player_tag": ("battle", "starPlayer", "tag"),
+}
+
+# Numpy types of known columns, other columns are strings or objects.
+# Integer column with missing values becomes float64 with nan.
+COLUMN_DTYPES: Dict[str, str] = {
+    "id": "int64",
+    "event_id": "int64",
+    "icon_id": "int64",
+    "badge_id": "int64",
+    "power": "int64",
+    "rank": "int64",
+    "trophies": "int64",
+    "highest_trophies": "int64",
+    "member_count": "int64",
+    "duration": "int64",
+    "trophy_change": "int64",
+    "brawler_id": "int64",
+    "brawler_power": "int64",
+    "brawler_trophies": "int64",
+    "battle_time": "datetime64[s]",
+}
+
+
+def _lookup(item: dict, path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    return item
+
+
+def _battle_times(values: list) -> list:
+    # "20241105T101500.000Z" -> "2024-11-05T10:15:00", which numpy parses as datetime64.
+    return [
+        f"{value[0:4]}-{value[4:6]}-{value[6:8]}T{value[9:11]}:{value[11:13]}:{value[13:15]}"
+        if value else "NaT"
+        for value in values
+    ]
+
+
+def _normalise_tag(tag: str) -> str:
+    # Same forms of tag as the client accepts: "ABC", "#abc" or url-encoded "%23ABC".
+    tag = tag.strip().upper()
+    if tag.startswith("%23"):
+        tag = tag[3:]
+    return tag if tag.startswith("#") else "#" + tag
+
+
+def _to_array(name: str, values: list, dtype: Optional[str]):
+    if dtype is None:
+        if values and all(isinstance(value, str) for value in values):
+            return numpy.array(values, dtype=str)
+        return numpy.array(values, dtype=object)
+    if dtype.startswith("datetime64"):
+        return numpy.array(_battle_times(values) if name == "battle_time" else values, dtype=dtype)
+    if None in values:
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype="float64")
+    return numpy.array(values, dtype=dtype)
+
+
+class Columns:
+    """
+    Column oriented table: one list of values per column, all of the same length.
+
+    Args:
+        data (:obj:`Dict[str, list]`): Lists of values by column name.
+    """
+
+    def __init__(self, data: Optional[Dict[str, list]] = None) -> None:
+        self.data: Dict[str, list] = dict(data or {})
+        lengths = {len(values) for values in self.data.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length.")
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[dict], spec: Dict[str, Tuple[str, ...]], constants: Optional[Dict[str, Any]] = None
+    ) -> "Columns":
+        """
+        Build table straight from json items without creating model objects.
+
+        Args:
+            items (:obj:`Iterable[dict]`): Json items of the endpoint.
+            spec (:obj:`Dict[str, Tuple[str, ...]]`): Path of keys in item by column name.
+            constants (:obj:`Dict[str, Any]`): Columns with the same value in every row.
+
+        Return:
+            `Columns`: Table with one row per item.
+        """
+        data: Dict[str, list] = {name: [] for name in spec}
+        count = 0
+        for item in items:
+            for name, path in spec.items():
+                data[name].append(item.get(path[0]) if len(path) == 1 else _lookup(item, path))
+            count += 1
+        for name, value in (constants or {}).items():
+            data[name] = [value] * count
+        return cls(data)
+
+    @classmethod
+    def concat(cls, tables: Iterable["Columns"]) -> "Columns":
+        """
+        Join tables with the same columns one after another.
+
+        Args:
+            tables (:obj:`Iterable[Columns]`): Tables to join.
+
+        Return:
+            `Columns`: Joined table.
+        """
+        data: Dict[str, list] = {}
+        for table in tables:
+            if not data:
+                data = {name: list(values) for name, values in table.data.items()}
+                continue
+            if table.names != list(data):
+                raise ValueError("Tables must have the same columns.")
+            for name, values in table.data.items():
+                data[name].extend(values)
+        return cls(data)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.data)
+
+    def __len__(self) -> int:
+        for values in self.data.values():
+            return len(values)
+        return 0
+
+    def __getitem__(self, name: str) -> list:
+        return self.data[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.data
+
+    def to_numpy(self, dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Convert columns to typed numpy arrays, e.g. `trophies` to int64 and `battle_time` to datetime64.
+        Requires numpy.
+
+        Args:
+            dtypes (:obj:`Dict[str, str]`): Numpy types by column name on top of `COLUMN_DTYPES`.
+
+        Return:
+            `Dict[str, numpy.ndarray]`: Array by column name.
+        """
+        if numpy is None:
+            raise ImportError("numpy is required for to_numpy(), install it with `pip install numpy`.")
+        types = {**COLUMN_DTYPES, **(dtypes or {})}
+        return {name: _to_array(name, values, types.get(name)) for name, values in self.data.items()}
+
+    def to_arrow(self, dtypes: Optional[Dict[str, str]] = None):
+        """
+        Convert columns to pyarrow table. Requires numpy and pyarrow.
+
+        Args:
+            dtypes (:obj:`Dict[str, str]`): Numpy types by column name on top of `COLUMN_DTYPES`.
+
+        Return:
+            `pyarrow.Table`: Table with typed columns.
+        """
+        if pyarrow is None:
+            raise ImportError("pyarrow is required for to_arrow(), install it with `pip install pyarrow`.")
+        return pyarrow.table(self.to_numpy(dtypes))
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over rows of the table.
+
+        Return:
+            `Iterator[Dict[str, Any]]`: Row as dict of values by column name.
+        """
+        names = self.names
+        for values in zip(*self.data.values()):
+            yield dict(zip(names, values))
+
+    def __repr__(self) -> str:
+        return f"<Columns object rows='{len(self)}' columns='{len(self.data)}'>"
+
+
+def ranking_to_columns(data: dict, countrycode: Optional[str] = None, kind: str = "players") -> Columns:
+    """
+    Build table from json of `rankings` endpoint without creating `RankedPlayer` or `RankedClub` objects.
+
+    Args:
+        data (:obj:`dict`): Response of rankings endpoint, e.g. `get_ranking_players(raw=True)`.
+        countrycode (:obj:`str`): Country code of ranking, added as `ranked_country_code` column.
+        kind (:obj:`Literal["players", "clubs"]`): Ranking of players (also of brawler) or clubs.
+
+    Return:
+        `Columns`: One row per ranked player or club.
+    """
+    spec = RANKING_CLUB_COLUMNS if kind == "clubs" else RANKING_PLAYER_COLUMNS
+    constants = {"ranked_country_code": countrycode.upper()} if countrycode is not None else None
+    return Columns.from_items(data["items"], spec, constants)
+
+
+def brawlers_to_columns(data: Union[dict, List[dict]], tag: Optional[str] = None) -> Columns:
+    """
+    Build table of brawlers from json of player without creating `Brawler` objects.
+
+    Args:
+        data (:obj:`Union[dict, List[dict]]`): Response of `players` endpoint or its list of brawlers.
+        tag (:obj:`str`): Tag player, added as `tag` column (`None` - tag of the player json if present).
+
+    Return:
+        `Columns`: One row per brawler.
+    """
+    if isinstance(data, dict):
+        tag = tag if tag is not None else data.get("tag")
+        data = data.get("brawlers", [])
+    return Columns.from_items(data, BRAWLER_COLUMNS, {"tag": tag} if tag is not None else None)
+
+
+def members_to_columns(data: dict) -> Columns:
+    """
+    Build table of members from json of club without creating `Member` objects.
+
+    Args:
+        data (:obj:`dict`): Response of `clubs` or `clubs/{tag}/members` endpoint.
+
+    Return:
+        `Columns`: One row per member with `club_tag` column when tag of club is known.
+    """
+    items = data["members"] if "members" in data else data["items"]
+    return Columns.from_items(items, MEMBER_COLUMNS, {"club_tag": data["tag"]} if "tag" in data else None)
+
+
+def battlelog_to_columns(data: dict, tag: Optional[str] = None) -> Columns:
+    """
+    Build table from json of `battlelog` endpoint without creating `Battle` objects.
+
+    Args:
+        data (:obj:`dict`): Response of battlelog endpoint, e.g. `get_player_battlelog(tag, raw=True)`.
+        tag (:obj:`str`): Tag player, added as `tag` column.
+
+    Return:
+        `Columns`: One row per battle.
+    """
+    return Columns.from_items(data["items"], BATTLELOG_COLUMNS, {"tag": tag} if tag is not None else None)
+
+
+def battle_players_to_columns(data: dict, tag: str) -> Columns:
+    """
+    Build table of all participants of battles from json of `battlelog` endpoint.
+    Side of every participant is relative to the owner of battlelog: "self", "teammate" or "opponent".
+
+    Args:
+        data (:obj:`dict`): Response of battlelog endpoint, e.g. `get_player_battlelog(tag, raw=True)`.
+        tag (:obj:`str`): Tag player who owns the battlelog, with or without "#".
+
+    Return:
+        `Columns`: One row per participant of every battle.
+    """
+    tag = _normalise_tag(tag)
+    names = (
+        "tag", "battle_time", "mode", "map", "result", "rank", "trophy_change",
+        "battler_tag", "brawler_id", "brawler_power", "brawler_trophies", "side",
+    )
+    columns: Dict[str, list] = {name: [] for name in names}
+    for item in data["items"]:
+        battle = item.get("battle", {})
+        teams = battle.get("teams") or [[player] for player in battle.get("players", [])]
+        own = next((index for index, team in enumerate(teams) if any(player.get("tag") == tag for player in team)), None)
+        common = (
+            tag, item.get("battleTime"), battle.get("mode"), item.get("event", {}).get("map"),
+            battle.get("result"), battle.get("rank"), battle.get("trophyChange"),
+        )
+        for index, team in enumerate(teams):
+            for player in team:
+                brawler = player.get("brawler") or (player.get("brawlers") or [{}])[0]
+                if player.get("tag") == tag:
+                    side = "self"
+                else:
+                    side = "teammate" if index == own else "opponent"
+                row = common + (
+                    player.get("tag"), brawler.get("id"), brawler.get("power"), brawler.get("trophies"), side,
+                )
+                for name, value in zip(names, row):
+                    columns[name].append(value)
+    return Columns(columns)
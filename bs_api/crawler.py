@@ -0,0 +1,227 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterable, List, Literal, Optional, Tuple, Union
+import asyncio
+import os
+
+from .classes import Battle, Club, Player, RequestsModel
+from .columns import battlelog_to_columns, brawlers_to_columns, members_to_columns
+from .errors import ClientError
+from .http import HTTPClient, default_json_loads
+from .bulk import iter_bounded
+
+Kind = Literal["player", "club", "battlelog"]
+Parse = Union[Literal["json", "models", "columns"], Callable[[str, Any], Any]]
+
+_loads = None
+
+
+def _build(kind: str, parse: Parse, tag: str, data: Any) -> Any:
+    if callable(parse):
+        return parse(tag, data)
+    if parse == "json":
+        return data
+    if parse == "models":
+        if kind == "player":
+            return Player(data, None)
+        if kind == "club":
+            return Club(data, None)
+        return [Battle(item, None) for item in data["items"]]
+    if kind == "player":
+        return brawlers_to_columns(data, tag)
+    if kind == "club":
+        return members_to_columns(data)
+    return battlelog_to_columns(data, tag)
+
+
+def parse_batch(kind: str, parse: Parse, batch: List[Tuple[str, bytes]]) -> List[Tuple[str, Any]]:
+    """
+    Decode raw bodies and build results, runs inside worker process of `Crawler`.
+
+    Args:
+        kind (:obj:`Literal["player", "club", "battlelog"]`): Endpoint of bodies.
+        parse (:obj:`Union[str, Callable]`): "json", "models", "columns" or picklable function of tag and json.
+        batch (:obj:`List[Tuple[str, bytes]]`): Tags and raw bodies.
+
+    Return:
+        `List[Tuple[str, Any]]`: Tags and results.
+    """
+    global _loads
+    if _loads is None:
+        _loads = default_json_loads()
+    return [(tag, _build(kind, parse, tag, _loads(body))) for tag, body in batch]
+
+
+def attach_http(obj: Any, http: HTTPClient) -> Any:
+    """
+    Attach http client to models built in another process, so their requests work again.
+
+    Args:
+        obj (:obj:`Any`): Model, list of models or other result.
+        http (:obj:`HTTPClient`): Shared http client.
+
+    Return:
+        `Any`: The same object.
+    """
+    if isinstance(obj, list):
+        for item in obj:
+            attach_http(item, http)
+    elif isinstance(obj, RequestsModel):
+        obj._http = http
+        for cls in type(obj).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name.startswith("_"):
+                    continue
+                # Read slot through its descriptor, so lazy models are not decoded by `__getattr__`.
+                try:
+                    value = cls.__dict__[name].__get__(obj, cls)
+                except AttributeError:
+                    continue
+                if isinstance(value, (list, RequestsModel)):
+                    attach_http(value, http)
+    return obj
+
+
+class Crawler:
+    """
+    Crawler which keeps requests on the event loop and moves json decoding and parsing to a process pool.
+    Raw bodies are sent to worker processes in batches. Number of batches in flight is bounded,
+    so fetching pauses when parsing or the consumer can not keep up.
+
+    Args:
+        client (:obj:`RequestsModel`): Client to Brawl Stars API, e.g. `ClientBS`.
+        kind (:obj:`Literal["player", "club", "battlelog"]`): Endpoint to crawl.
+        parse (:obj:`Union[Literal["json", "models", "columns"], Callable[[str, Any], Any]]`): Result of every tag:
+            "json" - decoded json, "models" - `Player`, `Club` or `List[Battle]`,
+            "columns" - `Columns` of brawlers, members or battles, or picklable function of tag and json.
+        processes (:obj:`int`): Number of worker processes (`None` - number of cores, 0 - parse in event loop).
+        concurrency (:obj:`int`): Maximum number of simultaneous requests.
+        batch_size (:obj:`int`): Number of bodies sent to worker at once.
+        max_pending_batches (:obj:`int`): Maximum number of batches which are parsed or wait for consumer
+            (`None` - twice number of processes).
+        executor (:obj:`Executor`): Own executor instead of process pool created by crawler.
+    """
+
+    kinds = ("player", "club", "battlelog")
+
+    def __init__(
+        self,
+        client: RequestsModel,
+        kind: Kind = "player",
+        parse: Parse = "models",
+        processes: Optional[int] = None,
+        concurrency: int = 50,
+        batch_size: int = 32,
+        max_pending_batches: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if kind not in self.kinds:
+            raise ValueError(f"Unknown kind {kind!r}, use one of {self.kinds}.")
+        if not callable(parse) and parse not in ("json", "models", "columns"):
+            raise ValueError(f"Unknown parse {parse!r}, use 'json', 'models', 'columns' or function.")
+
+        self.client = client
+        self.kind = kind
+        self.parse = parse
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.max_pending_batches = max_pending_batches or max(2, 2 * self.processes)
+
+        self._own_executor = executor is None and self.processes > 0
+        self.executor = executor
+        if self._own_executor:
+            self.executor = ProcessPoolExecutor(self.processes)
+
+    async def _fetch(self, tag: str) -> bytes:
+        if self.kind == "player":
+            return await self.client.get_player(tag, raw="bytes")
+        if self.kind == "club":
+            return await self.client.get_club(tag, raw="bytes")
+        return await self.client.get_player_battlelog(tag, raw="bytes")
+
+    async def _parse(self, batch: List[Tuple[str, bytes]]) -> List[Tuple[str, Any]]:
+        if self.executor is None:
+            return parse_batch(self.kind, self.parse, batch)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_batch, self.kind, self.parse, batch)
+
+    async def crawl(self, tags: Iterable[str]) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Crawl tags and yield results as their batches are parsed.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags, consumed lazily.
+
+        Return:
+            `AsyncIterator[Tuple[str, Any]]`: Tag and result or `ClientError` of the request.
+        """
+        slots = asyncio.Semaphore(self.max_pending_batches)
+        output: asyncio.Queue = asyncio.Queue()
+        tasks: set = set()
+
+        async def submit(batch: List[Tuple[str, bytes]]) -> None:
+            await slots.acquire()
+            task = asyncio.ensure_future(self._parse(batch))
+            tasks.add(task)
+            task.add_done_callback(output.put_nowait)
+
+        async def produce() -> int:
+            batches = 0
+            batch: List[Tuple[str, bytes]] = []
+            async for _, tag, body in iter_bounded(self._fetch, tags, self.concurrency):
+                if isinstance(body, ClientError):
+                    output.put_nowait([(tag, body)])
+                    continue
+                batch.append((tag, body))
+                if len(batch) >= self.batch_size:
+                    await submit(batch)
+                    batches += 1
+                    batch = []
+            if batch:
+                await submit(batch)
+                batches += 1
+            return batches
+
+        producer = asyncio.ensure_future(produce())
+        producer.add_done_callback(output.put_nowait)
+        total: Optional[int] = None
+        received = 0
+        try:
+            while total is None or received < total:
+                entry = await output.get()
+                if entry is producer:
+                    total = producer.result()
+                    continue
+                if isinstance(entry, asyncio.Future):
+                    # Slot is released when results reach the consumer, not when parsing ends.
+                    tasks.discard(entry)
+                    slots.release()
+                    received += 1
+                    entry = entry.result()
+                for tag, result in entry:
+                    if self.parse == "models":
+                        # Models are built without client both in workers and in the event loop.
+                        attach_http(result, self.client._http)
+                    yield tag, result
+        finally:
+            producer.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(producer, *tasks, return_exceptions=True)
+
+    def close(self) -> None:
+        """
+        Shut down process pool created by crawler.
+        """
+        if self._own_executor and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    async def __aenter__(self) -> "Crawler":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<Crawler kind='{self.kind}' processes='{self.processes}'>"
@@ -0,0 +1,181 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import hashlib
+
+PLAYER_DIFF_FIELDS: Tuple[str, ...] = (
+    "name", "name_color", "trophies", "highest_trophies", "exp_level", "exp_points",
+    "victories3vs3", "solo_victories", "duo_victories", "best_robo_rumble_time",
+    "best_time_as_big_brawler", "is_qualified_from_championship_challenge",
+)
+BRAWLER_DIFF_FIELDS: Tuple[str, ...] = ("power", "rank", "trophies", "highest_trophies")
+BRAWLER_ITEM_FIELDS: Tuple[str, ...] = ("star_powers", "gadgets", "gears")
+CLUB_DIFF_FIELDS: Tuple[str, ...] = ("name", "description", "type", "badge_id", "required_trophies", "trophies")
+MEMBER_DIFF_FIELDS: Tuple[str, ...] = ("name", "name_color", "role", "trophies", "icon_id")
+
+Changes = Dict[str, Tuple[Any, Any]]
+
+
+def payload_digest(body: bytes) -> str:
+    """
+    Get fast hash of raw body of response, equal bodies have equal digests.
+
+    Args:
+        body (:obj:`bytes`): Raw body of response.
+
+    Return:
+        `str`: Hex digest.
+    """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _compare(old, new, fields: Iterable[str]) -> Changes:
+    changes = {}
+    for field in fields:
+        before = getattr(old, field, None)
+        after = getattr(new, field, None)
+        if before != after:
+            changes[field] = (before, after)
+    return changes
+
+
+def _item_ids(items: Optional[list]) -> List[int]:
+    return sorted(item["id"] for item in items or ())
+
+
+class PlayerDiff:
+    """
+    Changes of player between two snapshots.
+
+    Args:
+        tag (:obj:`str`): Tag player.
+        changed (:obj:`Dict[str, Tuple[Any, Any]]`): Old and new value by name of changed field.
+        brawlers (:obj:`Dict[int, Dict[str, Tuple[Any, Any]]]`): Changed fields by id of brawler
+            (star powers, gadgets and gears are compared as sorted lists of ids).
+        new_brawlers (:obj:`List[Brawler]`): Brawlers which were unlocked.
+    """
+
+    __slots__ = ("tag", "changed", "brawlers", "new_brawlers")
+
+    def __init__(self, tag: str, changed: Optional[Changes] = None,
+                 brawlers: Optional[Dict[int, Changes]] = None, new_brawlers: Optional[list] = None) -> None:
+        self.tag = tag
+        self.changed: Changes = changed or {}
+        self.brawlers: Dict[int, Changes] = brawlers or {}
+        self.new_brawlers: list = new_brawlers or []
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.brawlers or self.new_brawlers)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlayerDiff tag='{self.tag}' changed='{list(self.changed)}' "
+            f"brawlers='{len(self.brawlers)}' new_brawlers='{len(self.new_brawlers)}'>"
+        )
+
+
+class ClubDiff:
+    """
+    Changes of club between two snapshots.
+
+    Args:
+        tag (:obj:`str`): Tag club.
+        changed (:obj:`Dict[str, Tuple[Any, Any]]`): Old and new value by name of changed field.
+        joined (:obj:`List[Member]`): Members which joined the club.
+        left (:obj:`List[Member]`): Members which left the club.
+        members (:obj:`Dict[str, Dict[str, Tuple[Any, Any]]]`): Changed fields (e.g. `role`, `trophies`)
+            by tag of member which stayed in the club.
+    """
+
+    __slots__ = ("tag", "changed", "joined", "left", "members")
+
+    def __init__(self, tag: str, changed: Optional[Changes] = None, joined: Optional[list] = None,
+                 left: Optional[list] = None, members: Optional[Dict[str, Changes]] = None) -> None:
+        self.tag = tag
+        self.changed: Changes = changed or {}
+        self.joined: list = joined or []
+        self.left: list = left or []
+        self.members: Dict[str, Changes] = members or {}
+
+    def __bool__(self) -> bool:
+        return bool(self.changed or self.joined or self.left or self.members)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ClubDiff tag='{self.tag}' changed='{list(self.changed)}' "
+            f"joined='{len(self.joined)}' left='{len(self.left)}' members='{len(self.members)}'>"
+        )
+
+
+def _same_payload(old, new) -> bool:
+    return old.digest is not None and old.digest == new.digest
+
+
+def diff_players(old, new) -> PlayerDiff:
+    """
+    Compare two snapshots of player.
+
+    Args:
+        old (:obj:`Player`): Older snapshot.
+        new (:obj:`Player`): Newer snapshot.
+
+    Return:
+        `PlayerDiff`: Changes, empty when digests of both payloads are equal.
+    """
+    if _same_payload(old, new):
+        return PlayerDiff(new.tag)
+
+    changed = _compare(old, new, PLAYER_DIFF_FIELDS)
+    old_club = (old._club or {}).get("tag")
+    new_club = (new._club or {}).get("tag")
+    if old_club != new_club:
+        changed["club_tag"] = (old_club, new_club)
+    if old._icon.get("id") != new._icon.get("id"):
+        changed["icon_id"] = (old._icon.get("id"), new._icon.get("id"))
+
+    before = {brawler.id: brawler for brawler in old.brawlers}
+    brawlers = {}
+    new_brawlers = []
+    for brawler in new.brawlers:
+        previous = before.get(brawler.id)
+        if previous is None:
+            new_brawlers.append(brawler)
+            continue
+        changes = _compare(previous, brawler, BRAWLER_DIFF_FIELDS)
+        for field in BRAWLER_ITEM_FIELDS:
+            old_ids = _item_ids(getattr(previous, field))
+            new_ids = _item_ids(getattr(brawler, field))
+            if old_ids != new_ids:
+                changes[field] = (old_ids, new_ids)
+        if changes:
+            brawlers[brawler.id] = changes
+
+    return PlayerDiff(new.tag, changed, brawlers, new_brawlers)
+
+
+def diff_clubs(old, new) -> ClubDiff:
+    """
+    Compare two snapshots of club.
+
+    Args:
+        old (:obj:`Club`): Older snapshot.
+        new (:obj:`Club`): Newer snapshot.
+
+    Return:
+        `ClubDiff`: Changes, empty when digests of both payloads are equal.
+    """
+    if _same_payload(old, new):
+        return ClubDiff(new.tag)
+
+    changed = _compare(old, new, CLUB_DIFF_FIELDS)
+    before = {member.tag: member for member in old.members}
+    after = {member.tag: member for member in new.members}
+
+    joined = [member for tag, member in after.items() if tag not in before]
+    left = [member for tag, member in before.items() if tag not in after]
+    members = {}
+    for tag, member in after.items():
+        if tag in before:
+            changes = _compare(before[tag], member, MEMBER_DIFF_FIELDS)
+            if changes:
+                members[tag] = changes
+
+    return ClubDiff(new.tag, changed, joined, left, members)
@@ -47,3 +47,15 @@ class ServiceError(ClientError):
         message: str = "Service is temporarily unavailable because of maintenance.",
     ) -> None:
         super().__init__(message)
+
+
+class NetworkError(ClientError):
+    def __init__(
+        self, message: str = "Connection to the API failed or timed out after all retries."
+    ) -> None:
+        super().__init__(message)
+
+
+class ReplayError(ClientError):
+    def __init__(self, message: str = "Response was not recorded.") -> None:
+        super().__init__(message)
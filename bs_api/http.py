@@ -0,0 +1,347 @@
+from aiohttp import ClientSession
+from aiohttp import TCPConnector
+from aiohttp import ClientConnectionError
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Mapping, Optional, Tuple, Union
+from functools import partial
+import asyncio
+import json
+import time
+
+from .errors import *
+from .ratelimit import TokenPool, backoff_delay, parse_retry_after
+from .cache import BaseCache, CacheEntry, MemoryCache
+from .metrics import RequestHooks
+from .transport import BaseTransport, SessionTransport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def default_json_loads() -> Callable[[bytes], Any]:
+    """
+    Get the fastest available json decoder: `orjson.loads` when orjson is installed, else `json.loads`.
+
+    Return:
+        `Callable[[bytes], Any]`: Function which decodes json from bytes.
+    """
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
+class HTTPClient:
+    """
+    Shared HTTP client which owns one pooled session for all requests to Brawl Stars API.
+
+    Args:
+        APIToken (:obj:`Union[str, List[str]]`): Special token or list of tokens for requests.
+        limit (:obj:`int`): Total number of simultaneous connections in the pool.
+        limit_per_host (:obj:`int`): Number of simultaneous connections to one host (0 - no limit).
+        keepalive_timeout (:obj:`float`): Seconds to keep an idle connection open.
+        ttl_dns_cache (:obj:`int`): Seconds to cache resolved DNS records.
+        requests_per_second (:obj:`float`): Client side rate limit of every token (`None` - no limit).
+        burst (:obj:`int`): Maximum number of requests which can be made at once with one token.
+        token_strategy (:obj:`Literal["round_robin", "least_throttled"]`): How to spread requests across tokens.
+        max_retries (:obj:`int`): Number of retries after throttling, maintenance or connection reset.
+        backoff_base (:obj:`float`): Delay of the first retry in seconds.
+        backoff_max (:obj:`float`): Maximum delay between retries in seconds.
+        cache (:obj:`Union[bool, BaseCache]`): Response cache (`True` - in-memory LRU, `None` - no cache).
+        coalesce (:obj:`bool`): Share one in-flight request between identical concurrent requests.
+        json_loads (:obj:`Callable[[bytes], Any]`): Json decoder (`None` - orjson if installed, else json).
+        base_url (:obj:`str`): Root url of the API, e.g. of a local mock server.
+        hooks (:obj:`List[RequestHooks]`): Hooks called around every request, e.g. `MetricsCollector`.
+        transport (:obj:`BaseTransport`): Where requests to API go, e.g. `RecordingTransport` or `ReplayTransport`
+            (`None` - the shared session).
+    """
+
+    retry_statuses = (429, 503)
+
+    def __init__(
+        self,
+        APIToken: Union[str, List[str]],
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int = 300,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        token_strategy: Literal["round_robin", "least_throttled"] = "round_robin",
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        cache: Union[bool, BaseCache, None] = None,
+        coalesce: bool = True,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        base_url: str = "https://api.brawlstars.com/v1/",
+        hooks: Optional[List[RequestHooks]] = None,
+        transport: Optional[BaseTransport] = None,
+    ) -> None:
+        self.tokens = TokenPool(APIToken, requests_per_second, burst, token_strategy)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        # Empty `MemoryCache` is falsy (`__len__`), so cache is checked by type.
+        self.cache: Optional[BaseCache] = MemoryCache() if cache is True else (cache if isinstance(cache, BaseCache) else None)
+        self.coalesce = coalesce
+        self.json_loads = json_loads or default_json_loads()
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+
+        self._session: Optional[ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self.transport = transport or SessionTransport()
+        self.transport.bind(self)
+
+        self.hooks: List[RequestHooks] = []
+        for hook in hooks or ():
+            self.add_hook(hook)
+
+    def add_hook(self, hook: RequestHooks) -> None:
+        """
+        Add hooks which are called around every request.
+
+        Args:
+            hook (:obj:`RequestHooks`): Hooks, e.g. `MetricsCollector`.
+        """
+        hook.bind(self)
+        self.hooks.append(hook)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Get usage of the connection pool.
+
+        Return:
+            `Dict[str, int]`: `limit` of connections and number of `acquired` connections.
+        """
+        connector = None if self.closed else self._session.connector
+        acquired = len(getattr(connector, "_acquired", ())) if connector is not None else 0
+        return {"limit": self.limit, "acquired": acquired}
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    def _get_session(self) -> ClientSession:
+        # The session is created lazily, so a client can be built outside of a running event loop.
+        # Session belongs to the loop where it was made, so a client used from another loop
+        # (e.g. module-level client in several `asyncio.run()` calls) gets a new session.
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            self._drop_session()
+        if self.closed:
+            self._loop = loop
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    ssl=False,
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                )
+            )
+        return self._session
+
+    def _drop_session(self) -> None:
+        # Session of another loop is closed in background, connections of a finished loop are only released.
+        session, self._session = self._session, None
+        self._loop = None
+        self._inflight.clear()
+        self.tokens.rebind()
+        if session is not None and not session.closed:
+            task = asyncio.ensure_future(session.close())
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def _raise_for_status(self, status: int) -> None:
+        if status == 400:
+            raise IncorrectError()
+        elif status == 403:
+            raise AccessError()
+        elif status == 404:
+            raise ResourceError()
+        elif status == 429:
+            raise RequestsLimitError()
+        elif status == 503:
+            raise ServiceError()
+        else:
+            raise UnknownError(
+                f"Unknown error happened when handling the request with {status} status."
+            )
+
+    async def _send(
+        self, url: str, token: str, headers: Optional[dict] = None
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        return await self.transport.send(url, {"Authorization": f"Bearer {token}", **(headers or {})})
+
+    async def request(self, url: str, return_content: bool = False):
+        """
+        Make GET request through the shared session.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+            return_content (:obj:`bool`): Return raw bytes of body instead of decoded json.
+
+        Return:
+            `dict` or `bytes`: Decoded json or raw body.
+        """
+        body = await self.fetch(url)
+        return body if return_content else self.json_loads(body)
+
+    async def fetch(self, url: str) -> bytes:
+        """
+        Get raw body of url, from the cache when it is fresh.
+        Stale cached response with `ETag` is revalidated by `If-None-Match` and 304 counts as hit.
+        Concurrent requests of the same url share one in-flight request, every caller decodes body itself.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+
+        Return:
+            `bytes`: Raw body of the response.
+        """
+        if not self.coalesce:
+            return await self._fetch_cached(url)
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_cached(url))
+            self._inflight[url] = task
+            task.add_done_callback(partial(self._finish_inflight, url))
+        # Shield, so cancelled caller does not cancel request of other callers.
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, url: str, task: asyncio.Future) -> None:
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        if not task.cancelled():
+            # Mark exception as retrieved even if every caller was cancelled.
+            task.exception()
+
+    async def _fetch_cached(self, url: str) -> bytes:
+        if self.cache is None:
+            return (await self._fetch(url))[1]
+
+        entry = await self.cache.get(url)
+        if entry is not None and entry.fresh:
+            for hook in self.hooks:
+                hook.on_cache_hit(url, False)
+            return entry.body
+
+        validators = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        headers, body = await self._fetch(url, validators)
+        if body is None:
+            body = entry.body
+            for hook in self.hooks:
+                hook.on_cache_hit(url, True)
+
+        ttl = self.cache.ttl_for(url, headers)
+        if ttl is not None and (ttl > 0 or headers.get("ETag")):
+            await self.cache.set(url, CacheEntry(body, headers.get("ETag"), time.time() + ttl))
+        return body
+
+    async def _fetch(
+        self, url: str, validators: Optional[dict] = None
+    ) -> Tuple[Mapping[str, str], Optional[bytes]]:
+        # Throttled (429), unavailable (503) and reset requests are retried with exponential backoff,
+        # throttled token is put on cooldown and retry goes through the next token of the pool.
+        attempt = 0
+        while True:
+            state = await self.tokens.acquire()
+
+            for hook in self.hooks:
+                hook.on_request_start(url)
+            started = time.perf_counter()
+            try:
+                status, headers, body = await self._send(url, state.token, validators)
+            except (ClientConnectionError, asyncio.TimeoutError) as error:
+                for hook in self.hooks:
+                    hook.on_request_end(url, None, time.perf_counter() - started, 0, error)
+                if attempt >= self.max_retries:
+                    # Network failure is a `ClientError` too, so bulk methods return it for the tag.
+                    raise NetworkError(f"Connection to the API failed after all retries: {error!r}") from error
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max)
+                for hook in self.hooks:
+                    hook.on_retry(url, attempt, error, delay)
+            except BaseException as error:
+                # Cancelled or failed request still ends, so gauges of hooks stay balanced.
+                for hook in self.hooks:
+                    hook.on_request_end(url, None, time.perf_counter() - started, 0, error)
+                raise
+            else:
+                for hook in self.hooks:
+                    hook.on_request_end(url, status, time.perf_counter() - started, len(body))
+                if status == 200:
+                    return headers, body
+                if status == 304 and validators:
+                    return headers, None
+                if status not in self.retry_statuses or attempt >= self.max_retries:
+                    self._raise_for_status(status)
+
+                # `Retry-After` is only a floor: jittered exponential backoff is added on top of it,
+                # so concurrent throttled requests do not come back at the same instant.
+                delay = (parse_retry_after(headers.get("Retry-After")) or 0.0) + backoff_delay(
+                    attempt, self.backoff_base, self.backoff_max
+                )
+                if status == 429:
+                    # Throttled token is put on cooldown, the pool waits for it or takes another ready token.
+                    self.tokens.throttled(state, delay)
+                    wait = self.tokens.wait()
+                    for hook in self.hooks:
+                        hook.on_retry(url, attempt, status, wait)
+                    # Switching to another ready token is not counted, a retry is a round over the whole pool.
+                    if wait > 0:
+                        attempt += 1
+                    continue
+                for hook in self.hooks:
+                    hook.on_retry(url, attempt, status, delay)
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def stream(self, url: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        """
+        Stream body of url in chunks through the shared session without API token, used for CDN assets.
+
+        Args:
+            url (:obj:`str`): Full url of the asset.
+            chunk_size (:obj:`int`): Maximum size of one chunk in bytes.
+
+        Return:
+            `AsyncIterator[bytes]`: Chunks of body.
+        """
+        session = self._get_session()
+        for hook in self.hooks:
+            hook.on_request_start(url)
+        started = time.perf_counter()
+        status, size = None, 0
+        try:
+            async with session.get(url) as response:
+                status = response.status
+                if response.status != 200:
+                    self._raise_for_status(response.status)
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    size += len(chunk)
+                    yield chunk
+        finally:
+            for hook in self.hooks:
+                hook.on_request_end(url, status, time.perf_counter() - started, size)
+
+    async def close(self) -> None:
+        """
+        Close the shared session, all pooled connections, the transport and the cache.
+        """
+        await self.transport.close()
+        if self.cache is not None:
+            await self.cache.close()
+        if self._session is not None and self._loop is not asyncio.get_running_loop():
+            self._drop_session()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
@@ -0,0 +1,264 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from bisect import bisect_left
+from urllib.parse import urlsplit
+import re
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ENDPOINT_PATTERNS = (
+    (re.compile(r"/(players|clubs)/[^/]+"), r"/\1/{tag}"),
+    (re.compile(r"/rankings/[^/]+/"), "/rankings/{country}/"),
+    (re.compile(r"/brawlers/\d+"), "/brawlers/{id}"),
+    (re.compile(r"/\d+\.(png|jpg|webp)$"), r"/{id}.\1"),
+)
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Get endpoint of url with tags, country codes and ids replaced by placeholders.
+    EXAMPLE: "https://api.brawlstars.com/v1/players/%23ABC/battlelog" -> "/v1/players/{tag}/battlelog"
+
+    Args:
+        url (:obj:`str`): Full url of the request.
+
+    Return:
+        `str`: Endpoint to group metrics by.
+    """
+    path = urlsplit(url).path
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+class RequestHooks:
+    """
+    Hooks which are called by http client around every request. Subclass it and override needed methods,
+    then pass it to `ClientBS(hooks=[...])` or `ClientBS.add_hook`. Hooks must be fast and must not raise.
+    """
+
+    def on_request_start(self, url: str) -> None:
+        """
+        Request is about to be sent (every retry is a new request).
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+        """
+
+    def on_request_end(
+        self, url: str, status: Optional[int], seconds: float, size: int, error: Optional[BaseException] = None
+    ) -> None:
+        """
+        Response was received or request failed.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+            status (:obj:`int`): Status of the response (`None` - connection error).
+            seconds (:obj:`float`): Duration of the request.
+            size (:obj:`int`): Bytes of received body.
+            error (:obj:`BaseException`): Connection error or timeout.
+        """
+
+    def on_retry(self, url: str, attempt: int, reason: Union[int, BaseException], delay: float) -> None:
+        """
+        Request will be retried.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+            attempt (:obj:`int`): Number of the retry (from 0).
+            reason (:obj:`Union[int, BaseException]`): Status of the response (429, 503) or connection error.
+            delay (:obj:`float`): Seconds before retry.
+        """
+
+    def on_cache_hit(self, url: str, revalidated: bool) -> None:
+        """
+        Response was served from the cache.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+            revalidated (:obj:`bool`): Stale entry was confirmed by 304 response.
+        """
+
+    def bind(self, http: Any) -> None:
+        """
+        Called once when hooks are added to http client.
+
+        Args:
+            http (:obj:`HTTPClient`): Http client which calls the hooks.
+        """
+
+
+class Histogram:
+    """
+    Cumulative histogram of durations.
+
+    Args:
+        buckets (:obj:`Sequence[float]`): Upper bounds of buckets in seconds.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate quantile as upper bound of the bucket where it falls.
+
+        Args:
+            q (:obj:`float`): Quantile from 0 to 1, e.g. 0.99.
+
+        Return:
+            `float`: Estimated seconds (`inf` when it is above the last bucket).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, seen = {}, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            cumulative[bound] = seen
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": cumulative,
+        }
+
+
+class MetricsCollector(RequestHooks):
+    """
+    Collector of request metrics: latency histograms, statuses and bytes by endpoint,
+    retries, cache hits, requests in flight and usage of the connection pool.
+
+    Args:
+        buckets (:obj:`Sequence[float]`): Upper bounds of latency buckets in seconds.
+        prefix (:obj:`str`): Prefix of metric names in Prometheus text.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "bs_api") -> None:
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self.latency: Dict[str, Histogram] = {}
+        self.statuses: Dict[Tuple[str, str], int] = {}
+        self.bytes_received: Dict[str, int] = {}
+        self.retries: Dict[Tuple[str, str], int] = {}
+        self.cache_hits: Dict[Tuple[str, bool], int] = {}
+        self.in_flight = 0
+        self._http = None
+
+    def bind(self, http: Any) -> None:
+        self._http = http
+
+    def on_request_start(self, url: str) -> None:
+        self.in_flight += 1
+
+    def on_request_end(
+        self, url: str, status: Optional[int], seconds: float, size: int, error: Optional[BaseException] = None
+    ) -> None:
+        self.in_flight -= 1
+        endpoint = endpoint_of(url)
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+        key = (endpoint, str(status) if status is not None else type(error).__name__)
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        self.bytes_received[endpoint] = self.bytes_received.get(endpoint, 0) + size
+
+    def on_retry(self, url: str, attempt: int, reason: Union[int, BaseException], delay: float) -> None:
+        key = (endpoint_of(url), str(reason) if isinstance(reason, int) else type(reason).__name__)
+        self.retries[key] = self.retries.get(key, 0) + 1
+
+    def on_cache_hit(self, url: str, revalidated: bool) -> None:
+        key = (endpoint_of(url), revalidated)
+        self.cache_hits[key] = self.cache_hits.get(key, 0) + 1
+
+    def pool(self) -> Dict[str, int]:
+        """
+        Get usage of the connection pool of bound http client.
+
+        Return:
+            `Dict[str, int]`: `limit` and number of `acquired` connections.
+        """
+        if self._http is None:
+            return {"limit": 0, "acquired": 0}
+        return self._http.pool_stats()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all metrics as dict.
+
+        Return:
+            `dict`: Metrics by name.
+        """
+        return {
+            "latency": {endpoint: histogram.snapshot() for endpoint, histogram in self.latency.items()},
+            "statuses": dict(self.statuses),
+            "bytes_received": dict(self.bytes_received),
+            "retries": dict(self.retries),
+            "cache_hits": dict(self.cache_hits),
+            "in_flight": self.in_flight,
+            "pool": self.pool(),
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Get all metrics in Prometheus text exposition format.
+
+        Return:
+            `str`: Metrics text.
+        """
+        name = self.prefix
+        lines: List[str] = []
+
+        def add(metric: str, kind: str, samples: List[Tuple[str, Dict[str, Any], Any]]) -> None:
+            lines.append(f"# TYPE {name}_{metric} {kind}")
+            for suffix, labels, value in samples:
+                text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+                lines.append(f"{name}_{metric}{suffix}{{{text}}} {value}" if text else f"{name}_{metric}{suffix} {value}")
+
+        samples = []
+        for endpoint, histogram in self.latency.items():
+            seen = 0
+            for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                seen += count
+                samples.append(("_bucket", {"endpoint": endpoint, "le": "+Inf" if bound == float("inf") else bound}, seen))
+            samples.append(("_sum", {"endpoint": endpoint}, histogram.total))
+            samples.append(("_count", {"endpoint": endpoint}, histogram.count))
+        add("request_duration_seconds", "histogram", samples)
+        add("responses_total", "counter", [
+            ("", {"endpoint": endpoint, "status": status}, count) for (endpoint, status), count in self.statuses.items()
+        ])
+        add("received_bytes_total", "counter", [
+            ("", {"endpoint": endpoint}, size) for endpoint, size in self.bytes_received.items()
+        ])
+        add("retries_total", "counter", [
+            ("", {"endpoint": endpoint, "reason": reason}, count) for (endpoint, reason), count in self.retries.items()
+        ])
+        add("cache_hits_total", "counter", [
+            ("", {"endpoint": endpoint, "revalidated": str(revalidated).lower()}, count)
+            for (endpoint, revalidated), count in self.cache_hits.items()
+        ])
+        add("requests_in_flight", "gauge", [("", {}, self.in_flight)])
+        pool = self.pool()
+        add("pool_connections_acquired", "gauge", [("", {}, pool["acquired"])])
+        add("pool_connections_limit", "gauge", [("", {}, pool["limit"])])
+        return "\n".join(lines) + "\n"
@@ -1,64 +1,285 @@
+from typing import Any, Callable, Iterable
+from functools import partial
+
 from .classes import *
-from .errors import ResourceError
+from .errors import ClientError, IncorrectError, ResourceError
+from .bulk import gather_bounded, iter_bounded
+from .cache import BaseCache, MemoryCache, SQLiteCache
+from .catalogue import BrawlerCatalogue, BrawlerInfo
+from .columns import Columns, battle_players_to_columns, battlelog_to_columns, brawlers_to_columns, ranking_to_columns
+from .countries import COUNTRY_CODES
+from .battlelog import BattlelogSync, BaseSyncStore, MemorySyncStore, SQLiteSyncStore, SyncState
+from .scheduler import PollingScheduler, WatchEntry, WatchUpdate
+from .diff import ClubDiff, PlayerDiff, payload_digest
+from .assets import AssetCache
+from .metrics import MetricsCollector, RequestHooks
+from .transport import BaseTransport, RecordingTransport, ReplayTransport, SessionTransport
 
 class ClientBS(RequestsModel):
     """
     Client to Brawl Stars API.
 
+    Client owns one pooled http session which is shared by all objects created from it.
+    Use it as `async with ClientBS(...) as client:` or call `await client.close()` at the end.
+
     Args:
-        APIToken (:obj:`str`): Your special token.
+        APIToken (:obj:`Union[str, List[str]]`): Your special token or list of tokens to spread requests across.
+        limit (:obj:`int`): Total number of simultaneous connections in the pool.
+        limit_per_host (:obj:`int`): Number of simultaneous connections to one host (0 - no limit).
+        keepalive_timeout (:obj:`float`): Seconds to keep an idle connection open.
+        ttl_dns_cache (:obj:`int`): Seconds to cache resolved DNS records.
+        requests_per_second (:obj:`float`): Client side rate limit of every token (`None` - no limit).
+        burst (:obj:`int`): Maximum number of requests which can be made at once with one token.
+        token_strategy (:obj:`Literal["round_robin", "least_throttled"]`): How to choose token for the next request.
+        max_retries (:obj:`int`): Number of retries after throttling, maintenance or connection reset.
+        cache (:obj:`Union[bool, BaseCache]`): Response cache, e.g. `MemoryCache()` or `SQLiteCache(path)`
+            (`True` - in-memory LRU with default ttls, `None` - no cache).
+        coalesce (:obj:`bool`): Share one in-flight request between identical concurrent requests.
+        json_loads (:obj:`Callable[[bytes], Any]`): Json decoder (`None` - orjson if installed, else json).
+        catalogue_ttl (:obj:`float`): Seconds to keep loaded brawler catalogue before lazy refresh.
+        assets_dir (:obj:`str`): Directory of on-disk cache of icons, see `ClientBS.assets`.
+        base_url (:obj:`str`): Root url of the API, e.g. of a local mock server.
+        hooks (:obj:`List[RequestHooks]`): Hooks called around every request, e.g. `MetricsCollector()`.
+        transport (:obj:`BaseTransport`): Where requests to API go, e.g. `RecordingTransport(path)` to store
+            responses or `ReplayTransport(path)` to serve them back without network (`None` - the shared session).
     """
 
-    def __init__(self, APIToken: str) -> None:
-        super().__init__(APIToken)
+    def __init__(
+        self,
+        APIToken: Union[str, List[str]],
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: int = 300,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        token_strategy: Literal["round_robin", "least_throttled"] = "round_robin",
+        max_retries: int = 3,
+        cache: Union[bool, BaseCache, None] = None,
+        coalesce: bool = True,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        catalogue_ttl: float = 86400.0,
+        assets_dir: str = "bs_api_assets",
+        base_url: str = "https://api.brawlstars.com/v1/",
+        hooks: Optional[List[RequestHooks]] = None,
+        transport: Optional[BaseTransport] = None,
+    ) -> None:
+        super().__init__(
+            HTTPClient(
+                APIToken,
+                limit=limit,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=keepalive_timeout,
+                ttl_dns_cache=ttl_dns_cache,
+                requests_per_second=requests_per_second,
+                burst=burst,
+                token_strategy=token_strategy,
+                max_retries=max_retries,
+                cache=cache,
+                coalesce=coalesce,
+                json_loads=json_loads,
+                base_url=base_url,
+                hooks=hooks,
+                transport=transport,
+            )
+        )
+        self.catalogue_ttl = catalogue_ttl
+        self._catalogue: Optional[BrawlerCatalogue] = None
+        self.assets = AssetCache(self._http, assets_dir)
+
+    def add_hook(self, hook: RequestHooks) -> None:
+        """
+        Add hooks which are called around every request, e.g. `MetricsCollector`.
+
+        Args:
+            hook (:obj:`RequestHooks`): Hooks.
+        """
+        self._http.add_hook(hook)
+
+    async def __aenter__(self) -> "ClientBS":
+        return self
 
-    async def get_player(self, tag: str) -> Player:
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close pooled http session of the client.
+        """
+        await self._http.close()
+
+    async def get_player(self, tag: str, raw: Union[bool, Literal["bytes"]] = False) -> Player:
         """
         Get information about a player by player tag.
 
         Args:
             tag (:obj:`str`): Target tag.
             EXAMPLE: "#8VJVG4PVC", "#8vjvG4pcv"
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
 
         Return:
             `Player`: Player class with all parameters.
         """
 
-        player_data = await self._create_request(f"players/{self._hashtag(tag)}")
-        player = Player(player_data, self._token)
+        if raw:
+            return await self._create_raw_request(f"players/{self._hashtag(tag)}", raw)
+        player_data, digest = await self._create_digest_request(f"players/{self._hashtag(tag)}")
+        player = Player(player_data, self._http, digest)
         return player
 
-    async def get_player_battlelog(self, tag: str) -> List[Battle]:
+    async def get_player_battlelog(
+        self, tag: str, lazy: bool = False, raw: Union[bool, Literal["bytes"]] = False
+    ) -> List[Battle]:
         """
         Get player battlelog by his tag. 
         NOTE: It may take up to 30 minutes for a new battle to appear in the battlelog.
         
         Args:
             tag (:obj:`str`): Club tag where need find player.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
 
         Return:
             `List[Battle]`: List of all battles .
         """
 
+        if raw:
+            return await self._create_raw_request(f"players/{self._hashtag(tag)}/battlelog", raw)
         battlelog_data = await self._create_request(f"players/{self._hashtag(tag)}/battlelog")
-        return [Battle(battle_data, self._token) for battle_data in battlelog_data["items"]]
+        return [Battle(battle_data, self._http, lazy) for battle_data in battlelog_data["items"]]
 
-    async def get_club(self, tag: str) -> Club:
+    async def get_club(self, tag: str, raw: Union[bool, Literal["bytes"]] = False) -> Club:
         """
         Get information about a single clan by club tag.
 
         Args:
             tag (:obj:`str`): Club target tag.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
 
         Return:
             `Club`: Club class with all parameters.
         """
 
-        club_data = await self._create_request(f"clubs/{self._hashtag(tag)}")
-        club = Club(club_data, self._token)
+        if raw:
+            return await self._create_raw_request(f"clubs/{self._hashtag(tag)}", raw)
+        club_data, digest = await self._create_digest_request(f"clubs/{self._hashtag(tag)}")
+        club = Club(club_data, self._http, digest)
 
         return club
 
+    async def get_players(
+        self, tags: Iterable[str], concurrency: int = 10, raw: Union[bool, Literal["bytes"]] = False
+    ) -> List[Union[Player, ClientError]]:
+        """
+        Get information about many players at once.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `List[Union[Player, ClientError]]`: Players in order of tags, error (e.g. `ResourceError`, `NetworkError`)
+                for failed tags.
+        """
+        return await gather_bounded(partial(self.get_player, raw=raw), tags, concurrency)
+
+    async def iter_players(
+        self, tags: Iterable[str], concurrency: int = 10, raw: Union[bool, Literal["bytes"]] = False
+    ) -> AsyncIterator[Tuple[str, Union[Player, ClientError]]]:
+        """
+        Get information about many players at once and yield them as they arrive.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `AsyncIterator[Tuple[str, Union[Player, ClientError]]]`: Tag and player or error.
+        """
+        async for _, tag, result in iter_bounded(partial(self.get_player, raw=raw), tags, concurrency):
+            yield tag, result
+
+    async def get_clubs(
+        self, tags: Iterable[str], concurrency: int = 10, raw: Union[bool, Literal["bytes"]] = False
+    ) -> List[Union[Club, ClientError]]:
+        """
+        Get information about many clubs at once.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Club target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `List[Union[Club, ClientError]]`: Clubs in order of tags, error for failed tags.
+        """
+        return await gather_bounded(partial(self.get_club, raw=raw), tags, concurrency)
+
+    async def iter_clubs(
+        self, tags: Iterable[str], concurrency: int = 10, raw: Union[bool, Literal["bytes"]] = False
+    ) -> AsyncIterator[Tuple[str, Union[Club, ClientError]]]:
+        """
+        Get information about many clubs at once and yield them as they arrive.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Club target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `AsyncIterator[Tuple[str, Union[Club, ClientError]]]`: Tag and club or error.
+        """
+        async for _, tag, result in iter_bounded(partial(self.get_club, raw=raw), tags, concurrency):
+            yield tag, result
+
+    async def get_battlelogs(
+        self,
+        tags: Iterable[str],
+        concurrency: int = 10,
+        lazy: bool = False,
+        raw: Union[bool, Literal["bytes"]] = False,
+    ) -> List[Union[List[Battle], ClientError]]:
+        """
+        Get battlelogs of many players at once.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `List[Union[List[Battle], ClientError]]`: Battlelogs in order of tags, error for failed tags.
+        """
+        return await gather_bounded(partial(self.get_player_battlelog, lazy=lazy, raw=raw), tags, concurrency)
+
+    async def iter_battlelogs(
+        self,
+        tags: Iterable[str],
+        concurrency: int = 10,
+        lazy: bool = False,
+        raw: Union[bool, Literal["bytes"]] = False,
+    ) -> AsyncIterator[Tuple[str, Union[List[Battle], ClientError]]]:
+        """
+        Get battlelogs of many players at once and yield them as they arrive.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Return decoded json (`True`) or undecoded body (`"bytes"`) instead of models.
+
+        Return:
+            `AsyncIterator[Tuple[str, Union[List[Battle], ClientError]]]`: Tag and battlelog or error.
+        """
+        async for _, tag, result in iter_bounded(partial(self.get_player_battlelog, lazy=lazy, raw=raw), tags, concurrency):
+            yield tag, result
+
     async def get_club_members(self, tag: str) -> Club:
         """
         Get list of club members.
@@ -74,6 +295,81 @@ class ClientBS(RequestsModel):
 
         return club.members
 
+    async def iter_club_members(
+        self, tag: str, page_size: Optional[int] = None, prefetch: bool = True
+    ) -> AsyncIterator[Member]:
+        """
+        Iterate over club members page by page, following cursors of API.
+
+        Args:
+            tag (:obj:`str`): Club target tag.
+            page_size (:obj:`int`): Number of items in one page (`None` - default of API).
+            prefetch (:obj:`bool`): Request next page while current page is processed.
+
+        Return:
+            `AsyncIterator[Member]`: Members as each page arrives.
+        """
+        async for items in self._iter_pages(f"clubs/{self._hashtag(tag)}/members", page_size, prefetch):
+            for info in items:
+                yield Member(info, self._http)
+
+    async def get_battlelogs_columns(self, tags: Iterable[str], concurrency: int = 10) -> Columns:
+        """
+        Get battlelogs of many players at once as one table, `Battle` objects are not created.
+        Players which failed (e.g. `ResourceError`) are skipped.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+
+        Return:
+            `Columns`: One row per battle with `tag` column of the player.
+        """
+        tables = []
+        async for tag, battlelog in self.iter_battlelogs(tags, concurrency, raw=True):
+            if not isinstance(battlelog, ClientError):
+                tables.append(battlelog_to_columns(battlelog, tag))
+        if not tables:
+            return battlelog_to_columns({"items": []}, "")
+        return Columns.concat(tables)
+
+    async def fetch_clubs_member_players(
+        self,
+        clubtags: Iterable[str],
+        concurrency: int = 10,
+        include_battlelog: bool = False,
+        lazy: bool = False,
+    ) -> Dict[str, Union[Dict[str, Union[Player, ClientError]], ClientError]]:
+        """
+        Get real `Player` classes of all members of many clubs at once.
+        Members of all clubs share one bounded fan-out.
+
+        Args:
+            clubtags (:obj:`Iterable[str]`): Club target tags.
+            concurrency (:obj:`int`): Maximum number of simultaneous requests of clubs and members.
+            include_battlelog (:obj:`bool`): Also get battlelog of every member into `Player.battlelog`.
+            lazy (:obj:`bool`): Decode attributes of battles only when they are accessed.
+
+        Return:
+            `Dict[str, Union[Dict[str, Union[Player, ClientError]], ClientError]]`: Players by tag of member
+            for every club tag, error for failed clubs.
+        """
+        clubtags = list(clubtags)
+        clubs = await self.get_clubs(clubtags, concurrency)
+        members = [member for club in clubs if isinstance(club, Club) for member in club.members]
+        players = await gather_bounded(
+            lambda member: member.get_player(include_battlelog, lazy), members, concurrency
+        )
+        players = dict(zip((member.tag for member in members), players))
+
+        output = {}
+        for clubtag, club in zip(clubtags, clubs):
+            if isinstance(club, ClientError):
+                output[clubtag] = club
+            else:
+                output[clubtag] = {member.tag: players[member.tag] for member in club.members}
+        return output
+
     async def get_player_by_club(self, clubtag: str, search: str) -> Player:
         """
         Get player by his club tag.
@@ -97,27 +393,40 @@ class ClientBS(RequestsModel):
 
         raise ResourceError("Member was not found.")
 
-    async def get_ranking_clubs(self, countrycode: Literal["global", "contryCode"] = "global") -> List[RankedClub]:
+    async def get_ranking_clubs(
+        self,
+        countrycode: Literal["global", "contryCode"] = "global",
+        limit: Optional[int] = None,
+        raw: Union[bool, Literal["bytes"]] = False,
+    ) -> List[RankedClub]:
         """
         Get club rankings for a country or global search.
 
         Args:
             countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
             EXAMPLE: FR, RU, US, global
+            limit (:obj:`int`): Maximum number of items (`None` - default of API).
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
 
         Return:
             `List[RankedClub]`: List of classes RankedClub.
         """
-        request = await self._create_request(f"rankings/{countrycode.upper()}/clubs")
+        url = self._page_url(f"rankings/{countrycode.upper()}/clubs", limit)
+        if raw:
+            return await self._create_raw_request(url, raw)
+        request = await self._create_request(url)
         returnlist = []
         for info in request["items"]:
             info["ranked_country_code"] = countrycode.upper()
-            returnlist.append(RankedClub(info, self._token))
+            returnlist.append(RankedClub(info, self._http))
 
         return returnlist
 
     async def get_ranking_by_brawlerid(self, brawlerid: int,
-                                       countrycode: Literal["global", "contryCode"] = "global"
+                                       countrycode: Literal["global", "contryCode"] = "global",
+                                       limit: Optional[int] = None,
+                                       raw: Union[bool, Literal["bytes"]] = False,
                                        ) -> List[RankedPlayer]:
         """
         Get brawler rankings for a country or global search.
@@ -127,17 +436,38 @@ class ClientBS(RequestsModel):
             brawlerid (:obj:`int`): Unique id of brawler.
             countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
             EXAMPLE: FR, RU, US, global
+            limit (:obj:`int`): Maximum number of items (`None` - default of API).
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
         Return:
             `List[RankedPlayer]`: List of classes RankedPlayer.
         """
-        request = await self._create_request(f"rankings/{countrycode}/brawlers/{brawlerid}")
+        url = self._page_url(f"rankings/{countrycode}/brawlers/{brawlerid}", limit)
+        if raw:
+            return await self._create_raw_request(url, raw)
+        request = await self._create_request(url)
         returnlist = []
         for info in request["items"]:
             info["ranked_country_code"] = countrycode.upper()
-            returnlist.append(RankedPlayer(info, self._token))
+            returnlist.append(RankedPlayer(info, self._http))
 
         return returnlist
 
+    async def get_brawler_catalogue(self, refresh: bool = False) -> BrawlerCatalogue:
+        """
+        Get indexed catalogue of all brawlers with their star powers and gadgets.
+        Catalogue is loaded once and refreshed lazily when it is older than `catalogue_ttl`.
+
+        Args:
+            refresh (:obj:`bool`): Load catalogue again right now.
+
+        Return:
+            `BrawlerCatalogue`: Catalogue of brawlers.
+        """
+        if refresh or self._catalogue is None or self._catalogue.age() > self.catalogue_ttl:
+            self._catalogue = BrawlerCatalogue(await self._create_request("brawlers"))
+        return self._catalogue
+
     async def get_brawlerid_by_name(self, name: str) -> int:
         """
         Get unique brawlerid for use by brawler name.
@@ -149,12 +479,11 @@ class ClientBS(RequestsModel):
         Return:
             `int`: Unique brawlerid
         """
-        request = await self._create_request("brawlers")
+        catalogue = await self.get_brawler_catalogue()
+        brawler = catalogue.find(name)
+        if brawler is not None:
+            return brawler.id
 
-        for infobrawler in request["items"]:
-            if name.lower() in infobrawler["name"].lower():
-                return infobrawler["id"]
-            
     async def get_name_by_brawlerid(self, brawlerid: int) -> str:
         """
         Get name brawler by his brawlerid
@@ -165,22 +494,150 @@ class ClientBS(RequestsModel):
         Return:
             `str`: Name brawler
         """
-        request = await self._create_request("brawlers")
-
-        for infobrawler in request["items"]:
-            if int(infobrawler["id"]) == brawlerid:
-                return infobrawler["name"].capitalize()
-            
-    async def get_ranking_players(self, countrycode: Literal["global", "contryCode"] = "global") -> List[RankedPlayer]:
+        catalogue = await self.get_brawler_catalogue()
+        brawler = catalogue.get(brawlerid)
+        if brawler is not None:
+            return brawler.name.capitalize()
+
+    async def get_ranking_players(
+        self,
+        countrycode: Literal["global", "contryCode"] = "global",
+        limit: Optional[int] = None,
+        raw: Union[bool, Literal["bytes"]] = False,
+    ) -> List[RankedPlayer]:
         """
         Get player rankings for a country or global search.
 
         Args:
             countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
             EXAMPLE: FR, RU, US, global
+            limit (:obj:`int`): Maximum number of items (`None` - default of API).
+            raw (:obj:`Union[bool, Literal["bytes"]]`): Skip model construction and return decoded json (`True`)
+                or undecoded body of response (`"bytes"`).
 
         Return:
             `List[RankedPlayer]`: List of classes RankedPlayer.
         """
-        request = await self._create_request(f"rankings/{countrycode}/players")
-        return [RankedPlayer(data, self._token) for data in request["items"]]
+        url = self._page_url(f"rankings/{countrycode}/players", limit)
+        if raw:
+            return await self._create_raw_request(url, raw)
+        request = await self._create_request(url)
+        return [RankedPlayer(data, self._http) for data in request["items"]]
+
+    async def iter_ranking_players(
+        self,
+        countrycode: Literal["global", "contryCode"] = "global",
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[RankedPlayer]:
+        """
+        Iterate over player rankings page by page, following cursors of API.
+
+        Args:
+            countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
+            EXAMPLE: FR, RU, US, global
+            page_size (:obj:`int`): Number of items in one page (`None` - default of API).
+            prefetch (:obj:`bool`): Request next page while current page is processed.
+
+        Return:
+            `AsyncIterator[RankedPlayer]`: Ranked players as each page arrives.
+        """
+        async for items in self._iter_pages(f"rankings/{countrycode}/players", page_size, prefetch):
+            for info in items:
+                info["ranked_country_code"] = countrycode.upper()
+                yield RankedPlayer(info, self._http)
+
+    async def iter_ranking_clubs(
+        self,
+        countrycode: Literal["global", "contryCode"] = "global",
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[RankedClub]:
+        """
+        Iterate over club rankings page by page, following cursors of API.
+
+        Args:
+            countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
+            EXAMPLE: FR, RU, US, global
+            page_size (:obj:`int`): Number of items in one page (`None` - default of API).
+            prefetch (:obj:`bool`): Request next page while current page is processed.
+
+        Return:
+            `AsyncIterator[RankedClub]`: Ranked clubs as each page arrives.
+        """
+        async for items in self._iter_pages(f"rankings/{countrycode.upper()}/clubs", page_size, prefetch):
+            for info in items:
+                info["ranked_country_code"] = countrycode.upper()
+                yield RankedClub(info, self._http)
+
+    async def iter_ranking_by_brawlerid(
+        self,
+        brawlerid: int,
+        countrycode: Literal["global", "contryCode"] = "global",
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[RankedPlayer]:
+        """
+        Iterate over brawler rankings page by page, following cursors of API.
+
+        Args:
+            brawlerid (:obj:`int`): Unique id of brawler.
+            countrycode (:obj:`Literal["global", "contryCode"]`): Country code or global search.
+            EXAMPLE: FR, RU, US, global
+            page_size (:obj:`int`): Number of items in one page (`None` - default of API).
+            prefetch (:obj:`bool`): Request next page while current page is processed.
+
+        Return:
+            `AsyncIterator[RankedPlayer]`: Ranked players as each page arrives.
+        """
+        async for items in self._iter_pages(f"rankings/{countrycode}/brawlers/{brawlerid}", page_size, prefetch):
+            for info in items:
+                info["ranked_country_code"] = countrycode.upper()
+                yield RankedPlayer(info, self._http)
+
+    async def sweep_rankings(
+        self,
+        countrycodes: Optional[Iterable[str]] = None,
+        kind: Literal["players", "clubs"] = "players",
+        brawlerid: Optional[int] = None,
+        limit: Optional[int] = None,
+        concurrency: int = 10,
+    ) -> Columns:
+        """
+        Get rankings of many countries at once, requests are made concurrently under the rate limiter.
+        Countries without ranking (404) or with unsupported code (400) are skipped.
+
+        Args:
+            countrycodes (:obj:`Iterable[str]`): Country codes to sweep (`None` - all known codes).
+            kind (:obj:`Literal["players", "clubs"]`): Ranking of players or clubs.
+            brawlerid (:obj:`int`): Unique id of brawler for ranking of brawler (only with "players").
+            limit (:obj:`int`): Maximum number of items of every country (`None` - default of API).
+            concurrency (:obj:`int`): Maximum number of simultaneous requests.
+
+        Return:
+            `Columns`: Merged rankings in order of countrycodes with `ranked_country_code` column.
+        """
+        if kind not in ("players", "clubs"):
+            raise ValueError(f"Unknown kind {kind!r}, use 'players' or 'clubs'.")
+        if brawlerid is not None and kind != "players":
+            raise ValueError("Ranking of brawler is available only for players.")
+
+        path = f"brawlers/{brawlerid}" if brawlerid is not None else kind
+
+        async def get_country(countrycode: str) -> Columns:
+            code = countrycode.upper() if kind == "clubs" else countrycode
+            request = await self._create_request(self._page_url(f"rankings/{code}/{path}", limit))
+            return ranking_to_columns(request, countrycode, kind)
+
+        countrycodes = list(COUNTRY_CODES if countrycodes is None else countrycodes)
+        tables = []
+        for table in await gather_bounded(get_country, countrycodes, concurrency):
+            if isinstance(table, (ResourceError, IncorrectError)):
+                continue
+            if isinstance(table, ClientError):
+                raise table
+            tables.append(table)
+
+        if not tables:
+            return ranking_to_columns({"items": []}, "", kind)
+        return Columns.concat(tables)
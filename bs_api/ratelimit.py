@@ -0,0 +1,265 @@
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import List, Literal, Optional, Union
+from time import monotonic
+import asyncio
+import random
+
+
+class TokenBucket:
+    """
+    Client side rate limiter based on token bucket algorithm.
+
+    Args:
+        rate (:obj:`float`): Number of requests per second.
+        burst (:obj:`int`): Maximum number of requests which can be made at once.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens: float = self.burst
+        self._updated = monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop giving out tokens for some seconds (used after throttled response).
+
+        Args:
+            seconds (:obj:`float`): Duration of the pause.
+        """
+        self._paused_until = max(self._paused_until, monotonic() + seconds)
+        self._tokens = 0
+        self._updated = max(self._updated, self._paused_until)
+
+    def delay(self) -> float:
+        """
+        Get seconds to wait until next token is available.
+
+        Return:
+            `float`: Seconds to wait (0 if token is available now).
+        """
+        now = monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """
+        Wait until token is available and take it.
+        """
+        async with self._lock:
+            while True:
+                wait = self.delay()
+                if wait <= 0:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep(wait)
+
+
+class TokenState:
+    """
+    State of one API token inside `TokenPool`.
+
+    Args:
+        token (:obj:`str`): API token.
+        bucket (:obj:`TokenBucket`): Rate limiter of this token (`None` - no limit).
+    """
+
+    def __init__(self, token: str, bucket: Optional[TokenBucket] = None) -> None:
+        self.token = token
+        self.bucket = bucket
+        self.cooldown_until = 0.0
+        self.throttled_at = float("-inf")
+        self.throttle_count = 0
+        self.last_used = float("-inf")
+        self.pending = 0
+
+    def cooldown(self) -> float:
+        """
+        Get seconds left until this token can be used again after throttling.
+
+        Return:
+            `float`: Seconds left (0 if token is ready).
+        """
+        return max(0.0, self.cooldown_until - monotonic())
+
+    def expected_wait(self) -> float:
+        """
+        Get estimated seconds until a new request with this token can be sent.
+
+        Return:
+            `float`: Estimated wait including requests which are already queued.
+        """
+        if self.bucket is None:
+            return self.cooldown() + self.pending
+        return self.cooldown() + self.bucket.delay() + self.pending / self.bucket.rate
+
+    def __repr__(self) -> str:
+        return f"<TokenState token='{self.token[:8]}...' throttle_count='{self.throttle_count}'>"
+
+
+class TokenPool:
+    """
+    Pool of API tokens where every token has own rate limiter and cooldown after throttling.
+
+    Args:
+        tokens (:obj:`Union[str, List[str]]`): One or several API tokens.
+        requests_per_second (:obj:`float`): Rate limit of every token (`None` - no limit).
+        burst (:obj:`int`): Maximum number of requests which can be made at once with one token.
+        strategy (:obj:`Literal["round_robin", "least_throttled"]`): How to choose next token.
+            "round_robin" - tokens are used in turn, tokens on cooldown are skipped.
+            "least_throttled" - token with the smallest expected wait, least recently throttled first.
+    """
+
+    strategies = ("round_robin", "least_throttled")
+
+    def __init__(
+        self,
+        tokens: Union[str, List[str]],
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        strategy: Literal["round_robin", "least_throttled"] = "round_robin",
+    ) -> None:
+        if isinstance(tokens, str):
+            tokens = [tokens]
+        if not tokens:
+            raise ValueError("At least one API token is required.")
+        if strategy not in self.strategies:
+            raise ValueError(f"Unknown strategy {strategy!r}, use one of {self.strategies}.")
+
+        self.strategy = strategy
+        self.states: List[TokenState] = [
+            TokenState(token, TokenBucket(requests_per_second, burst) if requests_per_second else None)
+            for token in tokens
+        ]
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def _choose(self) -> TokenState:
+        now = monotonic()
+        ready = [state for state in self.states if state.cooldown_until <= now]
+        if not ready:
+            return min(self.states, key=lambda state: state.cooldown_until)
+
+        if self.strategy == "round_robin":
+            for shift in range(len(self.states)):
+                index = (self._next + shift) % len(self.states)
+                state = self.states[index]
+                if state.cooldown_until <= now:
+                    self._next = index + 1
+                    return state
+
+        return min(ready, key=lambda state: (state.expected_wait(), state.throttled_at, state.last_used))
+
+    def rebind(self) -> None:
+        """
+        Make new locks of rate limiters, so the pool can be used from another event loop.
+        """
+        for state in self.states:
+            if state.bucket is not None:
+                state.bucket._lock = asyncio.Lock()
+
+    def wait(self) -> float:
+        """
+        Get seconds until any token is out of cooldown.
+
+        Return:
+            `float`: Seconds to wait (0 if some token is ready now).
+        """
+        return min(state.cooldown() for state in self.states)
+
+    async def acquire(self) -> TokenState:
+        """
+        Choose token for the next request and wait until it can be used.
+
+        Return:
+            `TokenState`: Chosen token.
+        """
+        state = self._choose()
+        state.last_used = monotonic()
+        state.pending += 1
+        try:
+            # Token can be throttled again while we wait for its cooldown, so the choice is made again after it.
+            # Waiters wake at spread times, so they do not hit the server at the same instant.
+            while state.cooldown() > 0:
+                await asyncio.sleep(state.cooldown() * random.uniform(1.0, 1.5))
+                state.pending -= 1
+                state = self._choose()
+                state.last_used = monotonic()
+                state.pending += 1
+            if state.bucket is not None:
+                await state.bucket.acquire()
+        finally:
+            state.pending -= 1
+        return state
+
+    def throttled(self, state: TokenState, seconds: float) -> None:
+        """
+        Mark token as throttled, so it is not used for some seconds.
+
+        Args:
+            state (:obj:`TokenState`): Throttled token.
+            seconds (:obj:`float`): Duration of the cooldown.
+        """
+        now = monotonic()
+        state.throttled_at = now
+        state.throttle_count += 1
+        state.cooldown_until = max(state.cooldown_until, now + seconds)
+        if state.bucket is not None:
+            state.bucket.pause(seconds)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, maximum: float = 30.0) -> float:
+    """
+    Get delay of exponential backoff with full jitter.
+
+    Args:
+        attempt (:obj:`int`): Number of the retry (from 0).
+        base (:obj:`float`): Delay of the first retry.
+        maximum (:obj:`float`): Maximum delay.
+
+    Return:
+        `float`: Seconds to wait before retry.
+    """
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse `Retry-After` header which is either number of seconds or http date.
+
+    Args:
+        value (:obj:`str`): Value of the header.
+
+    Return:
+        `float`: Seconds to wait or `None` if header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
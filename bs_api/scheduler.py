@@ -0,0 +1,347 @@
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from aiohttp import ClientConnectionError
+import itertools
+import asyncio
+import heapq
+import time
+
+from .classes import Club, Model, Player, RequestsModel
+from .errors import ClientError, ResourceError
+from .adaptive import AdaptiveInterval
+
+DEFAULT_WATCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "player": ("trophies", "highest_trophies", "exp_points"),
+    "club": ("trophies", "members", "required_trophies", "description"),
+}
+
+_MODELS = {"player": Player, "club": Club}
+
+
+class WatchEntry:
+    """
+    Watched player or club inside `PollingScheduler`.
+
+    Args:
+        kind (:obj:`Literal["player", "club"]`): Kind of watched object.
+        tag (:obj:`str`): Tag of watched object.
+        priority (:obj:`int`): Higher priority is polled first when several entries are due.
+        interval (:obj:`float`): Seconds between first polls, then interval adapts to change rate of object.
+    """
+
+    __slots__ = (
+        "kind", "tag", "priority", "interval", "current_interval", "last_poll",
+        "next_due", "values", "polls", "changes", "errors", "failures", "seq", "active",
+    )
+
+    def __init__(self, kind: str, tag: str, priority: int = 0, interval: float = 300.0) -> None:
+        self.kind = kind
+        self.tag = tag
+        self.priority = priority
+        self.interval = interval
+        self.current_interval = interval
+        self.last_poll = 0.0
+        self.next_due = 0.0
+        self.values: Optional[tuple] = None
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+        self.failures = 0
+        self.seq = 0
+        self.active = True
+
+    def __repr__(self) -> str:
+        return f"<WatchEntry {self.kind}='{self.tag}' interval='{self.current_interval:.0f}'>"
+
+
+class WatchUpdate:
+    """
+    Change of watched player or club found by `PollingScheduler`.
+
+    Args:
+        kind (:obj:`Literal["player", "club"]`): Kind of changed object.
+        tag (:obj:`str`): Tag of changed object.
+        model (:obj:`Union[Player, Club]`): New state of object.
+        changed (:obj:`Dict[str, Tuple[Any, Any]]`): Old and new value by name of changed field.
+        error (:obj:`Exception`): `ClientError`, connection error or timeout of the poll, then `model` is `None`.
+    """
+
+    __slots__ = ("kind", "tag", "model", "changed", "error")
+
+    def __init__(
+        self,
+        kind: str,
+        tag: str,
+        model: Optional[Model] = None,
+        changed: Optional[Dict[str, Tuple[Any, Any]]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.kind = kind
+        self.tag = tag
+        self.model = model
+        self.changed = changed or {}
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<WatchUpdate {self.kind}='{self.tag}' changed='{list(self.changed)}'>"
+
+
+class PollingScheduler:
+    """
+    Scheduler which polls watched players and clubs by deadline and priority and reports their changes.
+    Up to `concurrency` polls are in flight, so the rate limiter of the client stays saturated without being exceeded.
+    Interval of every entry adapts to its observed change rate, so about every second poll finds a change:
+    objects which change often are polled more often. The same `AdaptiveInterval` is used by `BattlelogSync`.
+
+    Args:
+        client (:obj:`RequestsModel`): Client to Brawl Stars API, e.g. `ClientBS`.
+        callback (:obj:`Callable[[WatchUpdate], Any]`): Function or coroutine function called with every update.
+        queue (:obj:`asyncio.Queue`): Queue where every update is put.
+        concurrency (:obj:`int`): Maximum number of simultaneous polls.
+        fields (:obj:`Dict[str, Tuple[str, ...]]`): Watched attribute names by kind (`None` - `DEFAULT_WATCH_FIELDS`).
+        min_interval (:obj:`float`): Minimum seconds between polls of one entry.
+        max_interval (:obj:`float`): Maximum seconds between polls of one entry.
+        report_errors (:obj:`bool`): Report failed polls as updates with `error`.
+    """
+
+    def __init__(
+        self,
+        client: RequestsModel,
+        callback: Optional[Callable[[WatchUpdate], Union[Any, Awaitable[Any]]]] = None,
+        queue: Optional[asyncio.Queue] = None,
+        concurrency: int = 10,
+        fields: Optional[Dict[str, Tuple[str, ...]]] = None,
+        min_interval: float = 30.0,
+        max_interval: float = 6 * 3600.0,
+        report_errors: bool = False,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        self.client = client
+        self.callback = callback
+        self.queue = queue
+        self.concurrency = concurrency
+        self.fields = fields if fields is not None else DEFAULT_WATCH_FIELDS
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.intervals = AdaptiveInterval(min_interval, max_interval, target=0.5)
+        self.report_errors = report_errors
+
+        self.entries: Dict[Tuple[str, str], WatchEntry] = {}
+        self._heap: List[Tuple[float, int, int, WatchEntry]] = []
+        self._ready: List[Tuple[int, float, int, WatchEntry]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+        self._failure: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _push(self, entry: WatchEntry) -> None:
+        # Entries are never removed from the heap, outdated items are skipped by `seq`.
+        entry.seq = next(self._counter)
+        heapq.heappush(self._heap, (entry.next_due, -entry.priority, entry.seq, entry))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def watch(
+        self,
+        tag: str,
+        kind: Literal["player", "club"] = "player",
+        priority: int = 0,
+        interval: float = 300.0,
+    ) -> WatchEntry:
+        """
+        Start watching player or club, it is polled as soon as possible.
+
+        Args:
+            tag (:obj:`str`): Tag of player or club.
+            kind (:obj:`Literal["player", "club"]`): Kind of object.
+            priority (:obj:`int`): Higher priority is polled first when several entries are due.
+            interval (:obj:`float`): Seconds between first polls.
+
+        Return:
+            `WatchEntry`: Entry of watched object.
+        """
+        if kind not in _MODELS:
+            raise ValueError(f"Unknown kind {kind!r}, use 'player' or 'club'.")
+
+        entry = self.entries.get((kind, tag))
+        if entry is None:
+            entry = self.entries[(kind, tag)] = WatchEntry(kind, tag, priority, interval)
+        else:
+            entry.priority = priority
+            entry.interval = interval
+        entry.current_interval = self.intervals.clamp(interval)
+        entry.next_due = time.time()
+        self._push(entry)
+        return entry
+
+    def watch_many(
+        self,
+        tags: Iterable[str],
+        kind: Literal["player", "club"] = "player",
+        priority: int = 0,
+        interval: float = 300.0,
+    ) -> None:
+        """
+        Start watching many players or clubs with the same settings.
+
+        Args:
+            tags (:obj:`Iterable[str]`): Tags of players or clubs.
+            kind (:obj:`Literal["player", "club"]`): Kind of objects.
+            priority (:obj:`int`): Higher priority is polled first when several entries are due.
+            interval (:obj:`float`): Seconds between first polls.
+        """
+        for tag in tags:
+            self.watch(tag, kind, priority, interval)
+
+    def unwatch(self, tag: str, kind: Literal["player", "club"] = "player") -> None:
+        """
+        Stop watching player or club.
+
+        Args:
+            tag (:obj:`str`): Tag of player or club.
+            kind (:obj:`Literal["player", "club"]`): Kind of object.
+        """
+        entry = self.entries.pop((kind, tag), None)
+        if entry is not None:
+            entry.active = False
+
+    def _pop_due(self) -> Tuple[Optional[WatchEntry], Optional[float]]:
+        # Every due entry moves from the deadline heap to the ready heap ordered by priority,
+        # so among due entries the highest priority goes first and then the most overdue one.
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            due, priority, seq, entry = heapq.heappop(self._heap)
+            heapq.heappush(self._ready, (priority, due, seq, entry))
+
+        while self._ready:
+            _, _, seq, entry = heapq.heappop(self._ready)
+            if entry.active and seq == entry.seq:
+                return entry, None
+
+        while self._heap:
+            due, _, seq, entry = self._heap[0]
+            if entry.active and seq == entry.seq:
+                return None, due - now
+            heapq.heappop(self._heap)
+        return None, None
+
+    async def _emit(self, update: WatchUpdate) -> None:
+        if self.queue is not None:
+            await self.queue.put(update)
+        if self.callback is not None:
+            try:
+                result = self.callback(update)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as error:
+                # Error of callback is reported to the loop, other entries keep being polled.
+                asyncio.get_running_loop().call_exception_handler({
+                    "message": f"Callback of PollingScheduler failed on {update!r}",
+                    "exception": error,
+                })
+
+    async def _poll(self, entry: WatchEntry) -> None:
+        model = _MODELS[entry.kind]
+        fields = self.fields.get(entry.kind, ())
+        getter = self.client.get_player if entry.kind == "player" else self.client.get_club
+
+        try:
+            data = await getter(entry.tag, raw=True)
+        except (ClientError, ClientConnectionError, asyncio.TimeoutError) as error:
+            # Failure of one entry, including network errors left after retries, does not stop the scheduler.
+            entry.errors += 1
+            entry.failures += 1
+            # Missing object is polled rarely, other errors are retried with growing interval.
+            if isinstance(error, ResourceError):
+                entry.current_interval = self.max_interval
+                delay = self.max_interval
+            else:
+                delay = self.intervals.backoff(entry.current_interval, entry.failures)
+            entry.next_due = time.time() + delay
+            if entry.active:
+                self._push(entry)
+            if self.report_errors:
+                await self._emit(WatchUpdate(entry.kind, entry.tag, error=error))
+            return
+        entry.failures = 0
+
+        values = tuple(data.get(model._names.get(field, field)) for field in fields)
+        previous = entry.values
+        entry.values = values
+        entry.polls += 1
+
+        now = time.time()
+        changed = previous is not None and values != previous
+        if previous is not None:
+            entry.current_interval = self.intervals.next(entry.current_interval, int(changed), now - entry.last_poll)
+        entry.last_poll = now
+        entry.next_due = now + entry.current_interval
+        if entry.active:
+            self._push(entry)
+
+        if changed:
+            entry.changes += 1
+            difference = {
+                field: (old, new) for field, old, new in zip(fields, previous, values) if old != new
+            }
+            await self._emit(WatchUpdate(entry.kind, entry.tag, model(data, self.client._http), difference))
+
+    def _finish_poll(self, slots: asyncio.Semaphore, tasks: set, task: asyncio.Future) -> None:
+        slots.release()
+        tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None and self._failure is None:
+            self._failure = task.exception()
+            self._wakeup.set()
+
+    async def run(self) -> None:
+        """
+        Poll watched entries until `stop` is called.
+        Failed polls are rescheduled with backoff and errors of callback go to the exception handler of the loop,
+        other unexpected errors stop the scheduler.
+        """
+        self._running = True
+        self._failure = None
+        self._wakeup = asyncio.Event()
+        slots = asyncio.Semaphore(self.concurrency)
+        tasks: set = set()
+
+        try:
+            while self._running:
+                await slots.acquire()
+                if self._failure is not None:
+                    raise self._failure
+                if not self._running:
+                    break
+
+                entry, wait = self._pop_due()
+                if entry is None:
+                    slots.release()
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                task = asyncio.ensure_future(self._poll(entry))
+                tasks.add(task)
+                task.add_done_callback(lambda task: self._finish_poll(slots, tasks, task))
+            if self._failure is not None:
+                raise self._failure
+        finally:
+            self._running = False
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """
+        Stop running scheduler, polls in flight are cancelled.
+        """
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
@@ -0,0 +1,212 @@
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+from abc import ABC, abstractmethod
+from functools import partial
+from multidict import CIMultiDict
+import threading
+import asyncio
+import sqlite3
+import time
+import json
+import zlib
+
+from .errors import ReplayError
+
+Response = Tuple[int, Mapping[str, str], bytes]
+
+
+def archive_key(url: str) -> str:
+    """
+    Get key of url in archive: path and query without host, so responses of the real API
+    can be replayed under any `base_url`.
+    EXAMPLE: "https://api.brawlstars.com/v1/players/%23ABC" -> "/v1/players/%23ABC"
+
+    Args:
+        url (:obj:`str`): Full url of the request.
+
+    Return:
+        `str`: Key of the response.
+    """
+    parts = urlsplit(url)
+    return parts.path + ("?" + parts.query if parts.query else "")
+
+
+class BaseTransport(ABC):
+    """
+    Transport which sends requests of http client to Brawl Stars API.
+    Subclass it and pass to `ClientBS(transport=...)` to change where responses come from.
+    """
+
+    def bind(self, http: Any) -> None:
+        """
+        Called once when transport is given to http client.
+
+        Args:
+            http (:obj:`HTTPClient`): Http client which uses the transport.
+        """
+        self._http = http
+
+    @abstractmethod
+    async def send(self, url: str, headers: Dict[str, str]) -> Response:
+        """
+        Send GET request.
+
+        Args:
+            url (:obj:`str`): Full url of the request.
+            headers (:obj:`Dict[str, str]`): Headers of the request with `Authorization`.
+
+        Return:
+            `Tuple[int, Mapping[str, str], bytes]`: Status, headers and body of the response.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release resources of the transport.
+        """
+
+
+class SessionTransport(BaseTransport):
+    """
+    Default transport, sends requests through the shared pooled session of http client.
+    """
+
+    async def send(self, url: str, headers: Dict[str, str]) -> Response:
+        session = self._http._get_session()
+        async with session.get(url, headers=headers) as response:
+            return response.status, response.headers.copy(), await response.read()
+
+
+class _Archive:
+    # Compact archive of responses in sqlite database, bodies are compressed by zlib.
+    # Every recorded response is kept in order, so one url can have several versions, e.g. of polling.
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Archive is opened again after `close`, like the session of http client, so a closed client can still be used.
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (id INTEGER PRIMARY KEY, key TEXT NOT NULL, "
+                "status INTEGER NOT NULL, headers TEXT NOT NULL, body BLOB NOT NULL, recorded REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_key ON responses (key, id)")
+            self._db.commit()
+        return self._db
+
+    def _execute(self, query: str, params: tuple = (), fetch: bool = False):
+        with self._lock:
+            cursor = self._connect().execute(query, params)
+            if fetch:
+                return cursor.fetchall()
+            self._db.commit()
+
+    async def run(self, *args, **kwargs):
+        # sqlite calls are blocking, so they are moved out of the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self._execute, *args, **kwargs))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+class RecordingTransport(BaseTransport):
+    """
+    Transport which sends requests through another transport and stores every response
+    (status, headers and compressed body) in sqlite archive for `ReplayTransport`.
+    Token is never stored. Throttled (429) and unavailable (503) responses and 304 are not recorded,
+    so replay gets the final answer of every request.
+
+    Args:
+        path (:obj:`str`): Path to archive file, new responses are appended to it.
+        transport (:obj:`BaseTransport`): Transport of real requests (`None` - shared session).
+        compression (:obj:`int`): Level of zlib compression from 0 to 9.
+    """
+
+    skip_statuses = (304, 429, 503)
+
+    def __init__(
+        self, path: str = "bs_api_records.sqlite", transport: Optional[BaseTransport] = None, compression: int = 6
+    ) -> None:
+        self.transport = transport or SessionTransport()
+        self.compression = compression
+        self._archive = _Archive(path)
+
+    def bind(self, http: Any) -> None:
+        super().bind(http)
+        self.transport.bind(http)
+
+    async def send(self, url: str, headers: Dict[str, str]) -> Response:
+        status, response_headers, body = await self.transport.send(url, headers)
+        if status not in self.skip_statuses:
+            await self._archive.run(
+                "INSERT INTO responses (key, status, headers, body, recorded) VALUES (?, ?, ?, ?, ?)",
+                (
+                    archive_key(url), status, json.dumps(dict(response_headers)),
+                    zlib.compress(body, self.compression), time.time(),
+                ),
+            )
+        return status, response_headers, body
+
+    async def close(self) -> None:
+        await self.transport.close()
+        self._archive.close()
+
+
+class ReplayTransport(BaseTransport):
+    """
+    Transport which serves responses from archive of `RecordingTransport` without network.
+    When url was recorded several times, responses are served in recorded order and the last one repeats.
+
+    Args:
+        path (:obj:`str`): Path to archive file.
+        sequential (:obj:`bool`): Serve versions of url in order (`False` - always the last one).
+        strict (:obj:`bool`): Raise `ReplayError` for url which was not recorded (`False` - answer 404).
+    """
+
+    def __init__(self, path: str = "bs_api_records.sqlite", sequential: bool = True, strict: bool = True) -> None:
+        self.sequential = sequential
+        self.strict = strict
+        self._archive = _Archive(path)
+        self._served: Dict[str, int] = {}
+
+    async def send(self, url: str, headers: Dict[str, str]) -> Response:
+        key = archive_key(url)
+        rows: List[tuple] = []
+        if self.sequential:
+            # Position is taken before awaiting, so concurrent requests of one url get different versions.
+            position = self._served.get(key, 0)
+            self._served[key] = position + 1
+            rows = await self._archive.run(
+                "SELECT status, headers, body FROM responses WHERE key = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (key, position), fetch=True,
+            )
+        if not rows:
+            # Past the last version or not sequential, serve the last recorded response.
+            rows = await self._archive.run(
+                "SELECT status, headers, body FROM responses WHERE key = ? ORDER BY id DESC LIMIT 1",
+                (key,), fetch=True,
+            )
+        if not rows:
+            if self.strict:
+                raise ReplayError(f"Response of {key} was not recorded.")
+            return 404, CIMultiDict(), b'{"reason": "notFound"}'
+        status, response_headers, body = rows[0]
+        return status, CIMultiDict(json.loads(response_headers)), zlib.decompress(body)
+
+    def rewind(self) -> None:
+        """
+        Serve every url from its first recorded response again.
+        """
+        self._served.clear()
+
+    async def close(self) -> None:
+        self._archive.close()
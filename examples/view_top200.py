@@ -1,21 +1,20 @@
 import matplotlib.pyplot as plt
-from bs_api import ClientBS
+from bs_api import ClientBS, ranking_to_columns
 
 TOKEN = os.getenv("TOKEN")
 TAG = os.getenv("TAG")
 
-client = ClientBS(TOKEN)
-
 async def main():
-    plt.figure(figsize=(7, 5))
+    async with ClientBS(TOKEN) as client:
+        plt.figure(figsize=(7, 5))
 
-    need = {"bea": "pink", "sprout": "gray", "leon": "green", "gene": "purple"}
-    for brawler in need:
-        brawlerId = await client.get_brawlerid_by_name(brawler)
-        rankingBrawler = await client.get_ranking_by_brawlerid(brawlerId)
-        plt.plot([data.trophies for data in rankingBrawler], marker = 'o', linestyle = '-', color = need[brawler])
+        need = {"bea": "pink", "sprout": "gray", "leon": "green", "gene": "purple"}
+        for brawler in need:
+            brawlerId = await client.get_brawlerid_by_name(brawler)
+            rankingBrawler = ranking_to_columns(await client.get_ranking_by_brawlerid(brawlerId, raw=True)).to_numpy()
+            plt.plot(rankingBrawler["trophies"], marker = 'o', linestyle = '-', color = need[brawler])
 
-    plt.ylabel('Trophies')
-    plt.show()
+        plt.ylabel('Trophies')
+        plt.show()
 
 asyncio.run(main())
@@ -0,0 +1,93 @@
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+from bs_api import analytics
+from bs_api.columns import Columns, battle_players_to_columns, battlelog_to_columns
+
+from benchmarks import payloads
+
+
+def battles() -> Columns:
+    return Columns({
+        "tag": ["#A", "#A", "#A", "#A", "#B"],
+        "battle_time": [
+            "20241105T100000.000Z", "20241105T101000.000Z", "20241105T120000.000Z",
+            "20241105T120500.000Z", "20241105T100000.000Z",
+        ],
+        "mode": ["gemGrab", "gemGrab", "soloShowdown", "soloShowdown", "gemGrab"],
+        "result": ["victory", "defeat", None, None, "draw"],
+        "rank": [None, None, 3, 7, None],
+        "trophy_change": [8, -5, 4, None, 0],
+    })
+
+
+def test_wins_count_showdown_places():
+    assert analytics.wins(battles()).tolist() == [True, False, True, False, False]
+
+
+def test_win_rate_by_mode():
+    stats = analytics.win_rate(battles())
+    assert stats["mode"].tolist() == ["gemGrab", "soloShowdown"]
+    assert stats["battles"].tolist() == [3, 2]
+    assert stats["wins"].tolist() == [1, 1]
+    assert stats["win_rate"].tolist() == pytest.approx([1 / 3, 0.5])
+
+    by_player = analytics.win_rate(battles(), by=("tag", "mode"))
+    assert list(zip(by_player["tag"], by_player["mode"], by_player["battles"])) == [
+        ("#A", "gemGrab", 2), ("#A", "soloShowdown", 2), ("#B", "gemGrab", 1),
+    ]
+
+
+def test_trophy_change_stats_and_histogram():
+    stats = analytics.trophy_change_stats(battles())
+    assert stats["battles"].tolist() == [3, 1]
+    assert stats["total"].tolist() == [3.0, 4.0]
+    assert stats["min"].tolist() == [-5.0, 4.0] and stats["max"].tolist() == [8.0, 4.0]
+    assert stats["std"][0] == pytest.approx(numpy.std([8, -5, 0]))
+
+    histogram = analytics.trophy_change_histogram(battles())
+    assert histogram["trophy_change"].tolist() == [-5, 0, 4, 8]
+    assert histogram["battles"].tolist() == [1, 1, 1, 1]
+
+
+def test_sessions_split_by_gap():
+    assert analytics.session_ids(battles(), gap=1800).tolist() == [0, 0, 1, 1, 2]
+    summary = analytics.sessions(battles(), gap=1800)
+    assert summary["tag"].tolist() == ["#A", "#A", "#B"]
+    assert summary["battles"].tolist() == [2, 2, 1]
+    assert summary["wins"].tolist() == [1, 1, 0]
+    assert summary["trophy_change"].tolist() == [3, 4, 0]
+    assert str(summary["end"][1]) == "2024-11-05T12:05:00"
+
+
+def test_brawler_matrix_matches_loop():
+    data = payloads.battlelog("#P1")
+    matrix = analytics.brawler_matrix(battle_players_to_columns(data, "#P1"))
+    won = analytics.wins(battlelog_to_columns(data, "#P1"))
+
+    expected = {}
+    for item, battle_won in zip(data["items"], won):
+        own, opponents = item["battle"]["teams"]
+        for opponent in opponents:
+            key = (own[0]["brawler"]["id"], opponent["brawler"]["id"])
+            battles_, wins_ = expected.get(key, (0, 0))
+            expected[key] = (battles_ + 1, wins_ + int(battle_won))
+
+    rows = {value: index for index, value in enumerate(matrix["brawler_ids"].tolist())}
+    columns = {value: index for index, value in enumerate(matrix["other_ids"].tolist())}
+    assert int(matrix["battles"].sum()) == 25 * 3
+    for (own, other), (count, wins) in expected.items():
+        assert matrix["battles"][rows[own], columns[other]] == count
+        assert matrix["wins"][rows[own], columns[other]] == wins
+
+
+def test_brawler_matrix_skips_missing_brawlers():
+    data = payloads.battlelog("#P1", size=2)
+    # Owner of the first battle and one opponent of the second have no brawler.
+    del data["items"][0]["battle"]["teams"][0][0]["brawler"]
+    del data["items"][1]["battle"]["teams"][1][0]["brawler"]
+    matrix = analytics.brawler_matrix(battle_players_to_columns(data, "#P1"))
+    assert int(matrix["battles"].sum()) == 2
+    assert matrix["brawler_ids"].tolist() == [data["items"][1]["battle"]["teams"][0][0]["brawler"]["id"]]
+    assert (matrix["other_ids"] >= 0).all()
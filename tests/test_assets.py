@@ -0,0 +1,58 @@
+import asyncio
+import os
+
+from aiohttp import web
+
+from bs_api import AssetCache, ClientBS
+from bs_api.errors import ResourceError
+
+ICONS = {"1": b"\x89PNG same", "2": b"\x89PNG same", "3": b"\x89PNG " + bytes(range(256)) * 1024}
+
+
+async def with_cdn(check, directory):
+    requests = []
+
+    async def icon(request: web.Request) -> web.Response:
+        asset_id = request.match_info["id"]
+        requests.append(asset_id)
+        await asyncio.sleep(0.02)
+        if asset_id not in ICONS:
+            return web.Response(status=404)
+        return web.Response(body=ICONS[asset_id], content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/icons/{id}.png", icon)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    template = f"http://127.0.0.1:{runner.addresses[0][1]}/icons/{{id}}.png"
+    try:
+        async with ClientBS("test") as client:
+            assets = AssetCache(client._http, str(directory), template, chunk_size=1024)
+            return await check(assets), requests
+    finally:
+        await runner.cleanup()
+
+
+def test_assets_are_downloaded_once_and_deduplicated(tmp_path):
+    async def check(assets):
+        paths = await assets.download_many([1, 2, 3, 3, 404])
+        again = await asyncio.gather(*(assets.get_path(1) for _ in range(3)))
+        return paths, again, await assets.read(3)
+
+    (paths, again, content), requests = asyncio.run(with_cdn(check, tmp_path))
+    assert sorted(requests) == ["1", "2", "3", "404"]
+    assert paths[1] == paths[2] == again[0] and paths[1].endswith(".png")
+    assert isinstance(paths[404], ResourceError)
+    assert content == ICONS["3"]
+    # Only complete files are left in the cache.
+    files = [name for _, _, names in os.walk(tmp_path) for name in names]
+    assert not [name for name in files if name.endswith((".part", ".download"))]
+
+
+def test_concurrent_calls_share_one_download(tmp_path):
+    async def check(assets):
+        return set(await asyncio.gather(*(assets.get_path(3) for _ in range(5))))
+
+    paths, requests = asyncio.run(with_cdn(check, tmp_path))
+    assert len(paths) == 1 and requests == ["3"]
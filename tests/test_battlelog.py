@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from bs_api import BattlelogSync, ClientBS, MemorySyncStore, SQLiteSyncStore
+from bs_api.adaptive import AdaptiveInterval
+from bs_api.battlelog import BaseSyncStore, SyncState
+
+from benchmarks import mock_api
+
+
+def test_adaptive_interval():
+    intervals = AdaptiveInterval(10, 1000, target=5, smoothing=1.0)
+    assert intervals.next(100, 0, 100) == 200
+    assert intervals.next(100, 10, 100) == 50
+    assert intervals.next(800, 0, 800) == 1000
+    assert intervals.next(100, 1000, 100) == 10
+    smoothed = AdaptiveInterval(10, 1000, target=5, smoothing=0.5)
+    assert smoothed.next(100, 10, 100) == 75
+    with pytest.raises(ValueError):
+        AdaptiveInterval(10, 5)
+
+
+def test_sync_returns_only_new_battles(tmp_path):
+    async def main():
+        async with mock_api.running() as api:
+            async with ClientBS("test", base_url=api.url) as client:
+                store = SQLiteSyncStore(str(tmp_path / "sync.sqlite"))
+                sync = BattlelogSync(client, store, min_interval=60, max_interval=3600, initial_interval=600)
+                first = await sync.sync("#P1")
+                state = await sync.get_state("#P1")
+                assert state.interval == 600 and not state.due
+                second = await sync.sync("#P1")
+                state = await sync.get_state("#P1")
+                await store.close()
+                return first, second, state
+
+    first, second, state = asyncio.run(main())
+    assert len(first) == 25
+    assert second == []
+    # No new battles, so the interval grows.
+    assert state.interval > 600
+    assert state.last_battle_time == max(battle.battle_time for battle in first).strftime("%Y%m%dT%H%M%S.000Z")
+
+
+def test_iter_sync_skips_players_which_are_not_due(tmp_path):
+    path = str(tmp_path / "sync.sqlite")
+
+    async def run_sync():
+        async with mock_api.running() as api:
+            async with ClientBS("test", base_url=api.url) as client:
+                store = SQLiteSyncStore(path)
+                sync = BattlelogSync(client, store, min_interval=60, max_interval=3600, initial_interval=600)
+                results = {tag: battles async for tag, battles in sync.iter_sync(["#P1", "#P2", "#P3"])}
+                wait = await sync.next_poll(["#P1", "#P2", "#P3"])
+                await store.close()
+                return results, wait, api.requests
+
+    first, wait, requests = asyncio.run(run_sync())
+    assert sorted(first) == ["#P1", "#P2", "#P3"] and all(len(battles) == 25 for battles in first.values())
+    assert 590 < wait <= 600 and requests == 3
+    # State survives restart of the worker, nobody is due yet.
+    second, _, requests = asyncio.run(run_sync())
+    assert second == {} and requests == 0
+
+
+def test_due_tags_are_read_in_batches(tmp_path):
+    class CountingStore(SQLiteSyncStore):
+        gets = 0
+
+        async def get(self, tag):
+            CountingStore.gets += 1
+            return await super().get(tag)
+
+    # More tags than one chunk of sqlite parameters, every third player is not due yet.
+    tags = [f"#P{i}" for i in range(1200)]
+
+    async def run():
+        due = {}
+        for store in (MemorySyncStore(), CountingStore(str(tmp_path / "sync.sqlite"))):
+            for i, tag in enumerate(tags):
+                await store.set(SyncState(tag, interval=60, next_poll=2000 if i % 3 == 0 else 500))
+            due[type(store)] = await store.due_tags(tags + ["#NEW"], 1000)
+            assert len(await store.get_many(tags[:5] + ["#NEW"])) == 5
+            await store.close()
+        return due
+
+    due = asyncio.run(run())
+    expected = [tag for i, tag in enumerate(tags) if i % 3] + ["#NEW"]
+    assert due[MemorySyncStore] == due[CountingStore] == expected
+    assert CountingStore.gets == 0
+
+
+def test_incomplete_sync_store_cannot_be_created():
+    class GetOnlyStore(BaseSyncStore):
+        async def get(self, tag):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyStore()
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+
+import pytest
+
+from bs_api import BlockingClientBS
+
+from benchmarks import mock_api, payloads
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = mock_api.start_in_process()
+    try:
+        yield mock_api.base_url(server.port)
+    finally:
+        server.terminate()
+
+
+def test_calls_from_many_threads_share_one_session(base_url):
+    with BlockingClientBS("test", base_url=base_url) as client:
+        with ThreadPoolExecutor(8) as pool:
+            players = list(pool.map(client.get_player, payloads.player_tags(40)))
+        assert len({player.tag for player in players}) > 1
+        session = client.client._http._session
+        assert len(client.run(players[0].get_battlelog())) == 25
+        assert client.client._http._session is session
+    assert client.closed
+    with pytest.raises(RuntimeError):
+        client.get_player("#P1")
+
+
+def test_iterators_are_synchronous(base_url):
+    with BlockingClientBS("test", base_url=base_url) as client:
+        ranks = [player.rank for player in client.iter_ranking_players("FR")]
+        for tag, battles in client.iter_battlelogs(["#P1", "#P2", "#P3"]):
+            assert len(battles) == 25
+            break
+    assert ranks == list(range(1, 201))
+
+
+def test_models_can_be_awaited_from_other_threads(base_url):
+    with BlockingClientBS("test", base_url=base_url) as client:
+        players = [client.get_player(tag) for tag in payloads.player_tags(8)]
+        session = client.client._http._session
+        with ThreadPoolExecutor(4) as pool:
+            # Every thread runs its own event loop, requests still use the session of the background loop.
+            battlelogs = list(pool.map(lambda player: asyncio.run(player.get_battlelog()), players))
+        assert all(len(battles) == 25 for battles in battlelogs)
+        assert client.client._http._session is session and not session.closed
+        club = asyncio.run(players[0].get_club())
+        assert club.tag.startswith("#")
+        assert client.client._http._session is session
+    with pytest.raises(RuntimeError):
+        asyncio.run(players[0].get_battlelog())
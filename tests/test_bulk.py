@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from bs_api.bulk import gather_bounded, iter_bounded
+from bs_api.errors import ResourceError
+
+
+async def slow(item: int) -> int:
+    await asyncio.sleep(0.01 * (item % 3))
+    if item == 4:
+        raise ResourceError()
+    return item * 2
+
+
+def test_gather_bounded_keeps_order_and_errors():
+    results = asyncio.run(gather_bounded(slow, range(8), concurrency=3))
+    assert results[:4] == [0, 2, 4, 6]
+    assert isinstance(results[4], ResourceError)
+    assert results[5:] == [10, 12, 14]
+
+
+def test_iter_bounded_limits_concurrency():
+    running = peak = 0
+
+    async def track(item: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return item
+
+    async def main():
+        return [item async for _, item, _ in iter_bounded(track, range(20), concurrency=4)]
+
+    assert sorted(asyncio.run(main())) == list(range(20))
+    assert peak == 4
+
+
+def test_iter_bounded_early_break_does_not_hang():
+    async def forever(item: int) -> int:
+        if item < 4:
+            return item
+        await asyncio.sleep(3600)
+
+    async def main():
+        generator = iter_bounded(forever, range(10), concurrency=2)
+        async for _ in generator:
+            # Queue gets full while both workers wait inside `func`.
+            await asyncio.sleep(0.05)
+            break
+        await asyncio.wait_for(generator.aclose(), 3)
+
+    asyncio.run(main())
+
+
+def test_iter_bounded_full_queue_and_consumer_error_do_not_hang():
+    async def fast(item: int) -> int:
+        return item
+
+    async def main():
+        async for _ in iter_bounded(fast, range(100), concurrency=2):
+            # Let workers fill the queue before consumer fails.
+            await asyncio.sleep(0.01)
+            raise KeyError("consumer")
+
+    with pytest.raises(KeyError):
+        asyncio.run(asyncio.wait_for(main(), 3))
+
+
+def test_iter_bounded_propagates_unexpected_error():
+    async def broken(item: int) -> int:
+        raise ValueError(item)
+
+    async def main():
+        return [result async for result in iter_bounded(broken, range(3))]
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from bs_api import ClientBS, Club, Player
+from bs_api.errors import NetworkError, ResourceError
+
+from benchmarks import mock_api, payloads
+
+
+class FlakyAPI(mock_api.MockAPI):
+    # Connection of players with "RESET" in tag is dropped, "GONE" players do not exist.
+    async def handle(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        if "RESET" in path:
+            request.transport.close()
+        if "GONE" in path:
+            return web.json_response({"reason": "notFound"}, status=404)
+        return await super().handle(request)
+
+
+async def with_flaky_client(check):
+    async with mock_api.running(api=FlakyAPI()) as api:
+        async with ClientBS("test", base_url=api.url, max_retries=1) as client:
+            client._http.backoff_base = 0.001
+            return await check(client)
+
+
+def test_get_players_returns_errors_per_tag():
+    tags = ["#P1", "#RESET", "#GONE", "#P2"]
+    results = asyncio.run(with_flaky_client(lambda client: client.get_players(tags, concurrency=2)))
+    assert isinstance(results[0], Player) and isinstance(results[3], Player)
+    assert isinstance(results[1], NetworkError)
+    assert isinstance(results[2], ResourceError)
+
+
+def test_iter_battlelogs_yields_errors_per_tag():
+    async def check(client):
+        return {tag: result async for tag, result in client.iter_battlelogs(["#P1", "#RESET", "#P3"])}
+
+    results = asyncio.run(with_flaky_client(check))
+    assert len(results["#P1"]) == 25 and len(results["#P3"]) == 25
+    assert isinstance(results["#RESET"], NetworkError)
+
+
+def test_iter_ranking_players_yields_all_items():
+    async def check(client):
+        return [player async for player in client.iter_ranking_players("FR", page_size=50)]
+
+    players = asyncio.run(with_flaky_client(check))
+    assert len(players) == 200
+
+
+def test_sweep_rankings_merges_countries_and_skips_missing():
+    async def check(client):
+        players = await client.sweep_rankings(["fr", "GONE", "us"])
+        clubs = await client.sweep_rankings(["de"], kind="clubs")
+        with pytest.raises(NetworkError):
+            await client.sweep_rankings(["fr", "RESET"])
+        with pytest.raises(ValueError):
+            await client.sweep_rankings(["fr"], kind="clubs", brawlerid=16000000)
+        return players, clubs
+
+    players, clubs = asyncio.run(with_flaky_client(check))
+    assert len(players) == 400
+    assert players["ranked_country_code"][0] == "FR" and players["ranked_country_code"][-1] == "US"
+    assert players["rank"][:2] == [1, 2]
+    assert "member_count" in clubs and set(clubs["ranked_country_code"]) == {"DE"}
+
+
+def test_fetch_member_players_returns_players_and_errors():
+    async def check(client):
+        data = payloads.club("#C1", size=6)
+        data["members"][2]["tag"] = "#GONE2"
+        club = Club(data, client._http)
+        return [member.tag for member in club.members], await club.fetch_member_players(
+            concurrency=3, include_battlelog=True, lazy=True
+        )
+
+    tags, players = asyncio.run(with_flaky_client(check))
+    assert list(players) == tags
+    assert isinstance(players["#GONE2"], ResourceError)
+    ok = [player for player in players.values() if isinstance(player, Player)]
+    assert len(ok) == 5 and all(len(player.battlelog) == 25 for player in ok)
@@ -0,0 +1,97 @@
+import asyncio
+import zlib
+
+import pytest
+from aiohttp import web
+
+from bs_api import ClientBS, MemoryCache, SQLiteCache
+from bs_api.cache import BaseCache, CacheEntry
+
+from benchmarks import mock_api
+
+
+class ETagAPI(mock_api.MockAPI):
+    # Every response has `ETag`, matching `If-None-Match` gets 304 without body.
+    def __init__(self) -> None:
+        super().__init__()
+        self.not_modified = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        response = await super().handle(request)
+        etag = f'"{zlib.crc32(response.body):x}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+
+async def with_api(check, api=None):
+    async with mock_api.running(api=api) as api:
+        return await check(api, api.url)
+
+
+def test_fresh_response_is_served_from_cache():
+    async def check(api, url):
+        async with ClientBS("test", base_url=url, cache=True) as client:
+            first = await client.get_player("#P1")
+            second = await client.get_player("#P1")
+            assert first.name == second.name
+            return api.requests
+
+    assert asyncio.run(with_api(check)) == 1
+
+
+def test_stale_response_is_revalidated_by_etag():
+    async def check(api, url):
+        cache = MemoryCache(ttls={}, default_ttl=0.0)
+        async with ClientBS("test", base_url=url, cache=cache) as client:
+            first = await client.get_player("#P1")
+            second = await client.get_player("#P1")
+            assert first.name == second.name
+        return api.requests, api.not_modified
+
+    assert asyncio.run(with_api(check, ETagAPI())) == (2, 1)
+
+
+def test_sqlite_cache_survives_client_and_is_closed(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+
+    async def check(api, url):
+        cache = SQLiteCache(path)
+        async with ClientBS("test", base_url=url, cache=cache) as client:
+            await client.get_club("#C1")
+        assert cache._db is None
+        # Closed cache opens again on the next request, and the response is still stored on disk.
+        async with ClientBS("test", base_url=url, cache=cache) as client:
+            await client.get_club("#C1")
+        return api.requests
+
+    assert asyncio.run(with_api(check)) == 1
+
+
+def test_ttl_for_respects_cache_control():
+    cache = MemoryCache()
+    assert cache.ttl_for("https://x/v1/players/%23P", {"Cache-Control": "max-age=12"}) == 12
+    assert cache.ttl_for("https://x/v1/players/%23P", {"Cache-Control": "no-store"}) is None
+    assert cache.ttl_for("https://x/v1/brawlers", {}) == 86400.0
+    assert cache.ttl_for("https://x/v1/unknown", {}) == 0.0
+
+
+def test_memory_cache_evicts_least_recently_used():
+    async def main():
+        cache = MemoryCache(maxsize=2)
+        for key in "abc":
+            await cache.set(key, CacheEntry(key.encode(), expires=1e12))
+        return await cache.get("a"), len(cache)
+
+    assert asyncio.run(main()) == (None, 2)
+
+
+def test_incomplete_cache_backend_cannot_be_created():
+    class GetOnlyCache(BaseCache):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyCache()
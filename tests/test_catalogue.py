@@ -0,0 +1,56 @@
+import asyncio
+
+from bs_api import BrawlerCatalogue, ClientBS
+from bs_api.catalogue import normalise_name
+
+from benchmarks import mock_api, payloads
+
+CATALOGUE = BrawlerCatalogue(payloads.brawlers())
+
+
+def test_normalise_name():
+    assert normalise_name("MR. P") == "mrp"
+    assert normalise_name("8-Bit") == "8bit"
+    assert normalise_name("El Primo") == "elprimo"
+
+
+def test_lookups_by_id_and_name():
+    leon = CATALOGUE.get_by_name("leon")
+    assert leon is not None and CATALOGUE.get(leon.id) is leon
+    assert leon.id in CATALOGUE
+    assert CATALOGUE.get(1) is None
+    assert CATALOGUE.get_by_name("nobody") is None
+    assert len(CATALOGUE) == len(payloads.BRAWLER_NAMES)
+
+
+def test_find_uses_prefix_substring_and_fuzzy_match():
+    assert CATALOGUE.find("ShElLy").name == "SHELLY"
+    assert CATALOGUE.find("mr p").name == "MR. P"
+    assert CATALOGUE.find("cordel").name == "CORDELIUS"
+    assert CATALOGUE.find("lawrie").name == "LARRY & LAWRIE"
+    assert CATALOGUE.find("spruot").name == "SPROUT"
+    assert CATALOGUE.find("zzzzzz") is None
+    assert [brawler.name for brawler in CATALOGUE.search_prefix("s")][:3] == ["SAM", "SANDY", "SHELLY"]
+
+
+def test_star_powers_and_gadgets_know_owner():
+    colt = CATALOGUE.get_by_name("colt")
+    star_power, gadget = colt.star_powers[0], colt.gadgets[1]
+    assert CATALOGUE.get_star_power(star_power["id"]) == star_power
+    assert CATALOGUE.get_gadget(gadget["id"]) == gadget
+    assert CATALOGUE.get_owner(star_power["id"]) is colt
+    assert CATALOGUE.get_owner(gadget["id"]) is colt
+
+
+def test_catalogue_is_loaded_once():
+    async def main():
+        async with mock_api.running() as api:
+            async with ClientBS("test", base_url=api.url, catalogue_ttl=3600) as client:
+                brawlerid = await client.get_brawlerid_by_name("LEON")
+                names = [await client.get_name_by_brawlerid(brawlerid) for _ in range(5)]
+                assert await client.get_brawlerid_by_name("unknown-brawler-name") is None
+                loaded = api.requests
+                await client.get_brawler_catalogue(refresh=True)
+            return names, loaded, api.requests
+
+    assert asyncio.run(main()) == (["Leon"] * 5, 1, 2)
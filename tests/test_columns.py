@@ -0,0 +1,69 @@
+import pytest
+
+from bs_api.columns import (
+    Columns, battle_players_to_columns, battlelog_to_columns, brawlers_to_columns, members_to_columns,
+    ranking_to_columns,
+)
+
+from benchmarks import payloads
+
+
+def test_ranking_columns_match_items():
+    data = payloads.ranking_players()
+    table = ranking_to_columns(data, "fr")
+    assert len(table) == len(data["items"])
+    assert table["tag"][3] == data["items"][3]["tag"]
+    assert table["icon_id"][3] == data["items"][3]["icon"]["id"]
+    assert table["club_name"][3] == data["items"][3]["club"]["name"]
+    assert set(table["ranked_country_code"]) == {"FR"}
+    assert "member_count" in ranking_to_columns(payloads.ranking_clubs(), kind="clubs")
+
+
+def test_brawlers_members_and_battlelog_columns():
+    player = payloads.player("#P1")
+    brawlers = brawlers_to_columns(player)
+    assert len(brawlers) == len(player["brawlers"]) and set(brawlers["tag"]) == {"#P1"}
+    members = members_to_columns(payloads.club("#C1", size=4))
+    assert members["club_tag"] == ["#C1"] * 4 and members["role"][0] == "president"
+
+    battlelog = payloads.battlelog("#P1")
+    battles = battlelog_to_columns(battlelog, "#P1")
+    assert len(battles) == 25
+    assert battles["trophy_change"][0] == battlelog["items"][0]["battle"]["trophyChange"]
+    # 3vs3 battles have no rank, missing keys become None.
+    assert set(battles["rank"]) == {None}
+
+
+def test_battle_players_have_sides():
+    table = battle_players_to_columns(payloads.battlelog("#P1", size=2), "#P1")
+    assert len(table) == 12
+    assert table["side"][:6] == ["self", "teammate", "teammate", "opponent", "opponent", "opponent"]
+
+
+def test_battle_players_accept_any_form_of_tag():
+    data = payloads.battlelog("#P1", size=2)
+    expected = battle_players_to_columns(data, "#P1")
+    for tag in ("P1", "p1", "%23P1", "#p1"):
+        table = battle_players_to_columns(data, tag)
+        assert table["side"] == expected["side"] and set(table["tag"]) == {"#P1"}
+
+
+def test_concat_and_rows():
+    first = Columns({"a": [1, 2], "b": ["x", "y"]})
+    table = Columns.concat([first, Columns({"a": [3], "b": ["z"]})])
+    assert table["a"] == [1, 2, 3] and first["a"] == [1, 2]
+    assert list(table.rows())[2] == {"a": 3, "b": "z"}
+    with pytest.raises(ValueError):
+        Columns({"a": [1], "b": []})
+    with pytest.raises(ValueError):
+        Columns.concat([first, Columns({"c": [1]})])
+
+
+def test_to_numpy_types():
+    numpy = pytest.importorskip("numpy")
+    arrays = battlelog_to_columns(payloads.battlelog("#P1"), "#P1").to_numpy()
+    assert arrays["trophy_change"].dtype == numpy.int64
+    assert arrays["battle_time"].dtype == numpy.dtype("datetime64[s]")
+    assert str(arrays["battle_time"][0]) == "2024-11-05T23:59:00"
+    assert numpy.isnan(arrays["rank"]).all()
+    assert arrays["mode"].dtype.kind == "U"
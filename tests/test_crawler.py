@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from bs_api import ClientBS, Player
+from bs_api.classes import Battle
+from bs_api.crawler import Crawler
+
+from benchmarks import mock_api, payloads
+
+
+async def crawl(kind: str, parse: str, processes: int, count: int = 40) -> list:
+    async with mock_api.running() as api:
+        async with ClientBS("test", base_url=api.url) as client:
+            async with Crawler(client, kind, parse, processes=processes, concurrency=8, batch_size=8) as crawler:
+                results = [item async for item in crawler.crawl(payloads.player_tags(count))]
+                if parse == "models":
+                    # Follow-up requests of crawled models go through the client.
+                    battle = next(battle for _, battles in results for battle in battles if battle.star_player)
+                    assert isinstance(await battle.get_star_player(), Player)
+                return results
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_crawler_models_get_client(processes):
+    results = asyncio.run(crawl("battlelog", "models", processes))
+    assert len(results) == 40
+    assert {tag for tag, _ in results} == set(payloads.player_tags(40))
+    for _, battles in results:
+        assert battles and all(isinstance(battle, Battle) for battle in battles)
+
+
+def test_crawler_columns_in_event_loop():
+    results = asyncio.run(crawl("player", "columns", 0, 10))
+    assert all(len(columns) > 0 for _, columns in results)
+
+
+def test_crawler_validates_arguments():
+    client = ClientBS("test")
+    with pytest.raises(ValueError):
+        Crawler(client, "ranking")
+    with pytest.raises(ValueError):
+        Crawler(client, "player", "pickle")
@@ -0,0 +1,59 @@
+import copy
+import json
+
+from bs_api.classes import Club, Player
+from bs_api.diff import payload_digest
+
+from benchmarks import payloads
+
+
+def snapshot(model, data):
+    body = json.dumps(data).encode()
+    return model(json.loads(body), None, payload_digest(body))
+
+
+def test_equal_payloads_have_empty_diff():
+    data = payloads.player("#P1")
+    assert payload_digest(b"{}") == payload_digest(b"{}") != payload_digest(b"[]")
+    assert not snapshot(Player, data).diff(snapshot(Player, data))
+    # Without digests fields are still compared.
+    assert not Player(data, None).diff(Player(copy.deepcopy(data), None))
+
+
+def test_player_diff():
+    old = payloads.player("#P1")
+    new = copy.deepcopy(old)
+    new["trophies"] += 25
+    new["club"] = {}
+    new["icon"] = {"id": 1}
+    new["brawlers"][0]["trophies"] += 8
+    new["brawlers"][1]["gadgets"].append({"id": 1, "name": "NEW GADGET"})
+    unlocked = new["brawlers"].pop()
+    old["brawlers"].pop()
+    new["brawlers"].append(unlocked)
+
+    diff = snapshot(Player, old).diff(snapshot(Player, new))
+    assert diff.changed == {
+        "trophies": (old["trophies"], new["trophies"]),
+        "club_tag": (old["club"]["tag"], None),
+        "icon_id": (old["icon"]["id"], 1),
+    }
+    first, second = old["brawlers"][0]["id"], old["brawlers"][1]["id"]
+    assert diff.brawlers[first] == {"trophies": (old["brawlers"][0]["trophies"], new["brawlers"][0]["trophies"])}
+    assert diff.brawlers[second]["gadgets"][1][0] == 1
+    assert [brawler.id for brawler in diff.new_brawlers] == [unlocked["id"]]
+
+
+def test_club_diff():
+    old = payloads.club("#C1", size=5)
+    new = copy.deepcopy(old)
+    new["description"] = "Changed"
+    left = new["members"].pop(0)
+    new["members"][0]["role"] = "vicePresident"
+    new["members"].append(payloads.member(10))
+
+    diff = snapshot(Club, old).diff(snapshot(Club, new))
+    assert diff.changed == {"description": (old["description"], "Changed")}
+    assert [member.tag for member in diff.left] == [left["tag"]]
+    assert [member.tag for member in diff.joined] == [payloads.member(10)["tag"]]
+    assert diff.members == {new["members"][0]["tag"]: {"role": ("member", "vicePresident")}}
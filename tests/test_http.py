@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+from bs_api import ClientBS
+from bs_api.http import default_json_loads
+
+from benchmarks import mock_api
+
+
+async def in_server(check):
+    async with mock_api.running() as api:
+        return await check(api)
+
+
+def test_session_is_shared_by_requests():
+    async def check(api):
+        async with ClientBS("test", base_url=api.url) as client:
+            await client.get_player("#P1")
+            session = client._http._session
+            player = await client.get_player("#P2")
+            await player.get_battlelog()
+            assert client._http._session is session
+        assert client._http.closed
+
+    asyncio.run(in_server(check))
+
+
+def test_client_is_reused_across_event_loops():
+    server = mock_api.start_in_process()
+    try:
+        client = ClientBS("test", base_url=mock_api.base_url(server.port), requests_per_second=100)
+
+        async def get_name() -> str:
+            return (await client.get_player("#P1")).name
+
+        first = asyncio.run(get_name())
+        assert asyncio.run(get_name()) == first
+
+        async def finish() -> None:
+            await client.get_player("#P2")
+            await client.close()
+
+        asyncio.run(finish())
+        assert client._http.closed
+    finally:
+        server.terminate()
+
+
+def test_identical_concurrent_requests_are_coalesced():
+    async def load(coalesce: bool) -> int:
+        async with mock_api.running(latency=0.05) as api:
+            async with ClientBS("test", base_url=api.url, coalesce=coalesce) as client:
+                players = await asyncio.gather(*(client.get_player("#P1") for _ in range(10)))
+                # Every caller gets own model, so one caller can not change data of another.
+                assert len({id(player) for player in players}) == 10
+                assert not client._http._inflight
+            return api.requests
+
+    assert asyncio.run(load(True)) == 1
+    assert asyncio.run(load(False)) == 10
+
+
+def test_cancelled_caller_does_not_cancel_shared_request():
+    async def check(api):
+        async with ClientBS("test", base_url=api.url) as client:
+            first = asyncio.ensure_future(client.get_player("#P1"))
+            second = asyncio.ensure_future(client.get_player("#P1"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            assert (await second).tag
+            assert first.cancelled()
+        return api.requests
+
+    async def main():
+        async with mock_api.running(latency=0.05) as api:
+            return await check(api)
+
+    assert asyncio.run(main()) == 1
+
+
+def test_raw_responses_and_custom_json_decoder():
+    decoded = []
+
+    def json_loads(body: bytes):
+        decoded.append(len(body))
+        return json.loads(body)
+
+    async def check(api):
+        async with ClientBS("test", base_url=api.url, json_loads=json_loads) as client:
+            body = await client.get_player("#P1", raw="bytes")
+            assert decoded == []
+            data = await client.get_player("#P1", raw=True)
+            assert data == json.loads(body)
+            player = await client.get_player("#P1")
+            assert player.name == data["name"]
+            clubs = await client.get_ranking_clubs(raw=True)
+            assert isinstance(clubs["items"], list)
+
+    asyncio.run(in_server(check))
+    assert len(decoded) == 3
+    assert default_json_loads()(b'{"a": [1]}') == {"a": [1]}
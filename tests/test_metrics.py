@@ -0,0 +1,50 @@
+import asyncio
+
+from bs_api import ClientBS, MetricsCollector
+from bs_api.metrics import Histogram, endpoint_of
+
+from benchmarks import mock_api
+
+
+def test_endpoint_of_replaces_tags_and_ids():
+    assert endpoint_of("https://api.brawlstars.com/v1/players/%23ABC/battlelog") == "/v1/players/{tag}/battlelog"
+    assert endpoint_of("http://host/v1/rankings/FR/brawlers/16000000?limit=5") == "/v1/rankings/{country}/brawlers/{id}"
+    assert endpoint_of("https://cdn/profile-icons/regular/28000001.png") == "/profile-icons/regular/{id}.png"
+
+
+def test_histogram_quantiles():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert histogram.snapshot()["buckets"] == {0.1: 2, 1.0: 3, float("inf"): 4}
+
+
+def test_collector_counts_requests_of_client():
+    metrics = MetricsCollector()
+
+    async def main():
+        async with mock_api.running() as api:
+            async with ClientBS("test", base_url=api.url, hooks=[metrics], cache=True) as client:
+                await client.get_player("#P1")
+                await client.get_player("#P1")
+                await client.get_player_battlelog("#P1")
+                await asyncio.gather(client.get_club("#C1"), client.get_club("#C2"))
+                assert metrics.pool()["limit"] > 0
+                return metrics.snapshot()
+
+    snapshot = asyncio.run(main())
+    assert snapshot["statuses"] == {
+        ("/v1/players/{tag}", "200"): 1, ("/v1/players/{tag}/battlelog", "200"): 1, ("/v1/clubs/{tag}", "200"): 2,
+    }
+    assert snapshot["latency"]["/v1/clubs/{tag}"]["count"] == 2
+    assert snapshot["cache_hits"] == {("/v1/players/{tag}", False): 1}
+    assert snapshot["in_flight"] == 0
+    assert snapshot["bytes_received"]["/v1/players/{tag}"] > 1000
+
+    text = metrics.to_prometheus()
+    assert 'bs_api_responses_total{endpoint="/v1/clubs/{tag}",status="200"} 2' in text
+    assert 'bs_api_request_duration_seconds_count{endpoint="/v1/players/{tag}"} 1' in text
+    assert "bs_api_requests_in_flight 0" in text
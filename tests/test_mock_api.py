@@ -0,0 +1,59 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from benchmarks import client as client_benchmark
+from benchmarks import mock_api
+
+
+async def get(session, url, token="a"):
+    async with session.get(url, headers={"Authorization": f"Bearer {token}"}) as response:
+        return response.status, response.headers.get("Retry-After"), await response.read()
+
+
+def test_routes_serve_payloads():
+    async def main():
+        async with mock_api.running() as api, aiohttp.ClientSession() as session:
+            paths = ["players/%23P1", "players/%23P1/battlelog", "clubs/%23C1", "clubs/%23C1/members",
+                     "rankings/FR/players", "rankings/FR/clubs", "brawlers", "unknown"]
+            return [(await get(session, api.url + path))[0] for path in paths]
+
+    assert asyncio.run(main()) == [200] * 7 + [404]
+
+
+def test_throttling_per_token():
+    async def main():
+        async with mock_api.running(rate=5) as api, aiohttp.ClientSession() as session:
+            first = [await get(session, api.url + "brawlers") for _ in range(7)]
+            other = await get(session, api.url + "brawlers", token="b")
+            await asyncio.sleep(float(first[-1][1]))
+            later = await get(session, api.url + "brawlers")
+            return first, other, later, api.throttled
+
+    first, other, later, throttled = asyncio.run(main())
+    assert [status for status, _, _ in first] == [200] * 5 + [429] * 2
+    assert 0 < float(first[-1][1]) <= 0.2
+    assert other[0] == 200 and later[0] == 200
+    assert throttled == 2
+
+
+def test_client_benchmark_load():
+    async def main():
+        async with mock_api.running() as api:
+            port = int(api.url.split(":")[2].split("/")[0])
+            return await client_benchmark.load(port, client_benchmark.CASES["get_player"], 50, 5, tokens=2)
+
+    result = asyncio.run(main())
+    assert result["errors"] == 0 and result["retries"] == 0
+    assert result["rps"] > 0 and result["p99_ms"] >= result["p50_ms"] > 0
+
+
+def test_start_in_process_reports_port_and_failed_start():
+    server = mock_api.start_in_process()
+    try:
+        assert server.port > 0
+        with pytest.raises(RuntimeError):
+            mock_api.start_in_process(server.port, timeout=5)
+    finally:
+        server.terminate()
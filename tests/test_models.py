@@ -0,0 +1,112 @@
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+
+from bs_api.classes import (
+    Battle, Battler, Brawler, Club, Member, Player, RankedClub, RankedPlayer, _camel_case, _snake_case, parse_battle_time,
+)
+
+from benchmarks import payloads
+
+
+def test_player_fields_and_nested_models():
+    data = payloads.player("#P1")
+    player = Player(data, None)
+    assert player.tag == "#P1"
+    assert player.trophies == data["trophies"]
+    assert len(player.brawlers) == len(data["brawlers"])
+    assert player.brawlers[0].name == data["brawlers"][0]["name"]
+    assert not hasattr(player, "__dict__")
+
+
+def test_member_keeps_icon():
+    data = payloads.member(3)
+    member = Member(data, None)
+    assert member.icon_id == data["icon"]["id"]
+    assert member.icon == data["icon"]
+    with pytest.raises(AttributeError):
+        member.icon = {"id": 1}
+
+
+def test_field_mapping_is_resolved_per_class():
+    assert _camel_case("highest_trophies") == "highestTrophies"
+    assert _snake_case("highestTrophies") == "highest_trophies"
+    assert Player._keys["highestTrophies"] == "highest_trophies"
+    assert Player._keys["3vs3Victories"] == "victories3vs3"
+    assert Member._keys is not Player._keys and "3vs3Victories" not in Member._keys
+
+    data = payloads.player("#P1")
+    player = Player(data, None)
+    assert player.highest_trophies == data["highestTrophies"]
+    assert player.exp_points == data["expPoints"]
+    assert player.victories3vs3 == data["3vs3Victories"]
+    assert "3vs3_victories" not in player.extras
+
+
+def test_undeclared_keys_go_to_extras():
+    data = dict(payloads.member(1), newStat=5)
+    member = Member(data, None)
+    assert member.new_stat == 5
+    assert member.extras == {"new_stat": 5}
+    with pytest.raises(AttributeError):
+        member.missing
+
+
+def test_ranked_player_and_club():
+    ranked = RankedPlayer(payloads.ranking_players()["items"][0], None)
+    assert ranked.rank == 1 and ranked.icon_id
+    club = Club(payloads.club("#C1"), None)
+    assert len(club.members) == 30 and all(isinstance(member, Member) for member in club.members)
+
+
+def test_lazy_battle_matches_eager():
+    item = payloads.battlelog("#P1")["items"][0]
+    eager = Battle(item, None)
+    lazy = Battle(item, None, lazy=True)
+    assert lazy.battle_time == eager.battle_time
+    assert lazy.mode == eager.mode
+    assert lazy.extras == eager.extras
+
+
+def test_parse_battle_time():
+    assert parse_battle_time("20241105T101500.000Z") == datetime(2024, 11, 5, 10, 15, tzinfo=timezone.utc)
+    assert parse_battle_time("20240229T235959.000Z") == datetime(2024, 2, 29, 23, 59, 59, tzinfo=timezone.utc)
+
+
+def test_lazy_battle_decodes_only_accessed_fields():
+    item = payloads.battlelog("#P1")["items"][0]
+    battle = Battle(item, None, lazy=True)
+    assert battle.result == item["battle"]["result"]
+    assert battle._data is item
+    assert battle.battle_time == parse_battle_time(item["battleTime"])
+    assert battle.hydrate()._data is None
+    assert battle.trophy_change == item["battle"].get("trophyChange", 0)
+
+    eager = Battle(item, None).get_battlers()
+    lazy = Battle(item, None, lazy=True).get_battlers(lazy=True)
+    assert isinstance(lazy[0][0], Battler)
+    assert [[battler.brawler_name for battler in team] for team in lazy] == \
+        [[battler.brawler_name for battler in team] for team in eager]
+    assert lazy[0][0].extras == eager[0][0].extras
+
+
+def test_models_are_picklable():
+    player = pickle.loads(pickle.dumps(Player(payloads.player("#P1"), None)))
+    assert player.tag == "#P1" and player.brawlers
+
+
+def test_models_are_compact_and_share_http():
+    http = object()
+    item = payloads.battlelog("#P1")["items"][0]
+    models = [
+        Player(payloads.player("#P1"), http), Club(payloads.club("#C1", size=2), http), Member(payloads.member(1), http),
+        Battle(item, http), Battler(item["battle"]["teams"][0][0], http),
+        Brawler(payloads.player("#P1")["brawlers"][0]), RankedPlayer(payloads.ranking_players()["items"][0], http),
+        RankedClub(payloads.ranking_clubs()["items"][0], http),
+    ]
+    for model in models:
+        assert not hasattr(model, "__dict__"), type(model).__name__
+        assert not hasattr(model, "token") and not hasattr(model, "APIToken")
+    assert all(model._http is http for model in models if not isinstance(model, Brawler))
+    assert all(member._http is http for member in models[1].members)
@@ -0,0 +1,69 @@
+import asyncio
+import json
+
+from aiohttp import web
+
+from bs_api import ClientBS
+
+from benchmarks import mock_api
+
+
+class PagedAPI(mock_api.MockAPI):
+    # Rankings and club members honour `limit` and `after`, cursor is the index of the next item.
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        route = self._route(path)
+        if route not in ("ranking_players", "ranking_clubs", "members"):
+            return await super().handle(request)
+        items = json.loads(self.bodies[route][0])["items"]
+        start = int(request.query.get("after", 0))
+        limit = int(request.query.get("limit", len(items)))
+        self.pages.append((route, start, limit))
+        cursors = {"after": str(start + limit)} if start + limit < len(items) else {}
+        return web.json_response({"items": items[start:start + limit], "paging": {"cursors": cursors}})
+
+
+async def with_client(check):
+    async with mock_api.running(api=PagedAPI()) as api:
+        async with ClientBS("test", base_url=api.url) as client:
+            return await check(client), api.pages
+
+
+def test_pages_are_followed_in_order():
+    async def check(client):
+        players = [player async for player in client.iter_ranking_players("global", page_size=70)]
+        clubs = [club async for club in client.iter_ranking_clubs("FR", page_size=60, prefetch=False)]
+        return [player.rank for player in players], len(clubs), clubs[0].ranked_country_code
+
+    (ranks, clubs, country), pages = asyncio.run(with_client(check))
+    assert ranks == list(range(1, 201))
+    assert clubs == 200 and country == "FR"
+    assert [start for route, start, limit in pages if route == "ranking_players"] == [0, 70, 140]
+    assert {limit for route, start, limit in pages} == {70, 60}
+
+
+def test_club_members_are_paginated():
+    async def check(client):
+        return [member.tag async for member in client.iter_club_members("#C1", page_size=8)]
+
+    tags, pages = asyncio.run(with_client(check))
+    assert len(tags) == len(set(tags)) == 30
+    assert len(pages) == 4
+
+
+def test_early_break_cancels_prefetched_page():
+    async def check(client):
+        async for player in client.iter_ranking_players(page_size=10):
+            if player.rank == 15:
+                break
+        # Let cancelled prefetch finish, nothing else must be requested.
+        await asyncio.sleep(0.05)
+        return player.rank
+
+    rank, pages = asyncio.run(with_client(check))
+    assert rank == 15
+    assert len(pages) <= 3
@@ -0,0 +1,155 @@
+import asyncio
+from collections import Counter
+from time import monotonic
+
+import pytest
+from aiohttp import web
+
+from bs_api import ClientBS, MetricsCollector
+from bs_api.ratelimit import TokenBucket, TokenPool, backoff_delay, parse_retry_after
+
+from benchmarks import mock_api, payloads
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_delay_is_bounded():
+    delays = [backoff_delay(attempt, 0.5, 4.0) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_token_bucket_limits_rate():
+    async def main():
+        bucket = TokenBucket(100, burst=5)
+        started = monotonic()
+        for _ in range(15):
+            await bucket.acquire()
+        return monotonic() - started
+
+    assert asyncio.run(main()) >= 0.09
+
+
+def test_sustained_rate_at_ceiling_is_not_throttled():
+    # Server allows 100 requests per second, client is limited just below it.
+    async def main():
+        async with mock_api.running(rate=100) as api:
+            async with ClientBS("test", base_url=api.url, requests_per_second=95, burst=10) as client:
+                tags = iter(payloads.player_tags(200))
+
+                async def worker() -> None:
+                    for tag in tags:
+                        await client.get_player(tag)
+
+                started = monotonic()
+                await asyncio.gather(*(worker() for _ in range(20)))
+                elapsed = monotonic() - started
+            return (200 - 10) / elapsed, api.throttled
+
+    achieved, throttled = asyncio.run(main())
+    assert throttled == 0
+    assert 95 * 0.9 <= achieved <= 95 * 1.05
+
+
+def test_throttled_request_is_retried():
+    # Server allows burst of 5 requests, next ones are throttled until the bucket refills.
+    async def main():
+        async with mock_api.running(rate=5) as api:
+            async with ClientBS("test", base_url=api.url, max_retries=5) as client:
+                client._http.backoff_base = 0.01
+                players = [await client.get_player(tag) for tag in payloads.player_tags(8)]
+            return len(players), api.throttled
+
+    count, throttled = asyncio.run(main())
+    assert count == 8 and throttled > 0
+
+
+def test_token_pool_skips_throttled_token():
+    async def main():
+        pool = TokenPool(["a", "b", "c"])
+        pool.throttled(pool.states[0], 60)
+        return [(await pool.acquire()).token for _ in range(4)]
+
+    assert asyncio.run(main()) == ["b", "c", "b", "c"]
+
+
+def test_token_pool_waits_for_cooldown():
+    async def main():
+        pool = TokenPool("a")
+        pool.throttled(pool.states[0], 0.05)
+        assert pool.wait() > 0
+        started = monotonic()
+        await pool.acquire()
+        return monotonic() - started
+
+    assert asyncio.run(main()) >= 0.05
+
+
+def test_least_throttled_prefers_idle_token():
+    async def main():
+        pool = TokenPool(["a", "b", "c"], strategy="least_throttled")
+        pool.throttled(pool.states[0], 0.0)
+        first = await pool.acquire()
+        first.pending += 1
+        return first.token, (await pool.acquire()).token
+
+    assert asyncio.run(main()) == ("b", "c")
+    with pytest.raises(ValueError):
+        TokenPool("a", strategy="random")
+    with pytest.raises(ValueError):
+        TokenPool([])
+
+
+class CountingAPI(mock_api.MockAPI):
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_token: Counter = Counter()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.by_token[request.headers["Authorization"]] += 1
+        return await super().handle(request)
+
+
+def test_requests_are_spread_across_tokens():
+    async def main():
+        async with mock_api.running(api=CountingAPI()) as api:
+            async with ClientBS(["a", "b", "c"], base_url=api.url) as client:
+                await asyncio.gather(*(client.get_player(tag) for tag in payloads.player_tags(30)))
+            return api.by_token
+
+    assert asyncio.run(main()) == {"Bearer a": 10, "Bearer b": 10, "Bearer c": 10}
+
+
+async def throttled_load(tokens: int, requests: int) -> tuple:
+    # Server allows 50 requests per second of a token and client has no rate limit.
+    # One request of 50 concurrent workers can be throttled several times in a row, so retries have headroom.
+    metrics = MetricsCollector()
+    async with mock_api.running(rate=50) as api:
+        names = [f"token-{index}" for index in range(tokens)]
+        async with ClientBS(names, base_url=api.url, limit=50, max_retries=8, hooks=[metrics]) as client:
+            tags = iter(payloads.player_tags(requests))
+            errors = []
+
+            async def worker() -> None:
+                for tag in tags:
+                    try:
+                        await client.get_player(tag)
+                    except Exception as error:
+                        errors.append(error)
+
+            await asyncio.gather(*(worker() for _ in range(50)))
+            return errors, api.throttled, sum(metrics.retries.values())
+
+
+@pytest.mark.parametrize("tokens, requests", [(1, 150), (2, 300)])
+def test_throttling_is_absorbed_by_retries(tokens, requests):
+    errors, throttled, retries = asyncio.run(throttled_load(tokens, requests))
+    assert errors == []
+    assert throttled > 0
+    assert retries == throttled
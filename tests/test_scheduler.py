@@ -0,0 +1,89 @@
+import asyncio
+
+from aiohttp import ClientConnectionError
+
+from bs_api import ClientBS, PollingScheduler
+from bs_api.errors import ResourceError
+
+from benchmarks import mock_api, payloads
+
+
+class FakeClient:
+    # Trophies of "#UP" grow on every poll, "#DOWN" has no connection and "#GONE" does not exist.
+    _http = None
+
+    def __init__(self) -> None:
+        self.polls = {}
+        self.order = []
+
+    async def get_player(self, tag: str, raw: bool = False) -> dict:
+        self.polls[tag] = self.polls.get(tag, 0) + 1
+        self.order.append(tag)
+        if tag == "#DOWN":
+            raise ClientConnectionError("connection reset")
+        if tag == "#GONE":
+            raise ResourceError()
+        data = payloads.player(tag)
+        data["trophies"] += self.polls[tag]
+        return data
+
+
+async def run_for(scheduler: PollingScheduler, seconds: float) -> None:
+    task = asyncio.ensure_future(scheduler.run())
+    await asyncio.sleep(seconds)
+    scheduler.stop()
+    await asyncio.wait_for(task, 3)
+
+
+def test_failed_entries_do_not_stop_scheduler():
+    client = FakeClient()
+    updates = []
+
+    def callback(update) -> None:
+        updates.append(update)
+        if update.tag == "#UP" and update.error is None:
+            raise KeyError("callback is broken")
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: None)
+        scheduler = PollingScheduler(client, callback, min_interval=0.01, max_interval=1.0, report_errors=True)
+        scheduler.watch_many(["#UP", "#DOWN", "#GONE"], interval=0.02)
+        await run_for(scheduler, 0.5)
+        return scheduler
+
+    scheduler = asyncio.run(main())
+    up, down, gone = (scheduler.entries[("player", tag)] for tag in ("#UP", "#DOWN", "#GONE"))
+    assert client.polls["#UP"] > 3 and up.changes == up.polls - 1
+    assert any(update.tag == "#UP" and update.changed["trophies"] for update in updates)
+    # Connection errors are retried with backoff, missing player waits for the maximum interval.
+    assert 1 < client.polls["#DOWN"] < client.polls["#UP"] and down.failures == down.errors
+    assert client.polls["#GONE"] == 1
+    assert {type(update.error) for update in updates if update.error} == {ClientConnectionError, ResourceError}
+
+
+def test_unchanged_entries_are_polled_less_often():
+    async def main():
+        async with mock_api.running() as api:
+            async with ClientBS("test", base_url=api.url) as client:
+                queue = asyncio.Queue()
+                scheduler = PollingScheduler(client, queue=queue, min_interval=0.01, max_interval=10.0)
+                entry = scheduler.watch("#P1", interval=0.02)
+                await run_for(scheduler, 0.4)
+                return entry, queue
+
+    entry, queue = asyncio.run(main())
+    assert entry.polls >= 2 and entry.changes == 0 and queue.empty()
+    assert entry.current_interval > 0.02
+
+
+def test_higher_priority_is_polled_first():
+    client = FakeClient()
+
+    async def main():
+        scheduler = PollingScheduler(client, concurrency=1, min_interval=10, max_interval=60)
+        scheduler.watch_many(["#LOW1", "#LOW2"], priority=0)
+        scheduler.watch("#HIGH", priority=10)
+        await run_for(scheduler, 0.1)
+
+    asyncio.run(main())
+    assert client.order == ["#HIGH", "#LOW1", "#LOW2"]
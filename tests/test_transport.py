@@ -0,0 +1,97 @@
+import asyncio
+import sqlite3
+import zlib
+
+import pytest
+
+from bs_api import ClientBS, ReplayError
+from bs_api.transport import BaseTransport, RecordingTransport, ReplayTransport, archive_key
+
+from benchmarks import mock_api
+
+
+def test_archive_key_drops_host():
+    assert archive_key("https://api.brawlstars.com/v1/players/%23ABC") == "/v1/players/%23ABC"
+    assert archive_key("http://127.0.0.1:1/v1/rankings/global/players?limit=5") == "/v1/rankings/global/players?limit=5"
+
+
+def test_record_then_replay_without_network(tmp_path):
+    path = str(tmp_path / "records.sqlite")
+
+    async def record():
+        async with mock_api.running() as api:
+            async with ClientBS("secret-token", base_url=api.url, transport=RecordingTransport(path)) as client:
+                return (await client.get_player("#P1")).name, (await client.get_club("#C1")).tag
+
+    async def replay():
+        # Nothing listens on this url, every response comes from the archive.
+        transport = ReplayTransport(path)
+        async with ClientBS("other", base_url="http://127.0.0.1:9/v1/", transport=transport) as client:
+            return (await client.get_player("#P1")).name, (await client.get_club("#C1")).tag
+
+    assert asyncio.run(record()) == asyncio.run(replay())
+    with sqlite3.connect(path) as db:
+        dump = b"".join(bytes(str(row), "utf-8") for row in db.execute("SELECT key, headers FROM responses"))
+    assert b"secret-token" not in dump
+
+
+def test_replay_serves_versions_in_order(tmp_path):
+    path = str(tmp_path / "records.sqlite")
+    recorder = RecordingTransport(path)
+    for body in (b'{"n": 1}', b'{"n": 2}'):
+        recorder._archive._execute(
+            "INSERT INTO responses (key, status, headers, body, recorded) VALUES (?, ?, ?, ?, ?)",
+            ("/v1/x", 200, "{}", zlib.compress(body), 0.0),
+        )
+    recorder._archive.close()
+
+    async def main(sequential):
+        transport = ReplayTransport(path, sequential=sequential)
+        bodies = [(await transport.send("http://host/v1/x", {}))[2] for _ in range(3)]
+        transport.rewind()
+        bodies.append((await transport.send("http://host/v1/x", {}))[2])
+        await transport.close()
+        return bodies
+
+    assert asyncio.run(main(True)) == [b'{"n": 1}', b'{"n": 2}', b'{"n": 2}', b'{"n": 1}']
+    assert asyncio.run(main(False)) == [b'{"n": 2}'] * 4
+
+
+def test_replay_miss(tmp_path):
+    path = str(tmp_path / "records.sqlite")
+
+    async def main(strict):
+        transport = ReplayTransport(path, strict=strict)
+        try:
+            return await transport.send("http://host/v1/players/%23MISS", {})
+        finally:
+            await transport.close()
+
+    with pytest.raises(ReplayError):
+        asyncio.run(main(True))
+    assert asyncio.run(main(False))[0] == 404
+
+
+def test_archive_reopens_after_client_close(tmp_path):
+    path = str(tmp_path / "records.sqlite")
+
+    async def main():
+        async with mock_api.running() as api:
+            client = ClientBS("test", base_url=api.url, transport=RecordingTransport(path))
+            await client.get_player("#P1")
+            await client.close()
+            # Session is created again after close, the archive must be usable too.
+            await client.get_player("#P2")
+            await client.close()
+
+    asyncio.run(main())
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT COUNT(*) FROM responses").fetchone()[0] == 2
+
+
+def test_transport_without_send_cannot_be_created():
+    class SilentTransport(BaseTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        SilentTransport()